@@ -60,6 +60,40 @@ def run_contract(
     return results
 
 
+async def run_contract_async(pd: str, es: str, ep: str, *, save_io: str = None) -> dict:
+    """
+    Run a complete prompt contract on the async execution engine.
+
+    Generate calls run concurrently under the EP's ``execution.concurrency``
+    limits; the results have the same shape as run_contract().
+
+    Args:
+        pd: Path to Prompt Definition (PD) file
+        es: Path to Expectation Suite (ES) file
+        ep: Path to Evaluation Profile (EP) file
+        save_io: Directory to save IO artifacts (optional)
+
+    Returns:
+        Dictionary containing execution results
+
+    Raises:
+        SpecValidationError: If any artifact fails validation
+
+    Example:
+        >>> results = asyncio.run(
+        ...     run_contract_async("examples/pd.json", "examples/es.json", "examples/ep.json")
+        ... )
+    """
+    # Load artifacts
+    pd_dict = load_pd(pd)
+    es_dict = load_es(es)
+    ep_dict = load_ep(ep)
+
+    # Run contract
+    runner = ContractRunner(pd_dict, es_dict, ep_dict, save_io_dir=save_io)
+    return await runner.arun()
+
+
 def validate_artifact(kind: str, path: str) -> None:
     """
     Validate a PCSL artifact against its JSON Schema.
@@ -91,6 +125,7 @@ def validate_artifact(kind: str, path: str) -> None:
 __all__ = [
     "__version__",
     "run_contract",
+    "run_contract_async",
     "validate_artifact",
     "PromptContractsError",
     "SpecValidationError",
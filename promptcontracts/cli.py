@@ -2,11 +2,15 @@
 
 import argparse
 import sys
+from pathlib import Path
 
 from . import __version__
 from .core.loader import load_ep, load_es, load_pd
 from .core.reporters import CLIReporter, JSONReporter, JUnitReporter
 from .core.runner import ContractRunner
+from .core.sharding import ShardSpec, merge_shard_results
+from .core.workqueue import DEFAULT_LEASE_SECONDS, run_worker
+from .utils import jsoncodec
 
 
 def validate_command(args):
@@ -48,6 +52,39 @@ def validate_command(args):
         return 2
 
 
+def report_results(results: dict, report_type: str | None, output_path: str | None) -> int:
+    """
+    Report results and return the exit code.
+
+    Exit codes:
+        0: All fixtures passed or were repaired successfully
+        1: One or more fixtures failed or marked NONENFORCEABLE
+        3: Unknown report type
+    """
+    report_type = report_type or "cli"
+
+    if report_type == "cli":
+        reporter = CLIReporter()
+    elif report_type == "json":
+        reporter = JSONReporter()
+    elif report_type == "junit":
+        reporter = JUnitReporter()
+    else:
+        print(f"Unknown report type: {report_type}")
+        return 3
+
+    reporter.report(results, output_path)
+
+    # Determine exit code based on results
+    # 0 = all PASS or REPAIRED
+    # 1 = any FAIL or NONENFORCEABLE
+    any_failed = any(
+        t.get("summary", {}).get("status") == "RED" for t in results.get("targets", [])
+    )
+
+    return 1 if any_failed else 0
+
+
 def run_command(args):
     """
     Run a complete contract.
@@ -90,6 +127,21 @@ def run_command(args):
                 # Use seed for generation if not doing sampling
                 params["seed"] = args.seed
 
+        # Response cache: --no-cache wins over --cache-dir and the EP setting
+        if args.no_cache or args.cache_dir:
+            cache_cfg = ep.setdefault("execution", {}).setdefault("cache", {})
+            if args.no_cache:
+                cache_cfg["enabled"] = False
+            else:
+                cache_cfg["enabled"] = True
+                cache_cfg["dir"] = args.cache_dir
+
+        if args.reuse_dir and args.verbose:
+            print(f"✓ Reusing unchanged results from: {args.reuse_dir}")
+
+        if args.resume and args.verbose:
+            print(f"✓ Resuming from checkpoint: {args.resume}")
+
         if args.save_io and args.verbose:
             print(f"✓ Artifacts will be saved to: {args.save_io}")
             print()
@@ -104,42 +156,94 @@ def run_command(args):
 
     try:
         # Run contract
-        runner = ContractRunner(pd, es, ep, save_io_dir=args.save_io)
+        runner = ContractRunner(
+            pd,
+            es,
+            ep,
+            save_io_dir=args.save_io,
+            checkpoint_dir=args.resume or args.checkpoint,
+            resume=bool(args.resume),
+            reuse_dir=args.reuse_dir,
+            shard=args.shard,
+            work_queue=args.queue,
+        )
         results = runner.run()
 
-        # Report results
-        report_type = args.report or "cli"
-        output_path = args.out
+        return report_results(results, args.report, args.out)
 
-        if report_type == "cli":
-            reporter = CLIReporter()
-        elif report_type == "json":
-            reporter = JSONReporter()
-        elif report_type == "junit":
-            reporter = JUnitReporter()
-        else:
-            print(f"Unknown report type: {report_type}")
-            return 3
+    except Exception as e:
+        print(f"✗ Runtime error: {e}")
+        if args.verbose:
+            import traceback
 
-        reporter.report(results, output_path)
+            traceback.print_exc()
+        return 3
 
-        # Determine exit code based on results
-        # 0 = all PASS or REPAIRED
-        # 1 = any FAIL or NONENFORCEABLE
-        any_failed = any(
-            t.get("summary", {}).get("status") == "RED" for t in results.get("targets", [])
-        )
 
-        return 1 if any_failed else 0
+def merge_command(args):
+    """
+    Merge the JSON reports of a sharded run into one report.
+
+    Exit codes:
+        0: All fixtures passed or were repaired successfully
+        1: One or more fixtures failed or marked NONENFORCEABLE
+        2: ES or shard report could not be loaded or shards are incomplete
+    """
+    try:
+        es = load_es(args.es)
+        shard_results = [jsoncodec.loads(Path(path).read_text()) for path in args.shards]
+        results = merge_shard_results(shard_results, es)
+
+        if args.verbose:
+            print(f"✓ Merged {len(shard_results)} shard reports")
 
     except Exception as e:
-        print(f"✗ Runtime error: {e}")
+        print(f"✗ Merge error: {e}")
+        if args.verbose:
+            import traceback
+
+            traceback.print_exc()
+        return 2
+
+    return report_results(results, args.report, args.out)
+
+
+def worker_command(args):
+    """
+    Process work units of a coordinator started with ``run --queue``.
+
+    Exit codes:
+        0: The run was closed (or the idle timeout / unit limit was reached)
+        3: Runtime error
+    """
+    try:
+        processed = run_worker(
+            args.queue,
+            worker_id=args.worker_id,
+            lease_seconds=args.lease_seconds,
+            idle_timeout=args.idle_timeout,
+            max_units=args.max_units,
+        )
+    except Exception as e:
+        print(f"✗ Worker error: {e}")
         if args.verbose:
             import traceback
 
             traceback.print_exc()
         return 3
 
+    if args.verbose:
+        print(f"✓ Processed {processed} work units")
+    return 0
+
+
+def _shard_spec(value: str) -> ShardSpec:
+    """Argparse type for --shard."""
+    try:
+        return ShardSpec.parse(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
 
 def main():
     """Main CLI entry point."""
@@ -169,6 +273,11 @@ Examples:
     --save-io artifacts/ \\
     --report json --out results.json
 
+  # Run shard 3 of 16, then merge all shard reports
+  prompt-contracts run ... --shard 3/16 --report json --out shard-3.json
+  prompt-contracts merge --es examples/support_ticket/es.json shard-*.json \\
+    --report junit --out junit.xml
+
 Exit codes:
   0  All fixtures passed or repaired successfully
   1  One or more fixtures failed or marked NONENFORCEABLE
@@ -243,14 +352,103 @@ Exit codes:
         help="Baseline mode for comparison (v0.3.0 experimental)",
     )
 
+    run_parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        help="Enable the response cache in this directory (overrides EP.execution.cache.dir)",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Disable the response cache even if enabled in the EP",
+    )
+
+    run_parser.add_argument(
+        "--incremental",
+        dest="reuse_dir",
+        help="Reuse unchanged fixture results from a previous --save-io directory; "
+        "check-only edits are re-validated offline without provider calls",
+    )
+
+    checkpoint_group = run_parser.add_mutually_exclusive_group()
+    checkpoint_group.add_argument(
+        "--checkpoint",
+        help="Journal completed samples to this directory so the run can be resumed",
+    )
+    checkpoint_group.add_argument(
+        "--resume",
+        help="Resume an interrupted run from its checkpoint directory",
+    )
+
+    run_parser.add_argument(
+        "--shard",
+        type=_shard_spec,
+        help="Run only shard i of N (e.g. 3/16); fixtures are assigned by a stable hash of their id",
+    )
+
+    run_parser.add_argument(
+        "--queue",
+        help="Coordinate via this SQLite work queue; samples are executed by "
+        "'prompt-contracts worker' processes",
+    )
+
     run_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
+    # Merge command
+    merge_parser = subparsers.add_parser(
+        "merge", help="Merge JSON reports of a sharded run (--shard i/N) into one report"
+    )
+    merge_parser.add_argument(
+        "--es", required=True, help="Path to Expectation Suite (re-evaluates latency budgets)"
+    )
+    merge_parser.add_argument("shards", nargs="+", help="JSON reports of all shards")
+    merge_parser.add_argument(
+        "--report",
+        choices=["cli", "json", "junit"],
+        default="cli",
+        help="Report format (default: cli)",
+    )
+    merge_parser.add_argument("--out", help="Output path for report file (optional)")
+    merge_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+
+    # Worker command
+    worker_parser = subparsers.add_parser(
+        "worker", help="Execute work units from a coordinator's queue (run --queue)"
+    )
+    worker_parser.add_argument("--queue", required=True, help="Path of the SQLite work queue")
+    worker_parser.add_argument(
+        "--worker-id", dest="worker_id", help="Worker identifier (default: host:pid:thread)"
+    )
+    worker_parser.add_argument(
+        "--lease-seconds",
+        dest="lease_seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help="Seconds a leased unit is reserved before another worker may take it "
+        f"(default: {DEFAULT_LEASE_SECONDS:g})",
+    )
+    worker_parser.add_argument(
+        "--idle-timeout",
+        dest="idle_timeout",
+        type=float,
+        help="Exit after this many seconds without work (default: wait until the run closes)",
+    )
+    worker_parser.add_argument(
+        "--max-units", dest="max_units", type=int, help="Exit after processing this many units"
+    )
+    worker_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+
     args = parser.parse_args()
 
     if args.command == "validate":
         sys.exit(validate_command(args))
     elif args.command == "run":
         sys.exit(run_command(args))
+    elif args.command == "merge":
+        sys.exit(merge_command(args))
+    elif args.command == "worker":
+        sys.exit(worker_command(args))
     else:
         parser.print_help()
         sys.exit(0)
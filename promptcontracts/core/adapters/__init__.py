@@ -1,7 +1,25 @@
 """LLM adapters for different providers."""
 
-from .base import AbstractAdapter, Capability
+from .base import (
+    AbstractAdapter,
+    Capability,
+    StreamTiming,
+    capture_call_info,
+    consume_stream,
+    record_call_info,
+)
+from .cached import CachingAdapter
 from .ollama_adapter import OllamaAdapter
 from .openai_adapter import OpenAIAdapter
 
-__all__ = ["AbstractAdapter", "Capability", "OpenAIAdapter", "OllamaAdapter"]
+__all__ = [
+    "AbstractAdapter",
+    "Capability",
+    "CachingAdapter",
+    "OpenAIAdapter",
+    "OllamaAdapter",
+    "StreamTiming",
+    "capture_call_info",
+    "consume_stream",
+    "record_call_info",
+]
@@ -1,8 +1,118 @@
 """Base adapter interface."""
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import Any, NamedTuple
 
+_call_info: ContextVar[dict[str, Any] | None] = ContextVar("call_info", default=None)
+
+
+@contextmanager
+def capture_call_info() -> Iterator[dict[str, Any]]:
+    """
+    Collect per-call details reported by adapters via record_call_info().
+
+    Must wrap the generate call in the same thread that executes it.
+
+    Yields:
+        Dict populated with the fields recorded during the block
+    """
+    info: dict[str, Any] = {}
+    token = _call_info.set(info)
+    try:
+        yield info
+    finally:
+        _call_info.reset(token)
+
+
+def record_call_info(**fields: Any):
+    """Record details about the current generate call (no-op outside capture_call_info)."""
+    info = _call_info.get()
+    if info is not None:
+        info.update(fields)
+
+
+@dataclass
+class StreamTiming:
+    """Timing of a streamed generation, measured with perf_counter_ns."""
+
+    ttft_ms: float
+    decode_ms: float
+    total_ms: float
+    chunks: int
+    output_tokens: int
+    mean_itl_ms: float | None
+    max_itl_ms: float | None
+    tokens_per_s: float | None
+    aborted: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the timing as a dict (stored under the sample's call info)."""
+        return asdict(self)
+
+
+def consume_stream(
+    chunks: Iterable[str], should_stop: Callable[[str], bool] | None = None
+) -> tuple[str, StreamTiming]:
+    """
+    Drain a generate_stream() iterator, timing every chunk.
+
+    TTFT runs from the first request for a chunk (when streaming adapters send
+    the HTTP request) to the first non-empty chunk; inter-token latency is the
+    gap between consecutive chunks and decode time spans first to last chunk.
+    Throughput uses the ``output_tokens`` the adapter recorded via
+    record_call_info(), falling back to the chunk count.
+
+    When should_stop returns True for a chunk, the iterator is closed, which
+    lets streaming adapters drop the connection and stop the generation.
+
+    Args:
+        chunks: Text chunks yielded by an adapter
+        should_stop: Optional callback deciding after each chunk whether to abort
+
+    Returns:
+        (text received, timing)
+    """
+    parts: list[str] = []
+    arrivals: list[int] = []
+    aborted = False
+    start = time.perf_counter_ns()
+    iterator = iter(chunks)
+    for chunk in iterator:
+        if not chunk:
+            continue
+        arrivals.append(time.perf_counter_ns())
+        parts.append(chunk)
+        if should_stop is not None and should_stop(chunk):
+            aborted = True
+            if hasattr(iterator, "close"):
+                iterator.close()
+            break
+    end = time.perf_counter_ns()
+
+    info = _call_info.get() or {}
+    output_tokens = info.get("output_tokens") or len(arrivals)
+    gaps = [(b - a) / 1e6 for a, b in zip(arrivals, arrivals[1:], strict=False)]
+    decode_ms = (arrivals[-1] - arrivals[0]) / 1e6 if arrivals else 0.0
+    tokens_per_s = (output_tokens - 1) / (decode_ms / 1000) if decode_ms > 0 else None
+
+    timing = StreamTiming(
+        ttft_ms=(arrivals[0] - start) / 1e6 if arrivals else (end - start) / 1e6,
+        decode_ms=decode_ms,
+        total_ms=(end - start) / 1e6,
+        chunks=len(arrivals),
+        output_tokens=output_tokens,
+        mean_itl_ms=sum(gaps) / len(gaps) if gaps else None,
+        max_itl_ms=max(gaps) if gaps else None,
+        tokens_per_s=tokens_per_s,
+        aborted=aborted,
+    )
+    return "".join(parts), timing
+
 
 class Capability(NamedTuple):
     """Adapter capabilities."""
@@ -14,6 +124,8 @@ class Capability(NamedTuple):
     supports_temperature: bool = True
     supports_top_p: bool = True
     max_tokens: int | None = None
+    streaming: bool = False
+    multi_completion: bool = False
 
 
 class AbstractAdapter(ABC):
@@ -52,3 +164,44 @@ class AbstractAdapter(ABC):
             (response_text, latency_ms)
         """
         pass
+
+    def generate_stream(self, prompt: str, schema: dict[str, Any] | None = None) -> Iterator[str]:
+        """
+        Generate a response as a stream of text chunks.
+
+        Adapters with ``Capability.streaming`` yield chunks as the provider
+        sends them and record ``output_tokens`` via record_call_info(). The
+        default falls back to generate() and yields the whole response at once,
+        so TTFT equals the full latency.
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema for schema-guided generation (if supported)
+
+        Yields:
+            Response text chunks
+        """
+        response_text, _ = self.generate(prompt, schema=schema)
+        yield response_text
+
+    def generate_many(
+        self, prompt: str, n: int, schema: dict[str, Any] | None = None
+    ) -> list[tuple[str, float]]:
+        """
+        Generate n independent responses to one prompt.
+
+        Adapters with ``Capability.multi_completion`` request all n choices in
+        one provider call, paying for the prompt and the round trip once; each
+        choice is attributed the latency of that call, as it would be if the
+        samples had been requested in parallel. The default makes n generate()
+        calls.
+
+        Args:
+            prompt: The prompt text
+            n: Number of responses
+            schema: Optional JSON schema for schema-guided generation (if supported)
+
+        Returns:
+            List of n (response_text, latency_ms)
+        """
+        return [self.generate(prompt, schema=schema) for _ in range(n)]
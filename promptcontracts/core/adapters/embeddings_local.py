@@ -23,6 +23,18 @@ class EmbeddingAdapter:
         """
         raise NotImplementedError
 
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for multiple texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of embedding vectors
+        """
+        return [self.embed(text) for text in texts]
+
 
 class LocalEmbeddingAdapter(EmbeddingAdapter):
     """
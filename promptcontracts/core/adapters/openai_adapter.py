@@ -1,19 +1,43 @@
 """OpenAI adapter."""
 
 import time
+from collections.abc import Iterator
 from typing import Any
 
 from openai import OpenAI
 
-from .base import AbstractAdapter, Capability
+from ..ratelimit import parse_rate_limit_headers
+from ..transport import HTTPTransport, openai_base_url, shared_transport
+from .base import AbstractAdapter, Capability, record_call_info
 
 
 class OpenAIAdapter(AbstractAdapter):
     """Adapter for OpenAI models."""
 
-    def __init__(self, model: str, params: dict = None):
+    def __init__(
+        self,
+        model: str,
+        params: dict = None,
+        transport: HTTPTransport | None = None,
+        base_url: str | None = None,
+    ):
+        """
+        Initialize OpenAI adapter.
+
+        Args:
+            model: Model identifier
+            params: Generation parameters
+            transport: Pooled HTTP transport (default: the shared one)
+            base_url: API base URL of an OpenAI-compatible server (default:
+                ``OPENAI_BASE_URL`` or the public API)
+        """
         super().__init__(model, params)
-        self.client = OpenAI()
+        base_url = base_url or openai_base_url()
+        self.base_url = base_url
+        # SDK client over the pooled keep-alive connections shared by all targets
+        self.client = OpenAI(
+            base_url=base_url, http_client=(transport or shared_transport()).client(base_url)
+        )
 
     def capabilities(self) -> Capability:
         """Return OpenAI capabilities."""
@@ -25,21 +49,12 @@ class OpenAIAdapter(AbstractAdapter):
             supports_temperature=True,
             supports_top_p=True,
             max_tokens=None,
+            streaming=True,
+            multi_completion=True,
         )
 
-    def generate(self, prompt: str, schema: dict[str, Any] | None = None) -> tuple[str, int]:
-        """
-        Generate response using OpenAI API.
-
-        Args:
-            prompt: The prompt text
-            schema: Optional JSON schema for structured output
-
-        Returns:
-            (response_text, latency_ms)
-        """
-        start_time = time.time()
-
+    def _request_params(self, prompt: str, schema: dict[str, Any] | None) -> dict[str, Any]:
+        """Build chat completion request params."""
         # Default parameters
         temperature = self.params.get("temperature", 0)
         max_tokens = self.params.get("max_tokens", None)
@@ -70,11 +85,100 @@ class OpenAIAdapter(AbstractAdapter):
                 "json_schema": {"name": "response", "strict": True, "schema": schema},
             }
 
-        response = self.client.chat.completions.create(**request_params)
+        return request_params
+
+    @staticmethod
+    def _record_usage(headers, usage):
+        """Report rate limit headers, usage and cached prompt tokens."""
+        call_info = {"rate_limit": parse_rate_limit_headers(headers)}
+        if usage is not None:
+            call_info["usage_tokens"] = usage.total_tokens
+            call_info["output_tokens"] = usage.completion_tokens
+            call_info["prompt_tokens"] = usage.prompt_tokens
+            # Prompt tokens served from the provider's prefix cache
+            details = getattr(usage, "prompt_tokens_details", None)
+            if details is not None and details.cached_tokens is not None:
+                call_info["cached_tokens"] = details.cached_tokens
+        record_call_info(**call_info)
+
+    def generate(self, prompt: str, schema: dict[str, Any] | None = None) -> tuple[str, int]:
+        """
+        Generate response using OpenAI API.
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema for structured output
+
+        Returns:
+            (response_text, latency_ms)
+        """
+        start_time = time.time()
+
+        raw_response = self.client.chat.completions.with_raw_response.create(
+            **self._request_params(prompt, schema)
+        )
+        response = raw_response.parse()
 
         end_time = time.time()
         latency_ms = int((end_time - start_time) * 1000)
 
         response_text = response.choices[0].message.content
+        self._record_usage(raw_response.headers, response.usage)
 
         return response_text, latency_ms
+
+    def generate_many(
+        self, prompt: str, n: int, schema: dict[str, Any] | None = None
+    ) -> list[tuple[str, float]]:
+        """
+        Generate n responses with one chat completion request (``n`` choices).
+
+        Args:
+            prompt: The prompt text
+            n: Number of choices
+            schema: Optional JSON schema for structured output
+
+        Returns:
+            List of n (response_text, latency_ms), all with the request latency
+        """
+        request_params = self._request_params(prompt, schema)
+        if n > 1:
+            request_params["n"] = n
+
+        start_time = time.time()
+        raw_response = self.client.chat.completions.with_raw_response.create(**request_params)
+        response = raw_response.parse()
+        latency_ms = int((time.time() - start_time) * 1000)
+
+        choices = sorted(response.choices, key=lambda choice: choice.index)
+        if len(choices) != n:
+            raise ValueError(f"Requested {n} choices, server returned {len(choices)}")
+        self._record_usage(raw_response.headers, response.usage)
+
+        return [(choice.message.content, latency_ms) for choice in choices]
+
+    def generate_stream(self, prompt: str, schema: dict[str, Any] | None = None) -> Iterator[str]:
+        """
+        Stream a response from the OpenAI API (server-sent events).
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema for structured output
+
+        Yields:
+            Response text chunks
+        """
+        request_params = self._request_params(prompt, schema)
+        request_params["stream"] = True
+        request_params["stream_options"] = {"include_usage": True}
+
+        raw_response = self.client.chat.completions.with_raw_response.create(**request_params)
+        usage = None
+        with raw_response.parse() as stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                # With include_usage, the final chunk carries usage and no choices
+                if chunk.usage is not None:
+                    usage = chunk.usage
+        self._record_usage(raw_response.headers, usage)
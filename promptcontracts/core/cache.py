@@ -0,0 +1,262 @@
+"""
+Persistent content-addressed cache for LLM responses.
+
+Responses are stored in a local SQLite file keyed by the prompt hash, provider,
+model, generation params, schema and sample index. Entries expire after a TTL
+and the least recently used entries are evicted once the cache exceeds its
+size budget.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..utils.hashing import compute_prompt_hash
+
+DEFAULT_CACHE_DIR = ".promptcontracts_cache"
+DEFAULT_MAX_SIZE_MB = 256.0
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Configuration for the response cache (EP ``execution.cache``)."""
+
+    enabled: bool = False
+    dir: str = DEFAULT_CACHE_DIR
+    max_size_mb: float = DEFAULT_MAX_SIZE_MB
+    ttl_seconds: float | None = None
+
+    @classmethod
+    def from_dict(cls, cfg: dict[str, Any] | None) -> "CacheConfig":
+        """Build config from an EP ``execution.cache`` block."""
+        cfg = cfg or {}
+        return cls(
+            enabled=cfg.get("enabled", False),
+            dir=cfg.get("dir", DEFAULT_CACHE_DIR),
+            max_size_mb=cfg.get("max_size_mb", DEFAULT_MAX_SIZE_MB),
+            ttl_seconds=cfg.get("ttl_seconds"),
+        )
+
+
+@dataclass
+class CachedResponse:
+    """A cached generation with the latency recorded when it was produced."""
+
+    response_text: str
+    latency_ms: float
+    created_at: float
+
+
+def make_cache_key(
+    prompt: str,
+    provider: str,
+    model: str,
+    params: dict[str, Any] | None,
+    schema: dict[str, Any] | None,
+    sample_index: int,
+    base_url: str | None = None,
+) -> str:
+    """
+    Compute the content address of a generate call.
+
+    Args:
+        prompt: Final prompt text
+        provider: Provider/adapter identifier
+        model: Model identifier
+        params: Generation parameters
+        schema: Optional JSON schema for schema-guided generation
+        sample_index: Sample index within an N-sampling run
+        base_url: Resolved API base URL of the server (same model, different
+            servers must not share entries)
+
+    Returns:
+        Hex-encoded SHA-256 key
+    """
+    material = json.dumps(
+        {
+            "prompt_hash": compute_prompt_hash(prompt),
+            "provider": provider,
+            "model": model,
+            "params": params or {},
+            "schema": schema,
+            "sample_index": sample_index,
+            "base_url": base_url.rstrip("/") if base_url else None,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with TTL and LRU-by-size eviction.
+
+    Safe to share between threads of one process.
+    """
+
+    FILENAME = "responses.sqlite"
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+        ttl_seconds: float | None = None,
+    ):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_size_mb: Size budget for stored responses in megabytes
+            ttl_seconds: Entry lifetime in seconds (None = never expire)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / self.FILENAME), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " response TEXT NOT NULL,"
+            " latency_ms REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._total_bytes = self._stored_bytes()
+
+    @classmethod
+    def from_config(cls, config: CacheConfig) -> "ResponseCache":
+        """Open a cache from a CacheConfig."""
+        return cls(config.dir, config.max_size_mb, config.ttl_seconds)
+
+    def _stored_bytes(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Look up a cached response, refreshing its LRU position.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            CachedResponse or None on miss/expiry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, latency_ms, size, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, latency_ms, size, created_at = row
+            if self._expired(created_at, now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return CachedResponse(response, latency_ms, created_at)
+
+    def put(self, key: str, response_text: str, latency_ms: float):
+        """
+        Store a response and evict least recently used entries over budget.
+
+        Args:
+            key: Cache key from make_cache_key()
+            response_text: Generated text
+            latency_ms: Latency of the original generation
+        """
+        size = len(response_text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, response_text, latency_ms, size, now, now),
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self.writes += 1
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop expired entries, then LRU entries until under budget (lock held)."""
+        if self.ttl_seconds is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self.expirations += max(cursor.rowcount, 0)
+
+        # Another process may share the directory; resync before evicting
+        self._total_bytes = self._stored_bytes()
+
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at ASC LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size_bytes": self._total_bytes,
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,171 @@
+"""
+Checkpoint journal for resumable contract runs.
+
+The journal is an append-only JSON Lines file. The first line is a header
+with hashes of the PD, ES and EP; every further line records one completed
+(target, fixture, sample) unit with its raw and normalized output and check
+results. Resuming replays recorded units instead of calling the provider.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..utils import jsoncodec
+from ..utils.errors import ExecutionError
+from ..utils.hashing import compute_prompt_hash
+from .sampling import SampleResult
+
+JOURNAL_FILENAME = "journal.jsonl"
+JOURNAL_VERSION = 1
+
+# EP execution keys that change how a run executes but not what it produces
+NON_SEMANTIC_EXECUTION_KEYS = ("concurrency", "cache", "transport")
+
+UnitKey = tuple[int, str, str, int]
+
+
+def _canonical_hash(data: Any) -> str:
+    return compute_prompt_hash(json.dumps(data, sort_keys=True, separators=(",", ":")))
+
+
+def artifact_hashes(pd: dict[str, Any], es: dict[str, Any], ep: dict[str, Any]) -> dict[str, str]:
+    """
+    Hash the artefacts that determine a run's results.
+
+    Execution settings that only affect scheduling (concurrency, cache,
+    transport) are excluded from the EP hash so a run may be resumed with
+    different limits.
+
+    Returns:
+        Dict with 'pd', 'es' and 'ep' hex digests
+    """
+    ep_semantic = dict(ep)
+    execution = {
+        k: v for k, v in ep.get("execution", {}).items() if k not in NON_SEMANTIC_EXECUTION_KEYS
+    }
+    ep_semantic["execution"] = execution
+
+    return {
+        "pd": _canonical_hash(pd),
+        "es": _canonical_hash(es),
+        "ep": _canonical_hash(ep_semantic),
+    }
+
+
+class CheckpointJournal:
+    """Append-only journal of completed sample units."""
+
+    def __init__(self, directory: str, hashes: dict[str, str], resume: bool = False):
+        """
+        Open a journal.
+
+        Args:
+            directory: Checkpoint directory (created if missing)
+            hashes: Artefact hashes from artifact_hashes()
+            resume: Load and extend an existing journal instead of starting fresh
+
+        Raises:
+            ExecutionError: If resuming and the journal is missing or was written
+                for different PD/ES/EP artefacts
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / JOURNAL_FILENAME
+        self.hashes = hashes
+        self._units: dict[UnitKey, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if resume:
+            self._load()
+            self._file = self.path.open("a", encoding="utf-8")
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("w", encoding="utf-8")
+            self._append({"type": "header", "version": JOURNAL_VERSION, "hashes": hashes})
+
+    def _load(self):
+        if not self.path.exists():
+            raise ExecutionError(f"No checkpoint journal found at {self.path}")
+
+        data = self.path.read_bytes()
+        # A partial trailing line from an interrupted write is not a record
+        complete = data.rfind(b"\n") + 1
+        lines = data[:complete].decode("utf-8").splitlines()
+        header = jsoncodec.loads(lines[0]) if lines else {}
+        if header.get("type") != "header":
+            raise ExecutionError(f"Checkpoint journal {self.path} has no header")
+
+        mismatched = [k for k, v in self.hashes.items() if header.get("hashes", {}).get(k) != v]
+        if mismatched:
+            raise ExecutionError(
+                f"Checkpoint journal {self.path} was written for different artefacts "
+                f"(changed: {', '.join(mismatched)}); start a fresh run instead of resuming"
+            )
+
+        if complete < len(data):
+            # Drop it, so records appended on resume start on a line of their own
+            with self.path.open("r+b") as f:
+                f.truncate(complete)
+
+        for line in lines[1:]:
+            try:
+                record = jsoncodec.loads(line)
+            except jsoncodec.JSONDecodeError:
+                continue
+            if record.get("type") == "sample":
+                self._units[self._key(record)] = record
+
+    @staticmethod
+    def _key(record: dict[str, Any]) -> UnitKey:
+        return (
+            record["target_index"],
+            record["target_id"],
+            record["fixture_id"],
+            record["sample_id"],
+        )
+
+    def _append(self, record: dict[str, Any]):
+        with self._lock:
+            self._file.write(jsoncodec.dumps(record) + "\n")
+            self._file.flush()
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def get(self, key: UnitKey) -> SampleResult | None:
+        """
+        Return the recorded sample for a unit, if completed.
+
+        Args:
+            key: (target_index, target_id, fixture_id, sample_id)
+
+        Returns:
+            SampleResult rebuilt from the journal, or None
+        """
+        record = self._units.get(key)
+        return SampleResult.from_dict(record) if record is not None else None
+
+    def record(self, key: UnitKey, sample: SampleResult):
+        """
+        Append a completed unit.
+
+        Args:
+            key: (target_index, target_id, fixture_id, sample_id)
+            sample: Evaluated sample (including its raw output)
+        """
+        target_index, target_id, fixture_id, _ = key
+        record = {
+            "type": "sample",
+            "target_index": target_index,
+            "target_id": target_id,
+            "fixture_id": fixture_id,
+            **sample.to_dict(),
+        }
+        self._units[key] = record
+        self._append(record)
+
+    def close(self):
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
@@ -1,13 +1,24 @@
 """Built-in check types for PCSL."""
 
-from .enum_value import enum_check
-from .json_required import json_required_check
+from .enum_value import compile_enum, compile_enum_batch, enum_check
+from .json_required import compile_json_required, compile_json_required_batch, json_required_check
 from .json_valid import json_valid_check
-from .judge import judge_check
-from .latency_budget import latency_budget_check
-from .regex_absent import regex_absent_check
-from .semantic import contains_all_check, contains_any_check, regex_present_check, similarity_check
-from .token_budget import token_budget_check
+from .judge import compile_judge_batch, judge_check
+from .latency_budget import latency_budget_check, throughput_budget_check, ttft_budget_check
+from .regex_absent import compile_regex_absent, compile_regex_absent_batch, regex_absent_check
+from .semantic import (
+    compile_contains_all,
+    compile_contains_any,
+    compile_contains_any_batch,
+    compile_regex_present,
+    compile_regex_present_batch,
+    compile_similarity_batch,
+    contains_all_check,
+    contains_any_check,
+    regex_present_check,
+    similarity_check,
+)
+from .token_budget import compile_token_budget, compile_token_budget_batch, token_budget_check
 
 __all__ = [
     "json_valid_check",
@@ -16,9 +27,26 @@ __all__ = [
     "regex_absent_check",
     "token_budget_check",
     "latency_budget_check",
+    "ttft_budget_check",
+    "throughput_budget_check",
     "contains_all_check",
     "contains_any_check",
     "regex_present_check",
     "similarity_check",
     "judge_check",
+    "compile_json_required",
+    "compile_enum",
+    "compile_regex_absent",
+    "compile_token_budget",
+    "compile_contains_all",
+    "compile_contains_any",
+    "compile_regex_present",
+    "compile_json_required_batch",
+    "compile_enum_batch",
+    "compile_regex_absent_batch",
+    "compile_token_budget_batch",
+    "compile_contains_any_batch",
+    "compile_regex_present_batch",
+    "compile_similarity_batch",
+    "compile_judge_batch",
 ]
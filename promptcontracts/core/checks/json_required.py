@@ -1,8 +1,67 @@
 """Check: Required JSON fields."""
 
+from collections.abc import Callable
 from typing import Any
 
 
+def compile_json_required(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str, Any]]:
+    """
+    Compile a json_required check.
+
+    Args:
+        check_spec: Check configuration with 'fields' array
+
+    Returns:
+        Evaluator taking (response_text, parsed_json=None, **kwargs) and
+        returning (passed, message, None)
+    """
+    required_fields = check_spec.get("fields", [])
+    fields = tuple(required_fields)
+    all_present = f"All required fields present: {required_fields}"
+
+    def evaluate(response_text: str, parsed_json: Any = None, **kwargs) -> tuple[bool, str, Any]:
+        if parsed_json is None:
+            return False, "Cannot check required fields: response is not valid JSON", None
+
+        if not isinstance(parsed_json, dict):
+            return False, f"Expected JSON object, got {type(parsed_json).__name__}", None
+
+        missing = [f for f in fields if f not in parsed_json]
+
+        if not missing:
+            return True, all_present, None
+        else:
+            return False, f"Missing required fields: {missing}", None
+
+    return evaluate
+
+
+def compile_json_required_batch(check_spec: dict[str, Any]) -> Callable[..., list[bool | str]]:
+    """
+    Compile a json_required check over a column of parsed outputs.
+
+    Args:
+        check_spec: Check configuration with 'fields' array
+
+    Returns:
+        Evaluator taking (outputs, parsed, **kwargs) and returning True or the
+        failure message per output
+    """
+    fields = frozenset(check_spec.get("fields", []))
+    evaluate_one = compile_json_required(check_spec)
+
+    def evaluate(outputs: list[str], parsed: list[Any], **kwargs) -> list[bool | str]:
+        results = []
+        for text, parsed_json in zip(outputs, parsed, strict=True):
+            if isinstance(parsed_json, dict) and fields.issubset(parsed_json.keys()):
+                results.append(True)
+            else:
+                results.append(evaluate_one(text, parsed_json=parsed_json)[1])
+        return results
+
+    return evaluate
+
+
 def json_required_check(
     response_text: str, check_spec: dict[str, Any], parsed_json: Any = None, **kwargs
 ) -> tuple[bool, str, Any]:
@@ -17,17 +76,4 @@ def json_required_check(
     Returns:
         (passed, message, None)
     """
-    required_fields = check_spec.get("fields", [])
-
-    if parsed_json is None:
-        return False, "Cannot check required fields: response is not valid JSON", None
-
-    if not isinstance(parsed_json, dict):
-        return False, f"Expected JSON object, got {type(parsed_json).__name__}", None
-
-    missing = [f for f in required_fields if f not in parsed_json]
-
-    if not missing:
-        return True, f"All required fields present: {required_fields}", None
-    else:
-        return False, f"Missing required fields: {missing}", None
+    return compile_json_required(check_spec)(response_text, parsed_json=parsed_json)
@@ -6,97 +6,142 @@ for more flexible validation beyond exact matching.
 """
 
 import re
+from collections.abc import Callable
 from typing import Any
 
 
-def contains_all_check(
-    response_text: str, check_spec: dict[str, Any], **kwargs
-) -> tuple[bool, str]:
+def compile_contains_all(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str]]:
     """
-    Check that response contains all required substrings.
+    Compile a contains_all check with needles lowered once.
 
     Args:
-        response_text: Response text to check
         check_spec: Check specification with 'required' list and optional 'case_sensitive'
-        **kwargs: Additional arguments
 
     Returns:
-        Tuple of (passed, message)
+        Evaluator taking (response_text, **kwargs) and returning (passed, message)
     """
     required = check_spec.get("required", [])
     case_sensitive = check_spec.get("case_sensitive", True)
 
     if not isinstance(required, list):
-        return False, f"'required' must be a list, got {type(required)}"
+        error = f"'required' must be a list, got {type(required)}"
+        return lambda response_text, **kwargs: (False, error)
 
-    text_to_check = response_text if case_sensitive else response_text.lower()
-    missing = []
+    needles = [(str(item), str(item) if case_sensitive else str(item).lower()) for item in required]
+    all_present = f"All {len(required)} required strings present"
 
-    for item in required:
-        item_str = str(item)
-        search_str = item_str if case_sensitive else item_str.lower()
-        if search_str not in text_to_check:
-            missing.append(item_str)
+    def evaluate(response_text: str, **kwargs) -> tuple[bool, str]:
+        text_to_check = response_text if case_sensitive else response_text.lower()
+        missing = [item for item, search_str in needles if search_str not in text_to_check]
 
-    if missing:
-        return False, f"Missing required strings: {missing}"
+        if missing:
+            return False, f"Missing required strings: {missing}"
 
-    return True, f"All {len(required)} required strings present"
+        return True, all_present
 
+    return evaluate
 
-def contains_any_check(
+
+def contains_all_check(
     response_text: str, check_spec: dict[str, Any], **kwargs
 ) -> tuple[bool, str]:
     """
-    Check that response contains at least one of the required substrings.
+    Check that response contains all required substrings.
 
     Args:
         response_text: Response text to check
-        check_spec: Check specification with 'options' list and optional 'case_sensitive'
+        check_spec: Check specification with 'required' list and optional 'case_sensitive'
         **kwargs: Additional arguments
 
     Returns:
         Tuple of (passed, message)
     """
+    return compile_contains_all(check_spec)(response_text)
+
+
+def compile_contains_any(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str]]:
+    """
+    Compile a contains_any check with options lowered once.
+
+    Args:
+        check_spec: Check specification with 'options' list and optional 'case_sensitive'
+
+    Returns:
+        Evaluator taking (response_text, **kwargs) and returning (passed, message)
+    """
     options = check_spec.get("options", [])
     case_sensitive = check_spec.get("case_sensitive", True)
 
     if not isinstance(options, list):
-        return False, f"'options' must be a list, got {type(options)}"
+        error = f"'options' must be a list, got {type(options)}"
+        return lambda response_text, **kwargs: (False, error)
 
     if not options:
-        return False, "No options specified"
+        return lambda response_text, **kwargs: (False, "No options specified")
 
-    text_to_check = response_text if case_sensitive else response_text.lower()
+    needles = [
+        (str(option), str(option) if case_sensitive else str(option).lower()) for option in options
+    ]
+    none_found = f"None of the {len(options)} options found in response"
 
-    for option in options:
-        option_str = str(option)
-        search_str = option_str if case_sensitive else option_str.lower()
-        if search_str in text_to_check:
-            return True, f"Found option: '{option_str}'"
+    def evaluate(response_text: str, **kwargs) -> tuple[bool, str]:
+        text_to_check = response_text if case_sensitive else response_text.lower()
 
-    return False, f"None of the {len(options)} options found in response"
+        for option, search_str in needles:
+            if search_str in text_to_check:
+                return True, f"Found option: '{option}'"
 
+        return False, none_found
 
-def regex_present_check(
+    return evaluate
+
+
+def compile_contains_any_batch(check_spec: dict[str, Any]) -> Callable[..., list[bool | str]]:
+    """
+    Compile a contains_any check over a column of outputs.
+
+    Args:
+        check_spec: Check specification with 'options' list and optional 'case_sensitive'
+
+    Returns:
+        Evaluator taking (outputs, **kwargs) and returning True or the failure
+        message per output
+    """
+    evaluate_one = compile_contains_any(check_spec)
+    options = check_spec.get("options", [])
+    if not isinstance(options, list) or not options:
+        return lambda outputs, **kwargs: [evaluate_one(text)[1] for text in outputs]
+
+    case_sensitive = check_spec.get("case_sensitive", True)
+    needles = [str(o) if case_sensitive else str(o).lower() for o in options]
+    none_found = f"None of the {len(options)} options found in response"
+
+    def evaluate(outputs: list[str], **kwargs) -> list[bool | str]:
+        texts = outputs if case_sensitive else [text.lower() for text in outputs]
+        return [True if any(needle in text for needle in needles) else none_found for text in texts]
+
+    return evaluate
+
+
+def contains_any_check(
     response_text: str, check_spec: dict[str, Any], **kwargs
 ) -> tuple[bool, str]:
     """
-    Check that response matches a regex pattern.
+    Check that response contains at least one of the required substrings.
 
     Args:
         response_text: Response text to check
-        check_spec: Check specification with 'pattern' and optional 'flags'
+        check_spec: Check specification with 'options' list and optional 'case_sensitive'
         **kwargs: Additional arguments
 
     Returns:
         Tuple of (passed, message)
     """
-    pattern = check_spec.get("pattern")
-    if not pattern:
-        return False, "No pattern specified"
+    return compile_contains_any(check_spec)(response_text)
+
 
-    flags_str = check_spec.get("flags", "")
+def _regex_flags(flags_str: str) -> int:
+    """Translate regex_present 'flags' letters (i, m, s) into re flags."""
     flags = 0
     if "i" in flags_str.lower():
         flags |= re.IGNORECASE
@@ -104,17 +149,88 @@ def regex_present_check(
         flags |= re.MULTILINE
     if "s" in flags_str.lower():
         flags |= re.DOTALL
+    return flags
+
+
+def compile_regex_present(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str]]:
+    """
+    Compile a regex_present check: flags parsed and pattern compiled once.
+
+    Args:
+        check_spec: Check specification with 'pattern' and optional 'flags'
+
+    Returns:
+        Evaluator taking (response_text, **kwargs) and returning (passed, message)
+    """
+    pattern = check_spec.get("pattern")
+    if not pattern:
+        return lambda response_text, **kwargs: (False, "No pattern specified")
 
     try:
-        match = re.search(pattern, response_text, flags)
+        regex = re.compile(pattern, _regex_flags(check_spec.get("flags", "")))
+    except re.error as e:
+        error = f"Invalid regex pattern: {e}"
+        return lambda response_text, **kwargs: (False, error)
+
+    not_found = f"Pattern not found: {pattern}"
+
+    def evaluate(response_text: str, **kwargs) -> tuple[bool, str]:
+        match = regex.search(response_text)
         if match:
             matched_text = match.group(0)
             preview = matched_text[:50] + "..." if len(matched_text) > 50 else matched_text
             return True, f"Pattern matched: '{preview}'"
         else:
-            return False, f"Pattern not found: {pattern}"
-    except re.error as e:
-        return False, f"Invalid regex pattern: {e}"
+            return False, not_found
+
+    return evaluate
+
+
+def compile_regex_present_batch(
+    check_spec: dict[str, Any],
+) -> Callable[..., list[bool | str]] | None:
+    """
+    Compile a regex_present check scanning a column of outputs.
+
+    Args:
+        check_spec: Check specification with 'pattern' and optional 'flags'
+
+    Returns:
+        Evaluator taking (outputs, **kwargs) and returning True or the failure
+        message per output; None if the spec needs the per-output check
+        (missing or invalid pattern)
+    """
+    pattern = check_spec.get("pattern")
+    if not pattern:
+        return None
+    try:
+        search = re.compile(pattern, _regex_flags(check_spec.get("flags", ""))).search
+    except re.error:
+        return None
+
+    not_found = f"Pattern not found: {pattern}"
+
+    def evaluate(outputs: list[str], **kwargs) -> list[bool | str]:
+        return [True if search(text) else not_found for text in outputs]
+
+    return evaluate
+
+
+def regex_present_check(
+    response_text: str, check_spec: dict[str, Any], **kwargs
+) -> tuple[bool, str]:
+    """
+    Check that response matches a regex pattern.
+
+    Args:
+        response_text: Response text to check
+        check_spec: Check specification with 'pattern' and optional 'flags'
+        **kwargs: Additional arguments
+
+    Returns:
+        Tuple of (passed, message)
+    """
+    return compile_regex_present(check_spec)(response_text)
 
 
 def similarity_check(response_text: str, check_spec: dict[str, Any], **kwargs) -> tuple[bool, str]:
@@ -165,6 +281,54 @@ def similarity_check(response_text: str, check_spec: dict[str, Any], **kwargs) -
         return False, f"Similarity computation failed: {e}"
 
 
+def compile_similarity_batch(check_spec: dict[str, Any]) -> Callable[..., list[bool | str]]:
+    """
+    Compile a similarity check embedding a column of outputs in one batch.
+
+    The reference is embedded once; outputs go through the adapter's
+    embed_batch() when it has one.
+
+    Args:
+        check_spec: Check specification with 'reference' and 'threshold'
+
+    Returns:
+        Evaluator taking (outputs, embedding_adapter=None, **kwargs) and
+        returning True or the failure message per output
+    """
+    reference = check_spec.get("reference")
+    threshold = check_spec.get("threshold", 0.7)
+
+    def evaluate(outputs: list[str], embedding_adapter: Any = None, **kwargs) -> list[bool | str]:
+        if not reference:
+            return ["No reference text specified"] * len(outputs)
+        if not embedding_adapter:
+            return ["Similarity check requires embedding_adapter in kwargs"] * len(outputs)
+
+        try:
+            reference_emb = embedding_adapter.embed(reference)
+            if hasattr(embedding_adapter, "embed_batch"):
+                embeddings = embedding_adapter.embed_batch(list(outputs))
+            else:
+                embeddings = [embedding_adapter.embed(text) for text in outputs]
+        except Exception as e:
+            return [f"Similarity computation failed: {e}"] * len(outputs)
+
+        results = []
+        for response_emb in embeddings:
+            try:
+                similarity = _cosine_similarity(response_emb, reference_emb)
+            except Exception as e:
+                results.append(f"Similarity computation failed: {e}")
+                continue
+            if similarity >= threshold:
+                results.append(True)
+            else:
+                results.append(f"Similarity {similarity:.3f} < threshold {threshold}")
+        return results
+
+    return evaluate
+
+
 def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     """Compute cosine similarity between two vectors."""
     if len(vec1) != len(vec2):
@@ -1,8 +1,57 @@
 """Check: Token budget (approximated by word count)."""
 
+from collections.abc import Callable
 from typing import Any
 
 
+def compile_token_budget(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str, Any]]:
+    """
+    Compile a token_budget check.
+
+    Args:
+        check_spec: Check configuration with 'max_out' integer
+
+    Returns:
+        Evaluator taking (response_text, **kwargs) and returning
+        (passed, message, approx_token_count)
+    """
+    max_tokens = check_spec.get("max_out", 0)
+
+    def evaluate(response_text: str, **kwargs) -> tuple[bool, str, Any]:
+        # Approximate token count by splitting on whitespace
+        approx_tokens = len(response_text.split())
+
+        if approx_tokens <= max_tokens:
+            return True, f"Token count ~{approx_tokens} <= {max_tokens}", approx_tokens
+        else:
+            return False, f"Token count ~{approx_tokens} > {max_tokens}", approx_tokens
+
+    return evaluate
+
+
+def compile_token_budget_batch(check_spec: dict[str, Any]) -> Callable[..., list[bool | str]]:
+    """
+    Compile a token_budget check over a column of outputs.
+
+    Args:
+        check_spec: Check configuration with 'max_out' integer
+
+    Returns:
+        Evaluator taking (outputs, **kwargs) and returning True or the failure
+        message per output
+    """
+    max_tokens = check_spec.get("max_out", 0)
+
+    def evaluate(outputs: list[str], **kwargs) -> list[bool | str]:
+        counts = [len(text.split()) for text in outputs]
+        return [
+            True if count <= max_tokens else f"Token count ~{count} > {max_tokens}"
+            for count in counts
+        ]
+
+    return evaluate
+
+
 def token_budget_check(
     response_text: str, check_spec: dict[str, Any], **kwargs
 ) -> tuple[bool, str, Any]:
@@ -18,12 +67,4 @@ def token_budget_check(
     Returns:
         (passed, message, approx_token_count)
     """
-    max_tokens = check_spec.get("max_out", 0)
-
-    # Approximate token count by splitting on whitespace
-    approx_tokens = len(response_text.split())
-
-    if approx_tokens <= max_tokens:
-        return True, f"Token count ~{approx_tokens} <= {max_tokens}", approx_tokens
-    else:
-        return False, f"Token count ~{approx_tokens} > {max_tokens}", approx_tokens
+    return compile_token_budget(check_spec)(response_text)
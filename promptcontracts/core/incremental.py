@@ -0,0 +1,140 @@
+"""
+Change-impact analysis for incremental re-runs.
+
+Every fixture saved with ``--save-io`` records two fingerprints in its
+``run.json``: one over everything that shapes generation (final prompt,
+target type/model/params, schema) and one over everything that shapes
+evaluation (ES checks, expected IO, repair policy). A later run pointed at
+that directory compares fingerprints per fixture and decides to reuse the
+stored samples, re-validate their stored outputs offline, or regenerate.
+Fixtures with early-aborted samples are regenerated rather than
+re-validated, since only a prefix of their output was kept.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Literal
+
+from ..utils.hashing import compute_prompt_hash
+from .sampling import SampleResult
+
+ReuseDecision = Literal["reuse", "revalidate", "regenerate"]
+
+
+def _fingerprint(material: dict[str, Any]) -> str:
+    return compute_prompt_hash(json.dumps(material, sort_keys=True, separators=(",", ":")))
+
+
+def generation_fingerprint(
+    final_prompt: str,
+    target: dict[str, Any],
+    schema: dict[str, Any] | None,
+    prompt_hash: str | None = None,
+    base_url: str | None = None,
+) -> str:
+    """
+    Fingerprint the inputs of a generate call.
+
+    The final prompt already covers ``pd.prompt``, the fixture input and, in
+    assist/enforce mode, the constraints block derived from the ES.
+
+    Args:
+        final_prompt: Complete prompt sent to the adapter
+        target: EP target (type, model, params)
+        schema: Schema passed for schema-guided generation, if any
+        prompt_hash: compute_prompt_hash(final_prompt), if already known
+        base_url: Server the adapter talks to, if it has one
+
+    Returns:
+        Hex digest
+    """
+    return _fingerprint(
+        {
+            "prompt_hash": prompt_hash or compute_prompt_hash(final_prompt),
+            "type": target.get("type"),
+            "model": target.get("model"),
+            "params": target.get("params", {}),
+            "schema": schema,
+            "base_url": base_url.rstrip("/") if base_url else None,
+        }
+    )
+
+
+def evaluation_fingerprint(
+    pd: dict[str, Any], es: dict[str, Any], repair_policy: dict[str, Any]
+) -> str:
+    """
+    Fingerprint everything that turns a raw output into check results.
+
+    Args:
+        pd: Prompt Definition (only ``io`` matters)
+        es: Expectation Suite
+        repair_policy: Effective repair policy
+
+    Returns:
+        Hex digest
+    """
+    return _fingerprint(
+        {
+            "io": pd.get("io", {}),
+            "checks": es.get("checks", []),
+            "repair_policy": repair_policy,
+        }
+    )
+
+
+class PriorRun:
+    """Read-only view of a previous ``--save-io`` directory."""
+
+    def __init__(self, directory: str):
+        """
+        Open a previous artifact directory.
+
+        Args:
+            directory: Directory a previous run saved IO artifacts to
+        """
+        self.directory = Path(directory)
+
+    def load(self, target_id: str, fixture_id: str) -> dict[str, Any] | None:
+        """Return the saved run.json of a fixture, or None if missing/unreadable."""
+        path = self.directory / target_id / fixture_id / "run.json"
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def plan(
+        self, target_id: str, fixture_id: str, generation_fp: str, evaluation_fp: str
+    ) -> tuple[ReuseDecision, dict[int, SampleResult]]:
+        """
+        Decide how much of a fixture's previous result can be reused.
+
+        Args:
+            target_id: Target identifier ("type:model")
+            fixture_id: Fixture identifier
+            generation_fp: Current generation fingerprint
+            evaluation_fp: Current evaluation fingerprint
+
+        Returns:
+            (decision, prior samples by sample_id); samples are empty when the
+            fixture must be regenerated
+        """
+        saved = self.load(target_id, fixture_id)
+        if not saved or "samples" not in saved:
+            return "regenerate", {}
+
+        fingerprints = saved.get("fingerprints", {})
+        if fingerprints.get("generation") != generation_fp:
+            return "regenerate", {}
+
+        samples = {s["sample_id"]: SampleResult.from_dict(s) for s in saved["samples"]}
+        if any(s.raw_output is None for s in samples.values()):
+            return "regenerate", {}
+
+        if fingerprints.get("evaluation") != evaluation_fp:
+            # An aborted generation left a partial output with a verdict from the old ES
+            if any(s.metadata.get("early_abort") for s in samples.values()):
+                return "regenerate", {}
+            return "revalidate", samples
+
+        return "reuse", samples
@@ -42,6 +42,18 @@ class ContractMetrics:
     # Provider consistency (multi-sample)
     provider_consistency: float | None  # Agreement rate across samples
 
+    # Truncation repair, kept out of repair_rate (close_truncated_json)
+    truncation_repaired_fixtures: int = 0  # Fixtures whose output was completed
+    validation_success_excluding_truncation: float | None = None  # Without those passes
+
+
+def _truncation_repaired(fixture: dict[str, Any]) -> bool:
+    """Whether a sample of the fixture was completed by close_truncated_json."""
+    return any(
+        "close_truncated_json" in details.get("steps_applied", [])
+        for details in fixture.get("repair_ledger", [])
+    )
+
 
 class MetricsComputer:
     """Computes metrics from contract execution results."""
@@ -80,6 +92,8 @@ class MetricsComputer:
         passed = sum(1 for f in all_fixtures if f.get("status") == "PASS")
         failed = sum(1 for f in all_fixtures if f.get("status") == "FAIL")
         repaired = sum(1 for f in all_fixtures if f.get("status") == "REPAIRED")
+        truncated = [f for f in all_fixtures if _truncation_repaired(f)]
+        truncated_passes = sum(1 for f in truncated if f.get("status") == "PASS")
 
         # Validation success
         validation_success = passed / total if total > 0 else 0.0
@@ -128,6 +142,8 @@ class MetricsComputer:
             overhead_pct=overhead_pct,
             baseline_mean_latency_ms=baseline_mean,
             provider_consistency=provider_consistency,
+            truncation_repaired_fixtures=len(truncated),
+            validation_success_excluding_truncation=(passed - truncated_passes) / total,
         )
 
     def _empty_metrics(self) -> ContractMetrics:
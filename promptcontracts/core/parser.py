@@ -1,14 +1,19 @@
 """
 Parsing utilities for extracting structured data from LLM outputs.
 
-Provides json_loose() for fault-tolerant JSON extraction and
-regex_extract() for pattern-based extraction.
+Provides json_loose() for fault-tolerant JSON extraction,
+regex_extract() for pattern-based extraction and ParseContext, the
+per-sample parse state shared by repair and checks.
 """
 
 import json
 import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
+from ..utils import jsoncodec
+
 
 class ParseError(Exception):
     """Raised when parsing fails."""
@@ -16,18 +21,108 @@ class ParseError(Exception):
     pass
 
 
-def json_loose(text: str) -> Any:
+# A string literal, a run of opening brackets, a closing bracket, or a stray quote
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{\[]+|[}\]]|"')
+_OPENERS = {"}": "{", "]": "["}
+_DECODER = json.JSONDecoder()
+
+
+def _scan_json_blocks(text: str) -> Iterator[tuple[int, int, Any]]:
+    """
+    Single pass over text yielding (start, end, value) of embedded JSON blocks.
+
+    An opening bracket outside any block is decoded in place with
+    raw_decode(), which skips a valid block at C speed; value is then the
+    decoded block. If that fails the scan tracks bracket depth (string
+    literals skipped by regex) and collects the balanced blocks inside with
+    value None, yielding them once the failed block closes, is closed by the
+    wrong bracket, or the text ends.
+    """
+    # Positions of the open brackets enclosing the scan position
+    stack: list[int] = []
+    # Balanced blocks found directly inside the open block at each depth
+    pending: dict[int, list[tuple[int, int, Any]]] = {}
+    pos = 0
+
+    def flush() -> Iterator[tuple[int, int, Any]]:
+        # Deeper blocks always lie after shallower ones, so depth order is text order
+        for depth in sorted(pending):
+            yield from pending[depth]
+
+    while match := _TOKEN.search(text, pos):
+        index, pos = match.span()
+        char = text[index]
+
+        if char == '"':
+            if not stack:
+                # Quotes in prose do not delimit strings
+                pos = index + 1
+            elif pos == index + 1:
+                # Unterminated string: no enclosing block can close
+                break
+        elif char in "{[":
+            if stack:
+                stack.extend(range(index, pos))
+                continue
+            try:
+                value, end = _DECODER.raw_decode(text, index)
+            except (ValueError, RecursionError):
+                # RecursionError: nesting too deep for the decoder
+                stack.append(index)
+                pos = index + 1
+            else:
+                yield index, end, value
+                pos = end
+        elif stack:
+            start = stack.pop()
+            if text[start] != _OPENERS[char]:
+                yield from flush()
+                stack, pending = [], {}
+                continue
+            depth = len(stack)
+            children = pending.pop(depth + 1, [])
+            if depth:
+                pending.setdefault(depth, []).append((start, index + 1, None))
+            else:
+                # The top-level block failed to decode: what is inside it may not
+                yield from children
+
+    yield from flush()
+
+
+def iter_json_candidates(text: str) -> Iterator[tuple[int, int]]:
+    """
+    Yield (start, end) spans of JSON object/array candidates embedded in text.
+
+    Top-level blocks that decode are yielded as a whole; for a block that
+    does not (unbalanced, closed by the wrong bracket or invalid), the
+    balanced blocks inside it are yielded instead. Brackets inside string
+    literals are ignored.
+
+    Args:
+        text: Text potentially containing JSON
+
+    Yields:
+        Candidate spans in order of appearance
+    """
+    for start, end, _ in _scan_json_blocks(text):
+        yield start, end
+
+
+def json_loose(text: str, try_direct: bool = True) -> Any:
     """
     Extract JSON from text with fault-tolerant parsing.
 
     Attempts multiple strategies:
     1. Direct JSON parsing
     2. Extract JSON from markdown code fences
-    3. Find first {...} or [...] block
+    3. Embedded {...} or [...] blocks found in one pass (see
+       iter_json_candidates), the first object, else the first array
     4. Strip common prefixes/suffixes
 
     Args:
         text: Text potentially containing JSON
+        try_direct: Attempt strategy 1 (False when the caller already did)
 
     Returns:
         Parsed JSON object
@@ -36,38 +131,36 @@ def json_loose(text: str) -> Any:
         ParseError: If no valid JSON can be extracted
     """
     # Strategy 1: Try direct parse
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    if try_direct:
+        try:
+            return jsoncodec.loads(text)
+        except json.JSONDecodeError:
+            pass
 
     # Strategy 2: Extract from markdown code fences
     fence_pattern = r"```(?:json)?\s*\n(.*?)\n```"
     fence_matches = re.findall(fence_pattern, text, re.DOTALL | re.IGNORECASE)
     for match in fence_matches:
         try:
-            return json.loads(match.strip())
+            return jsoncodec.loads(match.strip())
         except json.JSONDecodeError:
             continue
 
-    # Strategy 3: Find first {...} or [...] block
-    # Try to find balanced braces/brackets
-    for start_char, end_char in [("{", "}"), ("[", "]")]:
-        start_idx = text.find(start_char)
-        if start_idx != -1:
-            # Find matching closing brace
-            depth = 0
-            for i, char in enumerate(text[start_idx:], start=start_idx):
-                if char == start_char:
-                    depth += 1
-                elif char == end_char:
-                    depth -= 1
-                    if depth == 0:
-                        candidate = text[start_idx : i + 1]
-                        try:
-                            return json.loads(candidate)
-                        except json.JSONDecodeError:
-                            break
+    # Strategy 3: Embedded {...} / [...] blocks, objects first, then in order
+    first_array = None
+    for start, end, value in _scan_json_blocks(text):
+        if value is None:
+            try:
+                value = jsoncodec.loads(text[start:end])
+            except (json.JSONDecodeError, RecursionError):
+                # RecursionError: nesting too deep for the decoder
+                continue
+        if isinstance(value, dict):
+            return value
+        if first_array is None:
+            first_array = value
+    if first_array is not None:
+        return first_array
 
     # Strategy 4: Strip common prefixes/suffixes and retry
     stripped = text.strip()
@@ -84,7 +177,7 @@ def json_loose(text: str) -> Any:
         if stripped.lower().startswith(prefix.lower()):
             stripped = stripped[len(prefix) :].strip()
             try:
-                return json.loads(stripped)
+                return jsoncodec.loads(stripped)
             except json.JSONDecodeError:
                 pass
 
@@ -92,6 +185,132 @@ def json_loose(text: str) -> Any:
     raise ParseError(f"Could not extract valid JSON from text: {text[:100]}...")
 
 
+# One token of a JSON text: a string, a string cut off by the end of the
+# text, a bracket or separator, or a bare scalar
+_JSON_TOKEN = re.compile(
+    r'\s*(?:("[^"\\]*(?:\\.[^"\\]*)*")|("[^"\\]*(?:\\.[^"\\]*)*\\?)\Z'
+    r'|([{}\[\]:,])|([^\s{}\[\]:,"]+))'
+)
+_JSON_SCALAR = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+# Escape sequence cut off at the end of a string
+_PARTIAL_ESCAPE = re.compile(r"(?<!\\)(?:\\\\)*(\\(?:u[0-9a-fA-F]{0,3})?)\Z")
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _close_truncated(text: str) -> tuple[int, int, str] | None:
+    """
+    Find how to complete a JSON document cut off mid-way.
+
+    Returns:
+        (start, end, suffix) such that text[start:end] + suffix is the
+        completed document, or None
+    """
+    start = min((i for i in (text.find("{"), text.find("[")) if i >= 0), default=-1)
+    if start < 0:
+        return None
+
+    # Closing bracket of each open container, outermost first
+    closers: list[str] = []
+    # What may come next: "value", "key", "colon" or "comma"; "first_*" also
+    # allows closing an empty container
+    expect = "value"
+    # Longest prefix the closers of its first safe_depth containers complete
+    safe_end = safe_depth = 0
+    pos = start
+
+    while match := _JSON_TOKEN.match(text, pos):
+        pos = match.end()
+        string, open_string, punct, scalar = match.groups()
+
+        if string is not None:
+            if expect in ("key", "first_key"):
+                expect = "colon"
+                continue
+            if expect not in ("value", "first_value"):
+                return None
+        elif open_string is not None:
+            if expect in ("key", "first_key"):
+                break
+            if expect not in ("value", "first_value"):
+                return None
+            # Close the string value, dropping a cut-off escape sequence
+            partial = _PARTIAL_ESCAPE.search(open_string)
+            end = match.start(2) + (partial.start(1) if partial else len(open_string))
+            return start, end, '"' + "".join(reversed(closers))
+        elif punct in _CLOSERS:
+            if expect not in ("value", "first_value"):
+                return None
+            closers.append(_CLOSERS[punct])
+            expect = "first_key" if punct == "{" else "first_value"
+            if len(closers) == 1:
+                # Nested containers are only kept once they hold a member
+                safe_end, safe_depth = pos, 1
+            continue
+        elif punct in ("}", "]"):
+            allowed = "first_key" if punct == "}" else "first_value"
+            if not closers or closers[-1] != punct or expect not in ("comma", allowed):
+                return None
+            closers.pop()
+            if not closers:
+                # Complete document: nothing was cut off
+                return None
+        elif punct == ":":
+            if expect != "colon":
+                return None
+            expect = "value"
+            continue
+        elif punct == ",":
+            if expect != "comma":
+                return None
+            expect = "key" if closers[-1] == "}" else "value"
+            continue
+        else:
+            if expect not in ("value", "first_value"):
+                return None
+            if pos == len(text):
+                # A number or literal touching the end may itself be cut off
+                break
+            if not _JSON_SCALAR.fullmatch(scalar):
+                return None
+
+        # A value just ended
+        expect = "comma"
+        safe_end, safe_depth = pos, len(closers)
+
+    return start, safe_end, "".join(reversed(closers[:safe_depth]))
+
+
+def close_truncated_json(text: str) -> str | None:
+    """
+    Complete a JSON object or array cut off mid-way, e.g. at max_tokens.
+
+    Scans from the first opening bracket with a streaming state machine. An
+    open string value is closed (dropping a cut-off escape sequence); an
+    incomplete trailing member (key without value, dangling comma or colon,
+    number or literal touching the end of the text, nested container without
+    a complete member) is dropped; then the open arrays and objects are
+    closed innermost first.
+
+    Args:
+        text: Text containing a truncated JSON document
+
+    Returns:
+        Completed JSON text, or None if the text has no opening bracket, the
+        document is complete, or it is invalid before the cut
+
+    Examples:
+        >>> close_truncated_json('{"items": [1, 2], "note": "cut of')
+        '{"items": [1, 2], "note": "cut of"}'
+        >>> close_truncated_json('{"a": 1, "b": tr')
+        '{"a": 1}'
+    """
+    closing = _close_truncated(text)
+    if closing is None:
+        return None
+    start, end, suffix = closing
+    return text[start:end] + suffix
+
+
 def regex_extract(
     text: str,
     pattern: str,
@@ -218,3 +437,95 @@ def strip_markdown_fences(text: str) -> str:
     if match:
         return match.group(1)
     return text
+
+
+@dataclass
+class ParseContext:
+    """
+    Parse state of one output, shared by repair and checks.
+
+    Holds the raw and normalized text, the decoded JSON and the repair steps
+    applied. text_is_json records that text itself decodes to parsed, and
+    text_error the decode error of text otherwise, so checks such as
+    pc.check.json_valid do not decode the output again.
+    """
+
+    raw_text: str
+    text: str
+    parsed: Any = None
+    text_is_json: bool = False
+    text_error: str | None = None
+    repair_details: dict[str, Any] = field(default_factory=lambda: {"steps_applied": []})
+
+    @classmethod
+    def from_output(
+        cls, raw_text: str, expects_json: bool = False, repair_steps: Iterable[str] = ()
+    ) -> "ParseContext":
+        """
+        Parse and repair an output, decoding each candidate text at most once.
+
+        Args:
+            raw_text: Raw LLM output
+            expects_json: Whether the PD expects structured/json output
+            repair_steps: Allowed repair steps ("strip_markdown_fences",
+                "close_truncated_json", "json_loose_parse", applied in this
+                order); empty when repair is disabled
+
+        Returns:
+            ParseContext for the output
+        """
+        context = cls(raw_text=raw_text, text=raw_text)
+        if not expects_json or context._decode_text():
+            return context
+
+        steps_applied = context.repair_details["steps_applied"]
+
+        if "strip_markdown_fences" in repair_steps:
+            stripped = strip_markdown_fences(raw_text)
+            if stripped != raw_text:
+                context.text = stripped
+                steps_applied.append("strip_markdown_fences")
+                if context._decode_text():
+                    return context
+
+        if "close_truncated_json" in repair_steps:
+            # Before json_loose_parse, which would pick a complete inner block
+            closing = _close_truncated(raw_text)
+            if closing is not None:
+                start, end, suffix = closing
+                text, text_error = context.text, context.text_error
+                context.text = raw_text[start:end] + suffix
+                if context._decode_text():
+                    steps_applied.append("close_truncated_json")
+                    context.repair_details["truncation"] = {
+                        "dropped_chars": len(raw_text) - end,
+                        "appended": suffix,
+                    }
+                    return context
+                # Keep the fence-stripped text and its decode error
+                context.text, context.text_error = text, text_error
+
+        if "json_loose_parse" in repair_steps:
+            try:
+                # The raw text was already decoded directly above
+                parsed = json_loose(raw_text, try_direct=False)
+            except Exception:
+                return context
+            context.text = json.dumps(parsed)
+            context.parsed = parsed
+            context.text_is_json = True
+            context.text_error = None
+            steps_applied.append("json_loose_parse")
+
+        return context
+
+    def _decode_text(self) -> bool:
+        """Decode text into parsed; record the error if it is not JSON."""
+        try:
+            self.parsed = jsoncodec.loads(self.text)
+        except json.JSONDecodeError as e:
+            self.text_error = str(e)
+            return False
+        self.text_is_json = True
+        self.text_error = None
+        return True
@@ -1,9 +1,10 @@
 """JSON reporter for machine-readable output."""
 
-import json
 from pathlib import Path
 from typing import Any
 
+from ...utils import jsoncodec
+
 
 class JSONReporter:
     """JSON reporter."""
@@ -30,10 +31,10 @@ class JSONReporter:
             },
         }
 
-        json_output = json.dumps(enriched, indent=2)
+        json_output = jsoncodec.dumps(enriched, indent=2)
 
         if output_path:
-            Path(output_path).write_text(json_output)
+            Path(output_path).write_text(json_output, encoding="utf-8")
             print(f"Results written to {output_path}")
             if results.get("artifact_base_dir"):
                 print(f"Artifacts saved to {results['artifact_base_dir']}")
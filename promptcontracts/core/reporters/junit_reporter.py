@@ -26,13 +26,15 @@ class JUnitReporter:
             summary = target_result.get("summary", {})
             total_checks = summary.get("total_checks", 0)
             passed_checks = summary.get("passed_checks", 0)
-            failures = total_checks - passed_checks
+            skipped_checks = summary.get("skipped_checks", 0)
+            failures = total_checks - passed_checks - skipped_checks
 
             testsuite = ET.SubElement(testsuites, "testsuite")
             testsuite.set("name", target_name)
             testsuite.set("tests", str(total_checks))
             testsuite.set("failures", str(failures))
             testsuite.set("errors", "0")
+            testsuite.set("skipped", str(skipped_checks))
 
             # Add test cases for each check
             for fixture_result in target_result.get("fixtures", []):
@@ -65,8 +67,13 @@ class JUnitReporter:
                                 prop.set("name", "confidence_interval")
                                 prop.set("value", f"[{ci[0]:.2f}, {ci[1]:.2f}]")
 
+                    # Short-circuited checks were never run
+                    if check.get("skipped"):
+                        skipped = ET.SubElement(testcase, "skipped")
+                        skipped.set("message", check.get("message", "Skipped"))
+
                     # FAIL and NONENFORCEABLE map to <failure/>
-                    if not check.get("passed") or fixture_status in ["FAIL", "NONENFORCEABLE"]:
+                    elif not check.get("passed") or fixture_status in ["FAIL", "NONENFORCEABLE"]:
                         failure = ET.SubElement(testcase, "failure")
                         failure_msg = check.get("message", "Check failed")
                         if fixture_status == "NONENFORCEABLE":
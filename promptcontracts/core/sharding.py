@@ -0,0 +1,218 @@
+"""
+Fixture sharding and merging of shard results.
+
+``--shard i/N`` assigns each fixture to one of N shards by a stable hash of its
+id, so every CI runner computes the same partition without coordination.
+merge_shard_results() recombines the shard reports into the results dict a
+single-process run would have produced: fixtures back in EP order, summaries
+recomputed, latency budgets evaluated over the union of latencies and the
+counters of run extras and per-target execution stats summed.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from .results import TargetSummary
+from .validator import CheckRegistry, Validator
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One shard of a sharded run (1-based index)."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, spec: str) -> "ShardSpec":
+        """
+        Parse an ``i/N`` shard spec.
+
+        Raises:
+            ValueError: If the spec is malformed or i is not in 1..N
+        """
+        try:
+            index, count = (int(part) for part in spec.split("/"))
+        except ValueError:
+            raise ValueError(f"Invalid shard spec '{spec}', expected i/N (e.g. 3/16)") from None
+
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard spec '{spec}', need 1 <= i <= N")
+
+        return cls(index, count)
+
+    def owns(self, fixture_id: str) -> bool:
+        """Return whether a fixture belongs to this shard."""
+        return shard_of(fixture_id, self.count) == self.index
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialize for the results dict."""
+        return {"index": self.index, "count": self.count}
+
+
+def shard_of(fixture_id: str, count: int) -> int:
+    """
+    Assign a fixture to a shard.
+
+    Uses SHA-256 rather than hash() so the assignment is identical across
+    processes, machines and Python versions.
+
+    Returns:
+        1-based shard index
+    """
+    digest = hashlib.sha256(str(fixture_id).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+# Run extras other than "shard", as added by ContractRunner
+RUN_EXTRAS = ("cache", "incremental", "work_queue", "checks", "output_memo", "transport")
+# Per-target execution stats
+TARGET_EXECUTION_STATS = ("rate_limit", "concurrency")
+# Configured limits and per-process gauges: the merged value is the largest one
+_GAUGES = frozenset(
+    {
+        "requests_per_minute",
+        "tokens_per_minute",
+        "max_in_flight",
+        "limit",
+        "max_limit",
+        "peak_limit",
+        "peak_in_flight",
+        "mean_in_flight",
+        "baseline_latency_ms",
+        "smoothed_latency_ms",
+        "entries",
+    }
+)
+
+
+def _merge_counters(blocks: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Combine per-shard stats blocks (run extras, target execution stats).
+
+    Counters are summed and nested blocks merged key by key. Limits and
+    gauges keep their largest value, mean check costs are weighted by their
+    run counts and hit rates are recomputed. Other values come from the
+    first shard that has one.
+    """
+    merged: dict[str, Any] = {}
+    for key in dict.fromkeys(key for block in blocks for key in block):
+        values = [block[key] for block in blocks if block.get(key) is not None]
+        if not values:
+            merged[key] = None
+        elif all(isinstance(value, dict) for value in values):
+            merged[key] = _merge_counters(values)
+        elif any(isinstance(value, bool) or not isinstance(value, int | float) for value in values):
+            merged[key] = values[0]
+        elif key in _GAUGES:
+            merged[key] = max(values)
+        elif key == "mean_ms":
+            weighted = [(block[key], block.get("runs", 0)) for block in blocks if key in block]
+            runs = sum(weight for _, weight in weighted)
+            total = sum(value * weight for value, weight in weighted)
+            merged[key] = round(total / runs, 3) if runs else 0.0
+        else:
+            total = sum(values)
+            merged[key] = round(total, 3) if isinstance(total, float) else total
+
+    if "hits" in merged and "misses" in merged:
+        lookups = merged["hits"] + merged["misses"]
+        merged["hit_rate"] = merged["hits"] / lookups if lookups else 0.0
+
+    return merged
+
+
+def merge_shard_results(shard_results: list[dict[str, Any]], es: dict[str, Any]) -> dict[str, Any]:
+    """
+    Combine the results of all shards of a run.
+
+    Args:
+        shard_results: Results dicts (or JSON reports) of every shard
+        es: Expectation Suite, used to re-evaluate latency budgets
+
+    Returns:
+        Results dict equal to that of an unsharded run; per-process stats
+        (memo and cache lookups, learned limits) are combined over shards
+
+    Raises:
+        ValueError: If a result is not from a sharded run, shards disagree on
+            N or on the targets, or shards are missing or duplicated
+    """
+    if not shard_results:
+        raise ValueError("No shard results to merge")
+
+    shards = []
+    for results in shard_results:
+        if "shard" not in results:
+            raise ValueError("Result is not from a sharded run (missing 'shard')")
+        shards.append(results["shard"])
+
+    count = shards[0]["count"]
+    indices = sorted(shard["index"] for shard in shards)
+    if any(shard["count"] != count for shard in shards):
+        raise ValueError("Shard results come from runs with different shard counts")
+    if indices != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)) - set(indices))
+        raise ValueError(
+            f"Expected shards 1..{count} exactly once; got {indices}"
+            + (f" (missing {missing})" if missing else "")
+        )
+
+    n_targets = len(shard_results[0]["targets"])
+    if any(len(results["targets"]) != n_targets for results in shard_results):
+        raise ValueError("Shard results have different targets")
+
+    validator = Validator(CheckRegistry())
+    checks = es.get("checks", [])
+
+    targets = []
+    for target_index in range(n_targets):
+        fixtures = sorted(
+            (
+                (fixture_index, fixture)
+                for results in shard_results
+                for fixture_index, fixture in zip(
+                    results["shard"]["fixture_indices"],
+                    results["targets"][target_index]["fixtures"],
+                    strict=True,
+                )
+            ),
+            key=lambda item: item[0],
+        )
+
+        summary = TargetSummary()
+        for _, fixture in fixtures:
+            summary.add(fixture)
+
+        target_result = dict(shard_results[0]["targets"][target_index])
+        target_result["fixtures"] = [fixture for _, fixture in fixtures]
+        execution = target_result["execution"] = dict(target_result["execution"])
+        for stats in TARGET_EXECUTION_STATS:
+            blocks = [
+                results["targets"][target_index]["execution"][stats]
+                for results in shard_results
+                if stats in results["targets"][target_index]["execution"]
+            ]
+            if blocks:
+                execution[stats] = _merge_counters(blocks)
+        target_result["summary"] = summary.finalize(
+            target_result["execution"]["is_nonenforceable"],
+            validator.run_latency_checks(
+                checks, summary.latencies, summary.ttfts, summary.throughputs
+            ),
+        )
+        targets.append(target_result)
+
+    first = shard_results[0]
+    merged = {
+        "targets": targets,
+        "artifact_base_dir": first.get("artifact_base_dir"),
+        "pcsl_version": first.get("pcsl_version", "0.3.0"),
+    }
+    for extra in RUN_EXTRAS:
+        blocks = [results[extra] for results in shard_results if extra in results]
+        if blocks:
+            merged[extra] = _merge_counters(blocks)
+
+    return merged
@@ -0,0 +1,279 @@
+"""
+Shared pooled HTTP transport for provider adapters.
+
+Adapters used to open a new ``httpx.Client`` (and TCP connection) per call or
+build their own SDK client per target. This module keeps process-wide pooled
+clients keyed by base URL, with keep-alive and HTTP/2 where the server
+negotiates it, so every adapter and judge talking to the same endpoint shares
+connections. The clients are synchronous: the async engine runs generate
+calls in worker threads. Pool limits and timeouts come from EP
+``execution.transport``; per-endpoint counters (requests, connections opened,
+time spent connecting) show how often connections were reused.
+"""
+
+import atexit
+import importlib.util
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+def openai_base_url() -> str:
+    """Return the OpenAI API base URL (``OPENAI_BASE_URL`` or the public API)."""
+    return os.getenv("OPENAI_BASE_URL") or DEFAULT_OPENAI_BASE_URL
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pool settings (EP ``execution.transport``)."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 120.0
+    connect_timeout: float = 10.0
+    http2: bool | None = None
+
+    @classmethod
+    def from_dict(cls, cfg: dict[str, Any] | None) -> "TransportConfig":
+        """
+        Build config from an EP ``execution.transport`` block.
+
+        Raises:
+            ValueError: If a limit or timeout is not positive
+        """
+        cfg = cfg or {}
+        config = cls(
+            max_connections=cfg.get("max_connections", 100),
+            max_keepalive_connections=cfg.get("max_keepalive_connections", 20),
+            keepalive_expiry=cfg.get("keepalive_expiry", 30.0),
+            timeout=cfg.get("timeout", 120.0),
+            connect_timeout=cfg.get("connect_timeout", 10.0),
+            http2=cfg.get("http2"),
+        )
+
+        for name in (
+            "max_connections",
+            "max_keepalive_connections",
+            "keepalive_expiry",
+            "timeout",
+            "connect_timeout",
+        ):
+            value = getattr(config, name)
+            if isinstance(value, bool) or value <= 0:
+                raise ValueError(f"transport.{name} must be positive, got {value!r}")
+
+        return config
+
+    @property
+    def use_http2(self) -> bool:
+        """Whether clients enable HTTP/2 (auto: only if the h2 package is installed)."""
+        if self.http2 is None:
+            return importlib.util.find_spec("h2") is not None
+        return self.http2
+
+    def limits(self) -> httpx.Limits:
+        """Return the httpx pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self) -> httpx.Timeout:
+        """Return the httpx timeouts."""
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+
+class _EndpointStats:
+    """Counters for one base URL, updated from httpx event hooks and httpcore traces."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self.connect_seconds = 0.0
+        self.http_versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def on_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def on_response(self, http_version: str):
+        with self._lock:
+            self.http_versions[http_version] = self.http_versions.get(http_version, 0) + 1
+
+    def tracer(self):
+        """Return a trace callback timing TCP connect and TLS handshake of one request."""
+        started: dict[str, float] = {}
+
+        def trace(event_name: str, info: dict[str, Any]):
+            step, _, phase = event_name.rpartition(".")
+            if step not in ("connection.connect_tcp", "connection.start_tls"):
+                return
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase == "complete" and step in started:
+                elapsed = time.perf_counter() - started.pop(step)
+                with self._lock:
+                    self.connect_seconds += elapsed
+                    if step == "connection.connect_tcp":
+                        self.connections_opened += 1
+
+        return trace
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "reused": max(0, self.requests - self.connections_opened),
+                "connect_ms": round(self.connect_seconds * 1000, 1),
+                "http_versions": dict(self.http_versions),
+            }
+
+
+class HTTPTransport:
+    """Pooled httpx clients keyed by base URL, shared by all adapters."""
+
+    def __init__(self, config: TransportConfig | None = None):
+        """
+        Initialize transport.
+
+        Args:
+            config: Pool settings (defaults to TransportConfig())
+        """
+        self.config = config or TransportConfig()
+        self._clients: dict[str, httpx.Client] = {}
+        self._stats: dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, base_url: str) -> _EndpointStats:
+        if base_url not in self._stats:
+            self._stats[base_url] = _EndpointStats()
+        return self._stats[base_url]
+
+    def _client_kwargs(self, base_url: str) -> dict[str, Any]:
+        return {
+            "base_url": base_url,
+            "limits": self.config.limits(),
+            "timeout": self.config.timeouts(),
+            "http2": self.config.use_http2,
+        }
+
+    def client(self, base_url: str) -> httpx.Client:
+        """
+        Return the pooled sync client for a base URL (thread-safe, created once).
+
+        Args:
+            base_url: Endpoint base URL, e.g. ``http://localhost:11434``
+
+        Returns:
+            Shared httpx.Client
+        """
+        base_url = base_url.rstrip("/")
+        with self._lock:
+            if base_url not in self._clients:
+                stats = self._endpoint(base_url)
+
+                def on_request(request: httpx.Request):
+                    stats.on_request()
+                    request.extensions["trace"] = stats.tracer()
+
+                def on_response(response: httpx.Response):
+                    stats.on_response(response.http_version)
+
+                self._clients[base_url] = httpx.Client(
+                    event_hooks={"request": [on_request], "response": [on_response]},
+                    **self._client_kwargs(base_url),
+                )
+            return self._clients[base_url]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-base-URL counters for endpoints that served requests."""
+        with self._lock:
+            endpoints = dict(self._stats)
+        return {
+            base_url: endpoint.to_dict()
+            for base_url, endpoint in endpoints.items()
+            if endpoint.requests
+        }
+
+    def close(self):
+        """Close all sync clients."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+_transports: dict[TransportConfig, HTTPTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def shared_transport(config: TransportConfig | None = None) -> HTTPTransport:
+    """
+    Return the process-wide transport for a pool configuration.
+
+    Runners, adapters and judges asking for the same configuration share one
+    set of pools.
+
+    Args:
+        config: Pool settings (defaults to TransportConfig())
+
+    Returns:
+        Shared HTTPTransport
+    """
+    config = config or TransportConfig()
+    with _transports_lock:
+        if config not in _transports:
+            _transports[config] = HTTPTransport(config)
+        return _transports[config]
+
+
+def transport_stats_delta(
+    before: dict[str, dict[str, Any]], after: dict[str, dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """
+    Subtract two stats() snapshots, keeping endpoints that served requests in between.
+
+    Args:
+        before: Snapshot taken at the start of a run
+        after: Snapshot taken at the end
+
+    Returns:
+        Per-base-URL counters for the run
+    """
+    delta = {}
+    for base_url, end in after.items():
+        start = before.get(base_url, {})
+        requests = end["requests"] - start.get("requests", 0)
+        if not requests:
+            continue
+        opened = end["connections_opened"] - start.get("connections_opened", 0)
+        versions = {
+            version: count - start.get("http_versions", {}).get(version, 0)
+            for version, count in end["http_versions"].items()
+        }
+        delta[base_url] = {
+            "requests": requests,
+            "connections_opened": opened,
+            "reused": max(0, requests - opened),
+            "connect_ms": round(end["connect_ms"] - start.get("connect_ms", 0.0), 1),
+            "http_versions": {v: c for v, c in versions.items() if c},
+        }
+    return delta
+
+
+@atexit.register
+def _close_shared_transports():
+    with _transports_lock:
+        transports = list(_transports.values())
+    for transport in transports:
+        transport.close()
@@ -5,9 +5,10 @@ Provides hooks for loading user-supplied benchmark datasets and normalizing
 them into PCSL format. Full datasets not included; users must provide paths.
 """
 
-import json
 from pathlib import Path
 
+from ..utils import jsoncodec
+
 
 def load_helm_subset(
     task_name: str,
@@ -66,7 +67,7 @@ def load_helm_subset(
     fixtures = []
     with open(task_file) as f:
         for line in f:
-            item = json.loads(line)
+            item = jsoncodec.loads(line)
             fixtures.append(
                 {
                     "id": item.get("id", f"helm_{task_name}_{len(fixtures)}"),
@@ -139,7 +140,7 @@ def load_bbh_subset(
 
     # Load JSON
     with open(task_file) as f:
-        data = json.load(f)
+        data = jsoncodec.loads(f.read())
 
     fixtures = []
     examples = data.get("examples", [])
@@ -200,8 +201,8 @@ def create_ep_for_benchmark(
         },
     }
 
-    with open(output_path, "w") as f:
-        json.dump(ep, f, indent=2)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(jsoncodec.dumps(ep, indent=2))
 
     print(f"Created EP: {output_path}")
     print(f"Fixtures: {len(fixtures)} total, {len(ep['fixtures'])} in EP sample")
@@ -4,6 +4,8 @@ import json
 import re
 from typing import Any
 
+from . import jsoncodec
+
 
 def strip_code_fences(text: str) -> tuple[str, bool]:
     """
@@ -48,7 +50,7 @@ def lowercase_jsonpath_fields(json_text: str, paths: list[str]) -> tuple[str, li
         return json_text, []
 
     try:
-        data = json.loads(json_text)
+        data = jsoncodec.loads(json_text)
     except json.JSONDecodeError:
         # Can't parse, return unchanged
         return json_text, []
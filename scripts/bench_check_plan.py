@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark compiled check plans against per-call check evaluation.
+
+Evaluates a typical Expectation Suite over synthetic outputs, once with
+Validator.run_checks() (specs re-read, regexes and JSONPaths resolved per
+call), once with a CheckPlan compiled up front and once column-wise with
+Validator.run_checks_batch(), and prints checks/second.
+
+Usage:
+    python scripts/bench_check_plan.py [--outputs 100000]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import random  # noqa: E402
+import time  # noqa: E402
+
+from promptcontracts.core.validator import CheckRegistry, Validator  # noqa: E402
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.json_required", "fields": ["label", "confidence"]},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["spam", "ham", "unsure"]},
+    {"type": "pc.check.regex_absent", "pattern": r"(?i)\bas an ai\b"},
+    {"type": "pc.check.token_budget", "max_out": 40},
+    {"type": "pc.check.contains_any", "options": ["spam", "ham"]},
+]
+
+
+def synthetic_outputs(count, seed=0):
+    """Generate (response_text, parsed_json) pairs."""
+    rng = random.Random(seed)
+    outputs = []
+    for _ in range(count):
+        data = {
+            "label": rng.choice(["spam", "ham", "unsure", "Spam", "other"]),
+            "confidence": round(rng.random(), 3),
+            "reason": " ".join(rng.choice(["free", "offer", "meeting", "today"]) for _ in range(8)),
+        }
+        text = json.dumps(data)
+        outputs.append((text, data))
+    return outputs
+
+
+def bench(label, evaluate, outputs):
+    """Time evaluate() over all outputs and print throughput."""
+    start = time.perf_counter()
+    for response_text, parsed in outputs:
+        evaluate(response_text, parsed)
+    elapsed = time.perf_counter() - start
+    rate = len(outputs) * len(CHECKS) / elapsed
+    print(f"{label:<12} {elapsed:8.3f}s  {rate:12,.0f} checks/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--outputs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    outputs = synthetic_outputs(args.outputs)
+    validator = Validator(CheckRegistry())
+    plan = validator.compile(CHECKS)
+
+    before = bench("run_checks", lambda t, p: validator.run_checks(CHECKS, t, p), outputs)
+    after = bench("run_plan", lambda t, p: validator.run_plan(plan, t, p), outputs)
+    print(f"speedup      {before / after:8.2f}x")
+
+    texts = [text for text, _ in outputs]
+    parsed = [data for _, data in outputs]
+    start = time.perf_counter()
+    validator.run_checks_batch(CHECKS, texts, parsed)
+    elapsed = time.perf_counter() - start
+    rate = len(outputs) * len(CHECKS) / elapsed
+    print(f"{'batch':<12} {elapsed:8.3f}s  {rate:12,.0f} checks/s")
+    print(f"speedup      {before / elapsed:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
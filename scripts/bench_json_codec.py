@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON codec backends on the fixture corpus.
+
+Decodes every fixture file under fixtures/ and examples/ and re-encodes it
+with indent=2 (as run.json artefacts and the JSON reporter do), file by
+file and as one report-sized document, once per installed backend of
+promptcontracts.utils.jsoncodec; checks the decoded values match
+json.loads and prints the best time per pass.
+
+Usage:
+    python scripts/bench_json_codec.py [--repeat 50]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+
+from promptcontracts.utils import jsoncodec  # noqa: E402
+
+ROOT = Path(__file__).parent.parent
+
+
+def load_corpus():
+    """Return the text of every JSON file in the fixture directories."""
+    paths = sorted(ROOT.glob("fixtures/**/*.json")) + sorted(ROOT.glob("examples/**/*.json"))
+    return [path.read_text(encoding="utf-8") for path in paths]
+
+
+def bench(func, items, repeat):
+    """Return the best time of repeat passes of func over items, in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    texts = load_corpus()
+    expected = [json.loads(text) for text in texts]
+    # A run.json-sized document: every fixture in one report
+    report = {"fixtures": expected}
+    report_text = json.dumps(report)
+    print(f"corpus: {len(texts)} files, {sum(map(len, texts)) / 1e6:.2f} MB")
+    print(
+        f"{'backend':<10} {'loads':>10} {'dumps':>10} "
+        f"{'loads all':>10} {'dumps all':>10}   identical"
+    )
+
+    for name in jsoncodec.available_backends():
+        jsoncodec.set_backend(name)
+        identical = [jsoncodec.loads(text) for text in texts] == expected and all(
+            json.loads(jsoncodec.dumps(doc, indent=2)) == doc for doc in expected
+        )
+        loads_ms = bench(jsoncodec.loads, texts, args.repeat)
+        dumps_ms = bench(lambda doc: jsoncodec.dumps(doc, indent=2), expected, args.repeat)
+        report_loads_ms = bench(jsoncodec.loads, [report_text], args.repeat)
+        report_dumps_ms = bench(lambda doc: jsoncodec.dumps(doc, indent=2), [report], args.repeat)
+        print(
+            f"{name:<10} {loads_ms:8.2f}ms {dumps_ms:8.2f}ms "
+            f"{report_loads_ms:8.2f}ms {report_dumps_ms:8.2f}ms   "
+            f"{'yes' if identical else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
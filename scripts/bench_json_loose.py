@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark json_loose candidate extraction against the previous implementation.
+
+The previous strategy 3 scanned from the first '{' and the first '[' only,
+counted brackets inside string literals and gave up after one failed
+candidate. This script runs both over prose-wrapped outputs (multi-candidate,
+braces inside strings, multi-megabyte) and prints time and success counts.
+
+Usage:
+    python scripts/bench_json_loose.py [--repeat 20] [--size-mb 2]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+
+from promptcontracts.core.parser import ParseError, json_loose  # noqa: E402
+
+
+def legacy_json_loose(text):
+    """Strategies 1-3 of json_loose before the single-pass scanner."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    for start_char, end_char in [("{", "}"), ("[", "]")]:
+        start_idx = text.find(start_char)
+        if start_idx != -1:
+            depth = 0
+            for i, char in enumerate(text[start_idx:], start=start_idx):
+                if char == start_char:
+                    depth += 1
+                elif char == end_char:
+                    depth -= 1
+                    if depth == 0:
+                        try:
+                            return json.loads(text[start_idx : i + 1])
+                        except json.JSONDecodeError:
+                            break
+
+    raise ParseError("Could not extract valid JSON")
+
+
+def workloads(size_mb):
+    """Return (name, text) pairs."""
+    record = {"id": 1, "note": "use {braces} and [brackets] freely", "tags": ["a", "b"]}
+    big = json.dumps({"items": [record] * int(size_mb * 1e6 / 80)})
+    return [
+        ("wrapped", f"Here you go: {json.dumps(record)} Hope that helps."),
+        ("brace-in-string", 'Answer: {"text": "close } early", "ok": true}'),
+        ("multi-candidate", 'Format is {key: value}; e.g. {"key": "value"}'),
+        ("array-then-object", 'Steps [1, 2] then {"done": true}'),
+        ("large-wrapped", f"Result follows.\n{big}\nEnd of result."),
+        ("large-unbalanced", "Partial: {" + big[:-1]),
+    ]
+
+
+def bench(func, text, repeat):
+    """Return (seconds per call, parsed or None)."""
+    result = None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        try:
+            result = func(text)
+        except (ParseError, RecursionError):
+            result = None
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--size-mb", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'workload':<20} {'before':>12} {'after':>12}   parsed before/after")
+    for name, text in workloads(args.size_mb):
+        t_before, r_before = bench(legacy_json_loose, text, args.repeat)
+        t_after, r_after = bench(json_loose, text, args.repeat)
+        print(
+            f"{name:<20} {t_before * 1e3:10.3f}ms {t_after * 1e3:10.3f}ms   "
+            f"{'yes' if r_before is not None else 'no':>3}/{'yes' if r_after is not None else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
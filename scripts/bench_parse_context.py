@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-sample JSON decoding with and without a shared ParseContext.
+
+Runs parse/repair followed by pc.check.json_valid over large JSON outputs
+(plain, fenced and wrapped in prose), once the way the runner did before
+ParseContext (each stage decoding on its own) and once with a shared
+ParseContext, and prints time plus json.loads/json.dumps calls and bytes.
+
+Usage:
+    python scripts/bench_parse_context.py [--outputs 300] [--items 2000]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import random  # noqa: E402
+import time  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+from promptcontracts.core.checks import json_valid_check  # noqa: E402
+from promptcontracts.core.parser import (  # noqa: E402
+    ParseContext,
+    json_loose,
+    strip_markdown_fences,
+)
+
+STEPS = ["strip_markdown_fences", "json_loose_parse"]
+
+
+def legacy_parse(raw_output):
+    """Parse/repair as ContractRunner._parse_output did before ParseContext."""
+    try:
+        return raw_output, json.loads(raw_output)
+    except json.JSONDecodeError:
+        pass
+
+    normalized = raw_output
+    stripped = strip_markdown_fences(normalized)
+    if stripped != normalized:
+        normalized = stripped
+        try:
+            return normalized, json.loads(normalized)
+        except json.JSONDecodeError:
+            pass
+
+    try:
+        parsed = json_loose(raw_output)
+        return json.dumps(parsed), parsed
+    except Exception:
+        return normalized, None
+
+
+def before(raw_output):
+    text, _ = legacy_parse(raw_output)
+    json_valid_check(text, {})
+
+
+def after(raw_output):
+    context = ParseContext.from_output(raw_output, expects_json=True, repair_steps=STEPS)
+    json_valid_check(context.text, {}, parse_context=context)
+
+
+def synthetic_outputs(count, items, seed=0):
+    """Generate large JSON outputs in plain, fenced and prose-wrapped form."""
+    rng = random.Random(seed)
+    outputs = []
+    for i in range(count):
+        doc = json.dumps(
+            {
+                "items": [
+                    {"id": j, "label": rng.choice(["a", "b", "c"]), "score": rng.random()}
+                    for j in range(items)
+                ]
+            }
+        )
+        shape = i % 3
+        if shape == 1:
+            doc = f"```json\n{doc}\n```"
+        elif shape == 2:
+            doc = f"Here is the result: {doc} Let me know if you need more."
+        outputs.append(doc)
+    return outputs
+
+
+def bench(label, func, outputs):
+    """Time func over outputs, counting json.loads/json.dumps calls and bytes."""
+    counts = {"loads": 0, "loads_bytes": 0, "dumps": 0}
+    real_loads, real_dumps = json.loads, json.dumps
+
+    def loads(s, *args, **kwargs):
+        counts["loads"] += 1
+        counts["loads_bytes"] += len(s)
+        return real_loads(s, *args, **kwargs)
+
+    def dumps(obj, *args, **kwargs):
+        counts["dumps"] += 1
+        return real_dumps(obj, *args, **kwargs)
+
+    with patch("json.loads", loads), patch("json.dumps", dumps):
+        start = time.perf_counter()
+        for raw_output in outputs:
+            func(raw_output)
+        elapsed = time.perf_counter() - start
+
+    n = len(outputs)
+    print(
+        f"{label:<8} {elapsed:8.3f}s  loads/sample {counts['loads'] / n:5.2f}  "
+        f"MB decoded {counts['loads_bytes'] / 1e6:8.1f}  dumps/sample {counts['dumps'] / n:5.2f}"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--outputs", type=int, default=300)
+    parser.add_argument("--items", type=int, default=2000)
+    args = parser.parse_args()
+
+    outputs = synthetic_outputs(args.outputs, args.items)
+    t_before = bench("before", before, outputs)
+    t_after = bench("after", after, outputs)
+    print(f"speedup  {t_before / t_after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
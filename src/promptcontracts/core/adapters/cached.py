@@ -0,0 +1,149 @@
+"""Caching adapter wrapper."""
+
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from ..cache import ResponseCache, make_cache_key
+from .base import AbstractAdapter, Capability, record_call_info
+
+
+class CachingAdapter(AbstractAdapter):
+    """
+    Serve generate calls from a ResponseCache before reaching the wrapped adapter.
+
+    Cache hits replay the latency recorded for the original generation so that
+    latency budgets stay comparable, and are flagged via record_call_info().
+    """
+
+    def __init__(self, adapter: AbstractAdapter, cache: ResponseCache, provider: str):
+        """
+        Wrap an adapter.
+
+        Args:
+            adapter: Adapter performing real generation on cache misses
+            cache: Shared response cache
+            provider: Provider identifier included in the cache key (e.g. "openai")
+        """
+        super().__init__(adapter.model, adapter.params)
+        self.adapter = adapter
+        self.cache = cache
+        self.provider = provider
+        # Resolved server URL, so targets on different servers never share entries
+        self.base_url = getattr(adapter, "base_url", None)
+
+    def capabilities(self) -> Capability:
+        """Return the wrapped adapter's capabilities."""
+        return self.adapter.capabilities()
+
+    def generate(
+        self, prompt: str, schema: dict[str, Any] | None = None, *, sample_index: int = 0
+    ) -> tuple[str, int]:
+        """
+        Generate a response, consulting the cache first.
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema for schema-guided generation
+            sample_index: Sample index within an N-sampling run (part of the cache key)
+
+        Returns:
+            (response_text, latency_ms)
+        """
+        key = make_cache_key(
+            prompt, self.provider, self.model, self.params, schema, sample_index, self.base_url
+        )
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            record_call_info(cache_hit=True)
+            return cached.response_text, cached.latency_ms
+
+        response_text, latency_ms = self.adapter.generate(prompt, schema=schema)
+        self.cache.put(key, response_text, latency_ms)
+        record_call_info(cache_hit=False)
+
+        return response_text, latency_ms
+
+    def generate_many(
+        self,
+        prompt: str,
+        n: int,
+        schema: dict[str, Any] | None = None,
+        *,
+        sample_indices: list[int] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Generate n responses, requesting only the cache misses from the wrapped adapter.
+
+        Per-choice hits are reported as ``cache_hits`` via record_call_info().
+
+        Args:
+            prompt: The prompt text
+            n: Number of responses
+            schema: Optional JSON schema for schema-guided generation
+            sample_indices: Sample index of each response (default: 0..n-1)
+
+        Returns:
+            List of n (response_text, latency_ms)
+        """
+        indices = sample_indices if sample_indices is not None else list(range(n))
+        keys = [
+            make_cache_key(
+                prompt, self.provider, self.model, self.params, schema, index, self.base_url
+            )
+            for index in indices
+        ]
+
+        results: list[tuple[str, float] | None] = [None] * n
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is None:
+                misses.append(i)
+            else:
+                results[i] = (cached.response_text, cached.latency_ms)
+
+        if misses:
+            generated = self.adapter.generate_many(prompt, len(misses), schema=schema)
+            for i, (response_text, latency_ms) in zip(misses, generated, strict=True):
+                self.cache.put(keys[i], response_text, latency_ms)
+                results[i] = (response_text, latency_ms)
+
+        record_call_info(cache_hits=[i not in misses for i in range(n)])
+        return results
+
+    def generate_stream(
+        self, prompt: str, schema: dict[str, Any] | None = None, *, sample_index: int = 0
+    ) -> Iterator[str]:
+        """
+        Stream a response, replaying cache hits as a single chunk.
+
+        A cache hit records the originally measured latency as the call's
+        ``cached_latency_ms``, since replaying the text takes no time.
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema for schema-guided generation
+            sample_index: Sample index within an N-sampling run (part of the cache key)
+
+        Yields:
+            Response text chunks
+        """
+        key = make_cache_key(
+            prompt, self.provider, self.model, self.params, schema, sample_index, self.base_url
+        )
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            record_call_info(cache_hit=True, cached_latency_ms=cached.latency_ms)
+            yield cached.response_text
+            return
+
+        start = time.perf_counter_ns()
+        parts = []
+        for chunk in self.adapter.generate_stream(prompt, schema=schema):
+            parts.append(chunk)
+            yield chunk
+        self.cache.put(key, "".join(parts), (time.perf_counter_ns() - start) / 1e6)
+        record_call_info(cache_hit=False)
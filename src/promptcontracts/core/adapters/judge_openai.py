@@ -7,8 +7,11 @@ Provides judge evaluation capabilities for semantic validation.
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ..transport import HTTPTransport, openai_base_url, shared_transport
+
 
 class JudgeAdapter:
     """Base class for judge adapters."""
@@ -26,6 +29,25 @@ class JudgeAdapter:
         """
         raise NotImplementedError
 
+    def judge_batch(
+        self, prompts: list[str], budget: dict[str, Any] | None = None, max_workers: int = 8
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate many prompts, issuing up to max_workers judge calls at once.
+
+        Args:
+            prompts: Judge prompts
+            budget: Optional budget constraints (applied to each call)
+            max_workers: Maximum concurrent judge calls
+
+        Returns:
+            One judge() result per prompt, in order
+        """
+        if len(prompts) <= 1:
+            return [self.judge(prompt, budget=budget) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as pool:
+            return list(pool.map(lambda prompt: self.judge(prompt, budget=budget), prompts))
+
 
 class OpenAIJudgeAdapter(JudgeAdapter):
     """
@@ -34,13 +56,19 @@ class OpenAIJudgeAdapter(JudgeAdapter):
     Requires: pip install openai
     """
 
-    def __init__(self, model: str = "gpt-3.5-turbo", api_key: str | None = None):
+    def __init__(
+        self,
+        model: str = "gpt-3.5-turbo",
+        api_key: str | None = None,
+        transport: HTTPTransport | None = None,
+    ):
         """
         Initialize OpenAI judge adapter.
 
         Args:
             model: OpenAI model name
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            transport: Connection pools to share (defaults to the process-wide one)
         """
         try:
             from openai import OpenAI
@@ -54,7 +82,12 @@ class OpenAIJudgeAdapter(JudgeAdapter):
             msg = "OpenAI API key not provided and OPENAI_API_KEY not set"
             raise ValueError(msg)
 
-        self.client = OpenAI(api_key=self.api_key)
+        base_url = openai_base_url()
+        self.client = OpenAI(
+            api_key=self.api_key,
+            base_url=base_url,
+            http_client=(transport or shared_transport()).client(base_url),
+        )
 
     def judge(self, prompt: str, budget: dict[str, Any] | None = None) -> dict[str, Any]:
         """
@@ -195,7 +228,7 @@ def create_judge_adapter(
     """
     if adapter_type == "openai":
         api_key = kwargs.get("api_key")
-        return OpenAIJudgeAdapter(model, api_key)
+        return OpenAIJudgeAdapter(model, api_key, transport=kwargs.get("transport"))
     elif adapter_type == "dummy":
         default_verdict = kwargs.get("default_verdict", True)
         return DummyJudgeAdapter(default_verdict)
@@ -1,19 +1,29 @@
 """Ollama adapter."""
 
 import time
+from collections.abc import Iterator
 from typing import Any
 
-import httpx
-
-from .base import AbstractAdapter, Capability
+from ...utils import jsoncodec
+from ..ratelimit import parse_rate_limit_headers
+from ..transport import HTTPTransport, shared_transport
+from .base import AbstractAdapter, Capability, record_call_info
 
 
 class OllamaAdapter(AbstractAdapter):
     """Adapter for Ollama models."""
 
-    def __init__(self, model: str, params: dict = None, base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model: str,
+        params: dict = None,
+        base_url: str = "http://localhost:11434",
+        transport: HTTPTransport | None = None,
+    ):
         super().__init__(model, params)
         self.base_url = base_url
+        # Pooled keep-alive client shared with every adapter for this base URL
+        self.client = (transport or shared_transport()).client(base_url)
 
     def capabilities(self) -> Capability:
         """Return Ollama capabilities (no schema enforcement)."""
@@ -25,27 +35,15 @@ class OllamaAdapter(AbstractAdapter):
             supports_temperature=True,
             supports_top_p=True,
             max_tokens=None,
+            streaming=True,
         )
 
-    def generate(self, prompt: str, schema: dict[str, Any] | None = None) -> tuple[str, int]:
-        """
-        Generate response using Ollama API.
-
-        Args:
-            prompt: The prompt text
-            schema: Optional JSON schema (ignored by Ollama)
-
-        Returns:
-            (response_text, latency_ms)
-        """
-        # Note: Ollama doesn't support schema-guided generation, so schema is ignored
-        start_time = time.time()
-
-        # Build request payload
+    def _payload(self, prompt: str, stream: bool) -> dict[str, Any]:
+        """Build the /api/generate request payload."""
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
         }
 
         # Add optional parameters
@@ -60,15 +58,69 @@ class OllamaAdapter(AbstractAdapter):
         if options:
             payload["options"] = options
 
-        # Make request
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(f"{self.base_url}/api/generate", json=payload)
-            response.raise_for_status()
-            data = response.json()
+        return payload
+
+    @staticmethod
+    def _record_usage(headers, data: dict[str, Any]):
+        """Report usage (and rate limit headers from proxies) for rate limiting."""
+        call_info = {"rate_limit": parse_rate_limit_headers(headers)}
+        if "eval_count" in data:
+            call_info["usage_tokens"] = data.get("prompt_eval_count", 0) + data["eval_count"]
+            call_info["output_tokens"] = data["eval_count"]
+        # Only prompt tokens missing from the KV cache are evaluated, so a
+        # reused prefix shows up as fewer tokens and less prompt eval time
+        if "prompt_eval_count" in data:
+            call_info["prompt_eval_tokens"] = data["prompt_eval_count"]
+        if "prompt_eval_duration" in data:
+            call_info["prompt_eval_ms"] = data["prompt_eval_duration"] / 1e6
+        record_call_info(**call_info)
+
+    def generate(self, prompt: str, schema: dict[str, Any] | None = None) -> tuple[str, int]:
+        """
+        Generate response using Ollama API.
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema (ignored by Ollama)
+
+        Returns:
+            (response_text, latency_ms)
+        """
+        # Note: Ollama doesn't support schema-guided generation, so schema is ignored
+        start_time = time.time()
+
+        # Make request over the shared connection pool
+        response = self.client.post("/api/generate", json=self._payload(prompt, stream=False))
+        response.raise_for_status()
+        data = response.json()
 
         end_time = time.time()
         latency_ms = int((end_time - start_time) * 1000)
 
         response_text = data.get("response", "")
+        self._record_usage(response.headers, data)
 
         return response_text, latency_ms
+
+    def generate_stream(self, prompt: str, schema: dict[str, Any] | None = None) -> Iterator[str]:
+        """
+        Stream a response from the Ollama API (``stream: true``, NDJSON lines).
+
+        Args:
+            prompt: The prompt text
+            schema: Optional JSON schema (ignored by Ollama)
+
+        Yields:
+            Response text chunks
+        """
+        payload = self._payload(prompt, stream=True)
+        with self.client.stream("POST", "/api/generate", json=payload) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = jsoncodec.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    self._record_usage(response.headers, data)
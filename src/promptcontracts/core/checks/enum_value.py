@@ -1,68 +1,174 @@
 """Check: Enum value validation."""
 
+from collections.abc import Callable
 from typing import Any
 
-from jsonpath_ng import parse
+from ...utils.jsonpath import compile_jsonpath
 
 
-def enum_check(
-    response_text: str, check_spec: dict[str, Any], parsed_json: Any = None, **kwargs
-) -> tuple[bool, str, Any]:
+def compile_enum(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str, Any]]:
     """
-    Validate that a field (selected via JSONPath) has an allowed value.
+    Compile an enum check: JSONPath parsed once, allowed values frozen into sets.
 
     Args:
-        response_text: Raw response text
         check_spec: Check configuration with:
             - 'field' (JSONPath)
             - 'allowed' array
             - 'case_insensitive' (optional bool, default False)
-        parsed_json: Pre-parsed JSON object
 
     Returns:
-        (passed, message, None)
+        Evaluator taking (response_text, parsed_json=None, **kwargs) and
+        returning (passed, message, None)
     """
-    if parsed_json is None:
-        return False, "Cannot check enum: response is not valid JSON", None
-
     field_path = check_spec.get("field", "$")
     allowed_values = check_spec.get("allowed", [])
     case_insensitive = check_spec.get("case_insensitive", False)
 
     try:
-        jsonpath_expr = parse(field_path)
-        matches = jsonpath_expr.find(parsed_json)
-
-        if not matches:
-            return False, f"Field '{field_path}' not found in response", None
-
-        # Check first match (typically there's only one)
-        actual_value = matches[0].value
-
-        # Perform comparison
-        if case_insensitive and isinstance(actual_value, str):
-            # Case-insensitive comparison
-            actual_lower = actual_value.lower()
-            allowed_lower = [v.lower() if isinstance(v, str) else v for v in allowed_values]
-
-            if actual_lower in allowed_lower:
-                return (
-                    True,
-                    f"Value '{actual_value}' is in allowed values {allowed_values} (case-insensitive)",
-                    None,
-                )
-            else:
-                return (
-                    False,
-                    f"Value '{actual_value}' not in allowed values {allowed_values} (case-insensitive)",
-                    None,
-                )
-        else:
-            # Case-sensitive comparison
-            if actual_value in allowed_values:
-                return True, f"Value '{actual_value}' is in allowed values {allowed_values}", None
+        find = compile_jsonpath(field_path)
+        path_error = None
+    except Exception as e:
+        find = None
+        path_error = f"Error evaluating JSONPath '{field_path}': {e}"
+
+    allowed_lower = [v.lower() if isinstance(v, str) else v for v in allowed_values]
+    allowed_set = _frozen(allowed_values)
+    allowed_lower_set = _frozen(allowed_lower)
+
+    def evaluate(response_text: str, parsed_json: Any = None, **kwargs) -> tuple[bool, str, Any]:
+        if parsed_json is None:
+            return False, "Cannot check enum: response is not valid JSON", None
+        if path_error:
+            return False, path_error, None
+
+        try:
+            matches = find(parsed_json)
+
+            if not matches:
+                return False, f"Field '{field_path}' not found in response", None
+
+            # Check first match (typically there's only one)
+            actual_value = matches[0]
+
+            # Perform comparison
+            if case_insensitive and isinstance(actual_value, str):
+                # Case-insensitive comparison
+                actual_lower = actual_value.lower()
+
+                if _contains(allowed_lower_set, allowed_lower, actual_lower):
+                    return (
+                        True,
+                        f"Value '{actual_value}' is in allowed values {allowed_values} (case-insensitive)",
+                        None,
+                    )
+                else:
+                    return (
+                        False,
+                        f"Value '{actual_value}' not in allowed values {allowed_values} (case-insensitive)",
+                        None,
+                    )
             else:
-                return False, f"Value '{actual_value}' not in allowed values {allowed_values}", None
+                # Case-sensitive comparison
+                if _contains(allowed_set, allowed_values, actual_value):
+                    return (
+                        True,
+                        f"Value '{actual_value}' is in allowed values {allowed_values}",
+                        None,
+                    )
+                else:
+                    return (
+                        False,
+                        f"Value '{actual_value}' not in allowed values {allowed_values}",
+                        None,
+                    )
 
-    except Exception as e:
-        return False, f"Error evaluating JSONPath '{field_path}': {e}", None
+        except Exception as e:
+            return False, f"Error evaluating JSONPath '{field_path}': {e}", None
+
+    return evaluate
+
+
+def compile_enum_batch(check_spec: dict[str, Any]) -> Callable[..., list[bool | str]] | None:
+    """
+    Compile an enum check over a column of parsed outputs using set membership.
+
+    Args:
+        check_spec: Check configuration (see compile_enum)
+
+    Returns:
+        Evaluator taking (outputs, parsed, **kwargs) and returning True or the
+        failure message per output; None if the spec needs the per-output check
+        (invalid JSONPath or unhashable allowed values)
+    """
+    try:
+        find = compile_jsonpath(check_spec.get("field", "$"))
+    except Exception:
+        return None
+
+    case_insensitive = check_spec.get("case_insensitive", False)
+    allowed_values = check_spec.get("allowed", [])
+    allowed_set = _frozen(
+        [v.lower() if isinstance(v, str) else v for v in allowed_values]
+        if case_insensitive
+        else allowed_values
+    )
+    if allowed_set is None:
+        return None
+
+    evaluate_one = compile_enum(check_spec)
+
+    def evaluate(outputs: list[str], parsed: list[Any], **kwargs) -> list[bool | str]:
+        results = []
+        for text, parsed_json in zip(outputs, parsed, strict=True):
+            matches = find(parsed_json) if parsed_json is not None else None
+            if matches:
+                value = matches[0]
+                if case_insensitive and isinstance(value, str):
+                    value = value.lower()
+                if isinstance(value, str | int | float | bool) and value in allowed_set:
+                    results.append(True)
+                    continue
+            # Failures and unusual values take the per-output path for its message
+            passed, message, _ = evaluate_one(text, parsed_json=parsed_json)
+            results.append(True if passed else message)
+        return results
+
+    return evaluate
+
+
+def _frozen(values: list[Any]) -> frozenset | None:
+    """Freeze values into a set for O(1) lookups (None if some are unhashable)."""
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
+def _contains(value_set: frozenset | None, values: list[Any], value: Any) -> bool:
+    """Membership test using the frozen set when possible, with list semantics."""
+    if value_set is not None:
+        try:
+            return value in value_set
+        except TypeError:
+            pass
+    return value in values
+
+
+def enum_check(
+    response_text: str, check_spec: dict[str, Any], parsed_json: Any = None, **kwargs
+) -> tuple[bool, str, Any]:
+    """
+    Validate that a field (selected via JSONPath) has an allowed value.
+
+    Args:
+        response_text: Raw response text
+        check_spec: Check configuration with:
+            - 'field' (JSONPath)
+            - 'allowed' array
+            - 'case_insensitive' (optional bool, default False)
+        parsed_json: Pre-parsed JSON object
+
+    Returns:
+        (passed, message, None)
+    """
+    return compile_enum(check_spec)(response_text, parsed_json=parsed_json)
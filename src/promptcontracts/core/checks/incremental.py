@@ -0,0 +1,209 @@
+"""
+Incremental check evaluators for streamed responses.
+
+Some checks are decided before a response is complete: a forbidden pattern
+or an exceeded token budget stays a failure whatever follows, and a found
+option stays found. Incremental checks consume text chunks as they arrive and
+report PASS, FAIL or UNDECIDED so the runner can abort a generation once a
+failure is final.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Literal
+
+from ...utils import jsoncodec
+
+Verdict = Literal["PASS", "FAIL", "UNDECIDED"]
+
+# Pattern constructs whose match on a prefix may disappear once more text arrives
+_END_SENSITIVE = re.compile(r"\(\?[=!]|(?<!\\)\$|\\Z")
+
+_JSON_START = set('{["-0123456789tfn')
+_CLOSERS = {"}": "{", "]": "["}
+
+
+class IncrementalCheck(ABC):
+    """
+    Check that consumes a response chunk by chunk.
+
+    feed() returns the verdict on the text so far and may only return PASS or
+    FAIL once no continuation can change it; finish() gives the verdict on the
+    complete response.
+    """
+
+    def __init__(self, check_spec: dict[str, Any]):
+        """
+        Initialize from an ES check spec.
+
+        Args:
+            check_spec: Check configuration
+        """
+        self.check_spec = check_spec
+        self.text = ""
+        self.verdict: Verdict = "UNDECIDED"
+        self.message = ""
+
+    def feed(self, chunk: str) -> Verdict:
+        """Consume a chunk and return the verdict so far."""
+        if self.verdict == "UNDECIDED":
+            self.text += chunk
+            self._update(chunk)
+        return self.verdict
+
+    def finish(self) -> Verdict:
+        """Return the verdict on the complete response."""
+        if self.verdict == "UNDECIDED":
+            self._finish()
+        return self.verdict
+
+    def _decide(self, verdict: Verdict, message: str):
+        self.verdict = verdict
+        self.message = message
+
+    @abstractmethod
+    def _update(self, chunk: str):
+        """Update state after text was appended; call _decide() once final."""
+
+    @abstractmethod
+    def _finish(self):
+        """Decide at end of stream."""
+
+
+class RegexAbsentIncremental(IncrementalCheck):
+    """
+    pc.check.regex_absent: fails as soon as the forbidden pattern appears.
+
+    An invalid pattern stays UNDECIDED; the final check reports it.
+    """
+
+    def __init__(self, check_spec: dict[str, Any]):
+        super().__init__(check_spec)
+        pattern = check_spec.get("pattern", "")
+        self.invalid = False
+        try:
+            self.pattern = re.compile(pattern) if pattern else None
+        except re.error:
+            self.pattern = None
+            self.invalid = True
+        # Anchors and lookaheads can match a prefix but not the whole text
+        self.prefix_decidable = self.pattern is not None and not _END_SENSITIVE.search(pattern)
+
+    def _update(self, chunk: str):
+        if not self.prefix_decidable:
+            return
+        match = self.pattern.search(self.text)
+        # A match touching the end may still depend on the next character (\b)
+        if match and match.end() < len(self.text):
+            self._fail()
+
+    def _fail(self):
+        self._decide("FAIL", f"Forbidden pattern '{self.pattern.pattern}' found in response")
+
+    def _finish(self):
+        if self.invalid:
+            return
+        if self.pattern is not None and self.pattern.search(self.text):
+            self._fail()
+        else:
+            self._decide("PASS", "Forbidden pattern not found (as expected)")
+
+
+class TokenBudgetIncremental(IncrementalCheck):
+    """pc.check.token_budget: fails once the word count exceeds max_out."""
+
+    def __init__(self, check_spec: dict[str, Any]):
+        super().__init__(check_spec)
+        self.max_tokens = check_spec.get("max_out", 0)
+
+    def _update(self, chunk: str):
+        # Appending text never lowers the whitespace word count
+        approx_tokens = len(self.text.split())
+        if approx_tokens > self.max_tokens:
+            self._decide("FAIL", f"Token count ~{approx_tokens} > {self.max_tokens}")
+
+    def _finish(self):
+        approx_tokens = len(self.text.split())
+        if approx_tokens > self.max_tokens:
+            self._decide("FAIL", f"Token count ~{approx_tokens} > {self.max_tokens}")
+        else:
+            self._decide("PASS", f"Token count ~{approx_tokens} <= {self.max_tokens}")
+
+
+class ContainsAnyIncremental(IncrementalCheck):
+    """pc.check.contains_any: passes as soon as one option appears."""
+
+    def __init__(self, check_spec: dict[str, Any]):
+        super().__init__(check_spec)
+        self.case_sensitive = check_spec.get("case_sensitive", True)
+        options = check_spec.get("options", [])
+        self.options = [str(o) if self.case_sensitive else str(o).lower() for o in options]
+
+    def _update(self, chunk: str):
+        text = self.text if self.case_sensitive else self.text.lower()
+        for option in self.options:
+            if option in text:
+                self._decide("PASS", f"Found option: '{option}'")
+                return
+
+    def _finish(self):
+        self._update("")
+        if self.verdict == "UNDECIDED":
+            self._decide("FAIL", f"None of the {len(self.options)} options found in response")
+
+
+class JsonValidIncremental(IncrementalCheck):
+    """
+    pc.check.json_valid: fails once the text can no longer be completed to JSON.
+
+    Tracks string state and bracket nesting; a wrong first character, a
+    mismatched closing bracket or text after the top-level value is final.
+    """
+
+    def __init__(self, check_spec: dict[str, Any]):
+        super().__init__(check_spec)
+        self.stack: list[str] = []
+        self.started = False
+        self.closed = False
+        self.in_string = False
+        self.escaped = False
+
+    def _update(self, chunk: str):
+        for char in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    self.closed = not self.stack
+                continue
+
+            if char.isspace():
+                continue
+            if self.closed:
+                self._decide("FAIL", "Response is not valid JSON: extra data after value")
+                return
+            if not self.started:
+                self.started = True
+                if char not in _JSON_START and char != '"':
+                    self._decide("FAIL", f"Response is not valid JSON: starts with {char!r}")
+                    return
+
+            if char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.stack.append(char)
+            elif char in _CLOSERS:
+                if not self.stack or self.stack.pop() != _CLOSERS[char]:
+                    self._decide("FAIL", f"Response is not valid JSON: unexpected {char!r}")
+                    return
+                self.closed = not self.stack
+
+    def _finish(self):
+        try:
+            jsoncodec.loads(self.text)
+            self._decide("PASS", "Response is valid JSON")
+        except jsoncodec.JSONDecodeError as e:
+            self._decide("FAIL", f"Response is not valid JSON: {e}")
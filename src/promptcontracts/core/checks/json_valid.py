@@ -1,8 +1,9 @@
 """Check: JSON validity."""
 
-import json
 from typing import Any
 
+from ...utils import jsoncodec
+
 
 def json_valid_check(
     response_text: str, check_spec: dict[str, Any], **kwargs
@@ -10,11 +11,21 @@ def json_valid_check(
     """
     Validate that response is parseable JSON.
 
+    Reuses the decode result of a ParseContext (``parse_context`` kwarg) for
+    the same text instead of parsing again.
+
     Returns:
         (passed, message, parsed_json or None)
     """
+    context = kwargs.get("parse_context")
+    if context is not None and context.text == response_text:
+        if context.text_is_json:
+            return True, "Response is valid JSON", context.parsed
+        if context.text_error is not None:
+            return False, f"Response is not valid JSON: {context.text_error}", None
+
     try:
-        parsed = json.loads(response_text)
+        parsed = jsoncodec.loads(response_text)
         return True, "Response is valid JSON", parsed
-    except json.JSONDecodeError as e:
+    except jsoncodec.JSONDecodeError as e:
         return False, f"Response is not valid JSON: {e}", None
@@ -5,6 +5,7 @@ Uses an LLM to evaluate response quality against criteria with budget tracking
 and configurable pass/fail policies.
 """
 
+from collections.abc import Callable
 from typing import Any, Literal
 
 PassWhenPolicy = Literal["all", "majority", "any"]
@@ -46,30 +47,94 @@ def judge_check(response_text: str, check_spec: dict[str, Any], **kwargs) -> tup
             budget=budget,
         )
 
-        # Extract verdict
-        verdict = judgment_result.get("verdict", False)
-        explanation = judgment_result.get("explanation", "No explanation provided")
-        tokens_used = judgment_result.get("tokens_used", 0)
-        latency_ms = judgment_result.get("latency_ms", 0)
+        return _judgment_outcome(judgment_result, budget, pass_when)
 
-        # Check budget compliance
-        budget_ok = _check_budget(budget, tokens_used, latency_ms)
-        if not budget_ok:
-            return (
-                False,
-                f"Judge exceeded budget: {tokens_used} tokens, {latency_ms}ms",
-            )
+    except Exception as e:
+        return False, f"Judge check failed with error: {e}"
 
-        # Apply pass_when policy
-        passed = _apply_pass_when_policy(verdict, pass_when)
 
-        if passed:
-            return True, f"Judge passed: {explanation} ({tokens_used} tokens)"
-        else:
-            return False, f"Judge failed: {explanation} ({tokens_used} tokens)"
+def compile_judge_batch(check_spec: dict[str, Any]) -> Callable[..., list[bool | str]]:
+    """
+    Compile a judge check evaluating many responses with one batched judge call.
 
-    except Exception as e:
-        return False, f"Judge check failed with error: {e}"
+    Uses the judge adapter's judge_batch() when available (concurrent
+    requests), otherwise judges responses one by one.
+
+    Args:
+        check_spec: Check specification (see judge_check)
+
+    Returns:
+        Evaluator taking (outputs, parsed=None, judge_adapter=None, **kwargs)
+        and returning True or the failure message per output
+    """
+    criteria = check_spec.get("criteria")
+    pass_when = check_spec.get("pass_when", "all")
+    budget = check_spec.get("budget", {})
+
+    def evaluate(
+        outputs: list[str], parsed: list[Any] | None = None, judge_adapter: Any = None, **kwargs
+    ) -> list[bool | str]:
+        if not criteria:
+            return ["No criteria specified for judge check"] * len(outputs)
+        if not judge_adapter:
+            return ["Judge check requires judge_adapter in kwargs"] * len(outputs)
+
+        prompts = [_build_judge_prompt(criteria, text) for text in outputs]
+        try:
+            if hasattr(judge_adapter, "judge_batch"):
+                judgments = judge_adapter.judge_batch(prompts, budget=budget)
+            else:
+                judgments = [judge_adapter.judge(prompt=p, budget=budget) for p in prompts]
+        except Exception as e:
+            return [f"Judge check failed with error: {e}"] * len(outputs)
+
+        results = []
+        for judgment_result in judgments:
+            try:
+                passed, message = _judgment_outcome(judgment_result, budget, pass_when)
+            except Exception as e:
+                passed, message = False, f"Judge check failed with error: {e}"
+            results.append(True if passed else message)
+        return results
+
+    return evaluate
+
+
+def _judgment_outcome(
+    judgment_result: dict[str, Any], budget: dict[str, Any], pass_when: PassWhenPolicy
+) -> tuple[bool, str]:
+    """
+    Turn a judge adapter result into (passed, message).
+
+    Args:
+        judgment_result: Result of JudgeAdapter.judge()
+        budget: Budget specification
+        pass_when: Pass policy
+
+    Returns:
+        Tuple of (passed, message)
+    """
+    # Extract verdict
+    verdict = judgment_result.get("verdict", False)
+    explanation = judgment_result.get("explanation", "No explanation provided")
+    tokens_used = judgment_result.get("tokens_used", 0)
+    latency_ms = judgment_result.get("latency_ms", 0)
+
+    # Check budget compliance
+    budget_ok = _check_budget(budget, tokens_used, latency_ms)
+    if not budget_ok:
+        return (
+            False,
+            f"Judge exceeded budget: {tokens_used} tokens, {latency_ms}ms",
+        )
+
+    # Apply pass_when policy
+    passed = _apply_pass_when_policy(verdict, pass_when)
+
+    if passed:
+        return True, f"Judge passed: {explanation} ({tokens_used} tokens)"
+    else:
+        return False, f"Judge failed: {explanation} ({tokens_used} tokens)"
 
 
 def _build_judge_prompt(criteria: str, response: str) -> str:
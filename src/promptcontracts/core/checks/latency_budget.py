@@ -33,3 +33,59 @@ def latency_budget_check(
         return True, f"p95 latency {p95_actual:.0f}ms <= {p95_threshold}ms", p95_actual
     else:
         return False, f"p95 latency {p95_actual:.0f}ms > {p95_threshold}ms", p95_actual
+
+
+def ttft_budget_check(
+    response_text: str, check_spec: dict[str, Any], all_ttfts: list[float] = None, **kwargs
+) -> tuple[bool, str, Any]:
+    """
+    Validate that p95 time-to-first-token is within budget.
+
+    Evaluated after all fixtures, over streamed samples only.
+
+    Args:
+        response_text: Raw response text (not used directly)
+        check_spec: Check configuration with 'p95_ms' number
+        all_ttfts: Time-to-first-token of every streamed sample in milliseconds
+
+    Returns:
+        (passed, message, p95_ttft)
+    """
+    if not all_ttfts:
+        return False, "No time-to-first-token data available (is streaming enabled?)", None
+
+    p95_threshold = check_spec.get("p95_ms", 0)
+    p95_actual = np.percentile(all_ttfts, 95)
+
+    if p95_actual <= p95_threshold:
+        return True, f"p95 TTFT {p95_actual:.0f}ms <= {p95_threshold}ms", p95_actual
+    else:
+        return False, f"p95 TTFT {p95_actual:.0f}ms > {p95_threshold}ms", p95_actual
+
+
+def throughput_budget_check(
+    response_text: str, check_spec: dict[str, Any], all_throughputs: list[float] = None, **kwargs
+) -> tuple[bool, str, Any]:
+    """
+    Validate that decode throughput stays above a floor for 95% of samples.
+
+    Evaluated after all fixtures, over streamed samples only.
+
+    Args:
+        response_text: Raw response text (not used directly)
+        check_spec: Check configuration with 'min_tokens_per_s' number
+        all_throughputs: Output tokens/sec of every streamed sample
+
+    Returns:
+        (passed, message, p5_throughput)
+    """
+    if not all_throughputs:
+        return False, "No throughput data available (is streaming enabled?)", None
+
+    floor = check_spec.get("min_tokens_per_s", 0)
+    p5_actual = np.percentile(all_throughputs, 5)
+
+    if p5_actual >= floor:
+        return True, f"p5 throughput {p5_actual:.1f} tok/s >= {floor} tok/s", p5_actual
+    else:
+        return False, f"p5 throughput {p5_actual:.1f} tok/s < {floor} tok/s", p5_actual
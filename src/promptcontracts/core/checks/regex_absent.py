@@ -1,31 +1,83 @@
 """Check: Regex pattern absence."""
 
 import re
+from collections.abc import Callable
 from typing import Any
 
 
-def regex_absent_check(
-    response_text: str, check_spec: dict[str, Any], **kwargs
-) -> tuple[bool, str, Any]:
+def compile_regex_absent(check_spec: dict[str, Any]) -> Callable[..., tuple[bool, str, Any]]:
     """
-    Validate that a regex pattern is NOT present in the response.
+    Compile a regex_absent check: the pattern is compiled once.
 
     Args:
-        response_text: Raw response text
         check_spec: Check configuration with 'pattern' string
 
     Returns:
-        (passed, message, None)
+        Evaluator taking (response_text, **kwargs) and returning (passed, message, None)
     """
     pattern = check_spec.get("pattern", "")
 
     if not pattern:
-        return True, "No pattern specified", None
+        return lambda response_text, **kwargs: (True, "No pattern specified", None)
 
     try:
-        if re.search(pattern, response_text):
-            return False, f"Forbidden pattern '{pattern}' found in response", None
-        else:
-            return True, f"Pattern '{pattern}' not found (as expected)", None
+        regex = re.compile(pattern)
     except re.error as e:
-        return False, f"Invalid regex pattern '{pattern}': {e}", None
+        error = f"Invalid regex pattern '{pattern}': {e}"
+        return lambda response_text, **kwargs: (False, error, None)
+
+    found = f"Forbidden pattern '{pattern}' found in response"
+    absent = f"Pattern '{pattern}' not found (as expected)"
+
+    def evaluate(response_text: str, **kwargs) -> tuple[bool, str, Any]:
+        if regex.search(response_text):
+            return False, found, None
+        return True, absent, None
+
+    return evaluate
+
+
+def compile_regex_absent_batch(
+    check_spec: dict[str, Any],
+) -> Callable[..., list[bool | str]] | None:
+    """
+    Compile a regex_absent check scanning a column of outputs.
+
+    Args:
+        check_spec: Check configuration with 'pattern' string
+
+    Returns:
+        Evaluator taking (outputs, **kwargs) and returning True or the failure
+        message per output; None if the spec needs the per-output check
+        (missing or invalid pattern)
+    """
+    pattern = check_spec.get("pattern", "")
+    try:
+        search = re.compile(pattern).search if pattern else None
+    except re.error:
+        return None
+    if search is None:
+        return None
+
+    found = f"Forbidden pattern '{pattern}' found in response"
+
+    def evaluate(outputs: list[str], **kwargs) -> list[bool | str]:
+        return [found if search(text) else True for text in outputs]
+
+    return evaluate
+
+
+def regex_absent_check(
+    response_text: str, check_spec: dict[str, Any], **kwargs
+) -> tuple[bool, str, Any]:
+    """
+    Validate that a regex pattern is NOT present in the response.
+
+    Args:
+        response_text: Raw response text
+        check_spec: Check configuration with 'pattern' string
+
+    Returns:
+        (passed, message, None)
+    """
+    return compile_regex_absent(check_spec)(response_text)
@@ -0,0 +1,412 @@
+"""
+Asynchronous execution engine primitives.
+
+Provides the ``execution.concurrency`` configuration and a limiter that admits
+blocking ``generate`` calls under global, per-target and per-fixture bounds.
+With ``concurrency.adaptive`` the per-target bound is set by an AIMD controller
+instead of being fixed.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class AdaptiveConfig:
+    """Settings of the adaptive per-target controller (``concurrency.adaptive``)."""
+
+    initial: int = 1
+    min_limit: int = 1
+    max_limit: int | None = None
+    latency_tolerance: float = 2.0
+    backoff: float = 0.5
+
+    @classmethod
+    def from_dict(cls, cfg: dict[str, Any] | bool | None) -> "AdaptiveConfig | None":
+        """
+        Build config from ``concurrency.adaptive`` (true or a settings dict).
+
+        Returns:
+            AdaptiveConfig, or None when adaptation is disabled
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if not cfg:
+            return None
+        if cfg is True:
+            cfg = {}
+        if not cfg.get("enabled", True):
+            return None
+
+        config = cls(
+            initial=cfg.get("initial", 1),
+            min_limit=cfg.get("min", 1),
+            max_limit=cfg.get("max"),
+            latency_tolerance=cfg.get("latency_tolerance", 2.0),
+            backoff=cfg.get("backoff", 0.5),
+        )
+
+        if config.min_limit < 1 or config.initial < config.min_limit:
+            raise ValueError("concurrency.adaptive needs 1 <= min <= initial")
+        if config.max_limit is not None and config.max_limit < config.initial:
+            raise ValueError("concurrency.adaptive.max must be >= initial")
+        if config.latency_tolerance <= 1:
+            raise ValueError("concurrency.adaptive.latency_tolerance must be > 1")
+        if not 0 < config.backoff < 1:
+            raise ValueError("concurrency.adaptive.backoff must be between 0 and 1")
+
+        return config
+
+
+@dataclass(frozen=True)
+class ConcurrencyConfig:
+    """Concurrency limits for in-flight ``generate`` calls."""
+
+    global_limit: int = 1
+    per_target: int | None = None
+    per_fixture: int | None = None
+    adaptive: AdaptiveConfig | None = None
+
+    @classmethod
+    def from_dict(cls, cfg: dict[str, Any] | None) -> "ConcurrencyConfig":
+        """
+        Build config from an EP ``execution.concurrency`` block.
+
+        Missing per-target and per-fixture limits inherit the next wider limit.
+
+        Args:
+            cfg: Dict with optional 'global', 'per_target', 'per_fixture' keys
+
+        Returns:
+            ConcurrencyConfig instance
+        """
+        cfg = cfg or {}
+        global_limit = cfg.get("global", 1)
+        per_target = cfg.get("per_target")
+        per_fixture = cfg.get("per_fixture")
+
+        for name, value in [
+            ("global", global_limit),
+            ("per_target", per_target),
+            ("per_fixture", per_fixture),
+        ]:
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValueError(f"concurrency.{name} must be a positive integer, got {value!r}")
+
+        return cls(
+            global_limit=global_limit,
+            per_target=per_target,
+            per_fixture=per_fixture,
+            adaptive=AdaptiveConfig.from_dict(cfg.get("adaptive")),
+        )
+
+    @property
+    def target_limit(self) -> int:
+        """Effective per-target limit."""
+        return min(self.per_target or self.global_limit, self.global_limit)
+
+    @property
+    def fixture_limit(self) -> int:
+        """Effective per-fixture limit."""
+        return min(self.per_fixture or self.target_limit, self.target_limit)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return effective limits as a dict."""
+        limits: dict[str, Any] = {
+            "global": self.global_limit,
+            "per_target": self.target_limit,
+            "per_fixture": self.fixture_limit,
+        }
+        if self.adaptive:
+            limits["adaptive"] = True
+        return limits
+
+
+class AdaptiveLimit:
+    """
+    AIMD controller for the in-flight calls of one target.
+
+    Starts in slow start (+1 per success, doubling per round trip). Once the
+    first congestion signal arrives it grows by ~1 per round trip while the
+    smoothed latency stays within ``latency_tolerance`` x the baseline (the
+    minimum observed latency). Latency inflation shrinks the limit by 1
+    (Vegas-style), and errors or timeouts shrink it by ``backoff``. Each
+    decrease applies at most once per round trip, so a burst of failures from
+    one window counts as a single signal.
+    """
+
+    SMOOTHING = 0.2
+    BASELINE_WINDOW = 200
+
+    def __init__(self, config: AdaptiveConfig, ceiling: int):
+        """
+        Initialize controller.
+
+        Args:
+            config: Adaptive settings
+            ceiling: Upper bound from the fixed limits (per_target/global)
+        """
+        self.config = config
+        self.max_limit = min(config.max_limit or ceiling, ceiling)
+        self.limit = float(min(config.initial, self.max_limit))
+        self.slow_start = True
+        self.in_flight = 0
+
+        self.baseline: float | None = None
+        self.smoothed: float | None = None
+        self._window_min = float("inf")
+        self._window_count = 0
+        self._last_decrease = float("-inf")
+
+        self.peak_limit = self.limit
+        self.peak_in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self.errors = 0
+        self._busy_area = 0.0
+        self._started = time.perf_counter()
+        self._last_change = self._started
+        self._condition = asyncio.Condition()
+
+    def _track_in_flight(self, delta: int):
+        now = time.perf_counter()
+        self._busy_area += self.in_flight * (now - self._last_change)
+        self._last_change = now
+        self.in_flight += delta
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    async def acquire(self):
+        """Wait until another call fits under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < max(1, int(self.limit)))
+            self._track_in_flight(+1)
+
+    async def release(self):
+        """Return a call slot."""
+        async with self._condition:
+            self._track_in_flight(-1)
+            self._condition.notify_all()
+
+    def _can_decrease(self, now: float) -> bool:
+        return now - self._last_decrease >= (self.smoothed or 0.0)
+
+    def _decrease(self, new_limit: float, now: float):
+        self.limit = max(float(self.config.min_limit), new_limit)
+        self.slow_start = False
+        self.decreases += 1
+        self._last_decrease = now
+
+    def on_success(self, latency_s: float):
+        """Feed back a successful call's latency."""
+        self._window_min = min(self._window_min, latency_s)
+        self._window_count += 1
+        if self.baseline is None or latency_s < self.baseline:
+            self.baseline = latency_s
+        elif self._window_count >= self.BASELINE_WINDOW:
+            # Let the baseline follow a provider that got slower for everyone
+            self.baseline = self._window_min
+        if self._window_count >= self.BASELINE_WINDOW:
+            self._window_min = float("inf")
+            self._window_count = 0
+
+        if self.smoothed is None:
+            self.smoothed = latency_s
+        else:
+            self.smoothed += self.SMOOTHING * (latency_s - self.smoothed)
+
+        now = time.perf_counter()
+        if self.smoothed > self.baseline * self.config.latency_tolerance:
+            if self._can_decrease(now):
+                self._decrease(self.limit - 1, now)
+            return
+
+        if self.limit < self.max_limit:
+            step = 1.0 if self.slow_start else 1.0 / self.limit
+            self.limit = min(float(self.max_limit), self.limit + step)
+            self.peak_limit = max(self.peak_limit, self.limit)
+            self.increases += 1
+
+    def on_error(self):
+        """Feed back a failed or timed-out call."""
+        self.errors += 1
+        now = time.perf_counter()
+        if self._can_decrease(now):
+            self._decrease(self.limit * self.config.backoff, now)
+
+    def stats(self) -> dict[str, Any]:
+        """Return controller state and the concurrency actually achieved."""
+        now = time.perf_counter()
+        busy_area = self._busy_area + self.in_flight * (now - self._last_change)
+        elapsed = now - self._started
+        return {
+            "limit": round(self.limit, 2),
+            "max_limit": self.max_limit,
+            "peak_limit": round(self.peak_limit, 2),
+            "peak_in_flight": self.peak_in_flight,
+            "mean_in_flight": round(busy_area / elapsed, 2) if elapsed > 0 else 0.0,
+            "baseline_latency_ms": round(self.baseline * 1000, 1) if self.baseline else None,
+            "smoothed_latency_ms": round(self.smoothed * 1000, 1) if self.smoothed else None,
+            "slow_start": self.slow_start,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "errors": self.errors,
+        }
+
+
+class ConcurrencyLimiter:
+    """
+    Bounded admission of blocking calls onto a worker thread pool.
+
+    Slots are always acquired in fixture -> target -> global order so that
+    nested semaphores cannot deadlock. Must be created inside a running loop.
+    """
+
+    def __init__(self, config: ConcurrencyConfig):
+        """
+        Initialize limiter.
+
+        Args:
+            config: Concurrency configuration
+        """
+        self.config = config
+        self._global = asyncio.Semaphore(config.global_limit)
+        self._targets: dict[str, asyncio.Semaphore] = {}
+        self._adaptive: dict[str, AdaptiveLimit] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.global_limit, thread_name_prefix="promptcontracts"
+        )
+
+    def fixture_slot(self) -> asyncio.Semaphore:
+        """Create the semaphore bounding samples of a single fixture."""
+        return asyncio.Semaphore(self.config.fixture_limit)
+
+    def _target_slot(self, target_id: str) -> asyncio.Semaphore:
+        if target_id not in self._targets:
+            self._targets[target_id] = asyncio.Semaphore(self.config.target_limit)
+        return self._targets[target_id]
+
+    def adaptive_limit(self, target_id: str) -> AdaptiveLimit | None:
+        """Return the adaptive controller of a target (None if not adaptive)."""
+        if self.config.adaptive is None:
+            return None
+        if target_id not in self._adaptive:
+            self._adaptive[target_id] = AdaptiveLimit(
+                self.config.adaptive, self.config.target_limit
+            )
+        return self._adaptive[target_id]
+
+    async def call(self, target_id: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking call once target and global slots are free.
+
+        Callers hold their fixture slot around this call (and any follow-up
+        work on the result) so per-fixture limits bound samples in progress.
+        With adaptive concurrency, the target slot comes from the target's
+        AdaptiveLimit, which is fed the call's latency or failure.
+
+        Args:
+            target_id: Target identifier
+            fn: Blocking callable (typically ``adapter.generate``)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Return value of fn
+        """
+        controller = self.adaptive_limit(target_id)
+        if controller is None:
+            async with self._target_slot(target_id), self._global:
+                return await self.offload(fn, *args, **kwargs)
+
+        await controller.acquire()
+        try:
+            async with self._global:
+                started = time.perf_counter()
+                try:
+                    result = await self.offload(fn, *args, **kwargs)
+                except Exception:
+                    controller.on_error()
+                    raise
+                controller.on_success(time.perf_counter() - started)
+                return result
+        finally:
+            await controller.release()
+
+    async def offload(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking call on the worker pool without taking a slot.
+
+        A call that has not started yet is dropped when the caller is
+        cancelled (e.g. by early stopping). One already running in a worker
+        thread cannot be interrupted: the caller waits for it to return before
+        the cancellation propagates, so slots held around offload() stay taken
+        while the call is still using the provider.
+        """
+        call = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        future = asyncio.wrap_future(call)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not call.cancel():
+                await _wait_uncancellable(future)
+            raise
+
+    def close(self):
+        """Shut down the worker pool, dropping calls that have not started."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def _wait_uncancellable(future: asyncio.Future):
+    """Wait for a future to finish, ignoring further cancellation requests."""
+    while not future.done():
+        try:
+            await asyncio.wait([future])
+        except asyncio.CancelledError:
+            continue
+    if not future.cancelled():
+        # The caller is cancelled and drops the outcome
+        future.exception()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() when no loop is running in this thread; otherwise
+    (e.g. inside Jupyter) runs the coroutine on a fresh loop in a helper thread.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Coroutine result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome: dict[str, Any] = {}
+
+    def _target():
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=_target, name="promptcontracts-run")
+    thread.start()
+    thread.join()
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
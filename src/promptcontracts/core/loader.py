@@ -2,13 +2,13 @@
 Load and validate PCSL artefacts (PD, ES, EP) from JSON or YAML files.
 """
 
-import json
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 import yaml
 
+from promptcontracts.utils import jsoncodec
 from promptcontracts.utils.errors import SpecValidationError
 
 
@@ -24,8 +24,8 @@ def load_json_or_yaml(path: str) -> dict[str, Any]:
     # Try JSON first
     if path_obj.suffix.lower() == ".json":
         try:
-            return json.loads(content)
-        except json.JSONDecodeError as e:
+            return jsoncodec.loads(content)
+        except jsoncodec.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {path}: {e}") from e
 
     # Try YAML
@@ -37,8 +37,8 @@ def load_json_or_yaml(path: str) -> dict[str, Any]:
 
     # Auto-detect: try JSON first, then YAML
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
+        return jsoncodec.loads(content)
+    except jsoncodec.JSONDecodeError:
         try:
             return yaml.safe_load(content)
         except yaml.YAMLError as e:
@@ -62,7 +62,7 @@ def _validate_against_schema(
     if not schema_path.exists():
         raise FileNotFoundError(f"Schema not found: {schema_path}")
 
-    schema = json.loads(schema_path.read_text())
+    schema = jsoncodec.loads(schema_path.read_text())
 
     try:
         jsonschema.validate(instance=data, schema=schema)
@@ -0,0 +1,123 @@
+"""
+In-memory memo of output evaluations.
+
+Greedy decoding, N-sampling and fixtures with canned answers ("I don't
+know", a classification label) produce the same output text many times in
+one run. Parsing, repair and the per-response checks are deterministic in
+that text, so the runner evaluates each distinct output once and serves
+repeats from a bounded LRU memo (opt-in, EP ``execution.output_memo``).
+Checks that are inherently per call (LLM-as-judge) are re-run for every
+sample. Hit counts depend on evaluation order, so they are only reported
+for the whole run and never in per-fixture results.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Checks whose result depends on the call, not only on the output text
+PER_CALL_CHECKS = ("pc.check.judge",)
+
+
+@dataclass(frozen=True)
+class OutputMemoConfig:
+    """Configuration for the output memo (EP ``execution.output_memo``)."""
+
+    enabled: bool = False
+    max_entries: int = DEFAULT_MAX_ENTRIES
+
+    @classmethod
+    def from_dict(cls, cfg: dict[str, Any] | None) -> "OutputMemoConfig":
+        """
+        Build config from an EP ``execution.output_memo`` block.
+
+        Raises:
+            ValueError: If max_entries is negative
+        """
+        cfg = cfg or {}
+        config = cls(
+            enabled=cfg.get("enabled", False),
+            max_entries=cfg.get("max_entries", DEFAULT_MAX_ENTRIES),
+        )
+        if config.max_entries < 0:
+            raise ValueError("output_memo.max_entries must be >= 0")
+        return config
+
+
+@dataclass(frozen=True)
+class MemoEntry:
+    """Evaluation of one output text (per-call check results left out)."""
+
+    output: str
+    parsed: Any
+    repair_details: dict[str, Any]
+    check_results: tuple[dict[str, Any], ...]
+
+
+class OutputMemo:
+    """
+    Thread-safe LRU memo of output evaluations.
+
+    Keys combine the SHA-256 of the raw output with a fingerprint of
+    everything that turns an output into check results (see
+    evaluation_fingerprint()), so one memo is never shared across suites.
+    """
+
+    def __init__(self, evaluation_fp: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create an empty memo.
+
+        Args:
+            evaluation_fp: Fingerprint of the ES checks, io and repair policy
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.evaluation_fp = evaluation_fp
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, MemoEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, raw_output: str) -> str:
+        """Return the memo key of a raw output."""
+        digest = hashlib.sha256(self.evaluation_fp.encode())
+        digest.update(raw_output.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> MemoEntry | None:
+        """Return the entry for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: MemoEntry):
+        """Store an entry, evicting the least recently used beyond max_entries."""
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return lookup counts and the hit rate so far."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
@@ -0,0 +1,312 @@
+"""
+Per-target rate limiting for generate calls.
+
+Each EP target may carry a ``rate_limit`` block (requests/min, tokens/min,
+max in-flight). Calls are admitted through token buckets that refill
+continuously; buckets hold one second's worth of quota because providers
+enforce per-minute limits over much shorter windows. Buckets shrink to the
+``x-ratelimit-remaining-*`` values reported by the provider, learn limits from
+``x-ratelimit-limit-*`` when none are configured, and pause on 429 responses.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Rate limits for one target (EP ``targets[].rate_limit``)."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    max_in_flight: int | None = None
+
+    @classmethod
+    def from_dict(cls, cfg: dict[str, Any] | None) -> "RateLimitConfig":
+        """
+        Build config from an EP ``rate_limit`` block.
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        cfg = cfg or {}
+        config = cls(
+            requests_per_minute=cfg.get("requests_per_minute"),
+            tokens_per_minute=cfg.get("tokens_per_minute"),
+            max_in_flight=cfg.get("max_in_flight"),
+        )
+
+        for name in ("requests_per_minute", "tokens_per_minute", "max_in_flight"):
+            value = getattr(config, name)
+            if value is not None and (isinstance(value, bool) or value <= 0):
+                raise ValueError(f"rate_limit.{name} must be positive, got {value!r}")
+
+        return config
+
+
+def estimate_tokens(prompt: str, max_output_tokens: int | None = None) -> int:
+    """
+    Estimate the tokens a call will be charged for.
+
+    Uses ~4 characters per token for the prompt plus the requested output
+    budget, mirroring how providers reserve tokens/min at admission.
+
+    Args:
+        prompt: Prompt text
+        max_output_tokens: ``max_tokens`` generation parameter, if set
+
+    Returns:
+        Estimated token count
+    """
+    return len(prompt) // 4 + 1 + (max_output_tokens or 0)
+
+
+def parse_duration(value: str) -> float | None:
+    """Parse provider reset durations such as '1s', '6m0s', '20ms' or '0.5'."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> dict[str, float]:
+    """
+    Extract rate limit state from response headers.
+
+    Understands the ``x-ratelimit-{limit,remaining,reset}-{requests,tokens}``
+    convention and ``retry-after``.
+
+    Returns:
+        Dict with any of limit_requests, limit_tokens, remaining_requests,
+        remaining_tokens, reset_requests_s, reset_tokens_s, retry_after_s
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+    state: dict[str, float] = {}
+
+    for kind in ("requests", "tokens"):
+        for field in ("limit", "remaining"):
+            value = lowered.get(f"x-ratelimit-{field}-{kind}")
+            if value is not None:
+                try:
+                    state[f"{field}_{kind}"] = float(value)
+                except ValueError:
+                    pass
+        reset = lowered.get(f"x-ratelimit-reset-{kind}")
+        if reset is not None and (seconds := parse_duration(reset)) is not None:
+            state[f"reset_{kind}_s"] = seconds
+
+    retry_after = lowered.get("retry-after")
+    if retry_after is not None and (seconds := parse_duration(retry_after)) is not None:
+        state["retry_after_s"] = seconds
+
+    return state
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return whether an exception is an HTTP 429 from a provider SDK or httpx."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429
+
+
+class TokenBucket:
+    """Continuously refilling bucket that may go into debt for oversized takes."""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Sustained quota per minute
+            clock: Monotonic clock in seconds
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = max(self.rate, 1.0)
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be taken (0 if it can be taken now)."""
+        self._refill()
+        needed = min(amount, self.capacity)
+        return 0.0 if self.level >= needed else (needed - self.level) / self.rate
+
+    def take(self, amount: float):
+        """Take amount (callers check wait_time() first); may leave the bucket in debt."""
+        self._refill()
+        self.level -= amount
+
+    def adjust(self, delta: float):
+        """Return (positive) or charge (negative) quota after the fact."""
+        self._refill()
+        self.level = min(self.capacity, self.level + delta)
+
+    def cap(self, remaining: float):
+        """Lower the level to what the provider reports as remaining."""
+        self._refill()
+        self.level = min(self.level, remaining)
+
+
+@dataclass
+class Admission:
+    """A call admitted by a RateLimiter; report() feeds back what the call reported."""
+
+    tokens: int
+    call_info: dict[str, Any] | None = None
+
+    def report(self, call_info: dict[str, Any]):
+        """Attach the adapter's call info (headers, usage, cache hit)."""
+        self.call_info = call_info
+
+
+class RateLimiter:
+    """Admit calls for one target under request, token and in-flight limits."""
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize limiter.
+
+        Args:
+            config: Configured limits (missing limits may be learned from headers)
+            clock: Monotonic clock in seconds
+        """
+        self.config = config
+        self._clock = clock
+        self._requests = (
+            TokenBucket(config.requests_per_minute, clock) if config.requests_per_minute else None
+        )
+        self._tokens = (
+            TokenBucket(config.tokens_per_minute, clock) if config.tokens_per_minute else None
+        )
+        self._in_flight = asyncio.Semaphore(config.max_in_flight) if config.max_in_flight else None
+        self._paused_until = 0.0
+
+        self.admitted = 0
+        self.throttled = 0
+        self.rate_limited = 0
+        self.wait_seconds = 0.0
+        self.learned: dict[str, float] = {}
+
+    def _wait_time(self, tokens: int) -> float:
+        waits = [self._paused_until - self._clock()]
+        if self._requests:
+            waits.append(self._requests.wait_time(1))
+        if self._tokens:
+            waits.append(self._tokens.wait_time(tokens))
+        return max(waits)
+
+    @asynccontextmanager
+    async def admit(self, tokens: int) -> AsyncIterator[Admission]:
+        """
+        Wait until a call of the estimated size may start.
+
+        Args:
+            tokens: Estimated tokens for the call (see estimate_tokens())
+
+        Yields:
+            Admission to report() the call's info on, so the limiter can adapt
+        """
+        if self._in_flight:
+            await self._in_flight.acquire()
+        try:
+            started = self._clock()
+            throttled = False
+            while (wait := self._wait_time(tokens)) > 0:
+                throttled = True
+                await asyncio.sleep(wait)
+            if throttled:
+                self.throttled += 1
+                self.wait_seconds += self._clock() - started
+
+            if self._requests:
+                self._requests.take(1)
+            if self._tokens:
+                self._tokens.take(tokens)
+            self.admitted += 1
+
+            admission = Admission(tokens)
+            try:
+                yield admission
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self._on_rate_limited(e)
+                raise
+            if admission.call_info is not None:
+                self._adapt(admission)
+        finally:
+            if self._in_flight:
+                self._in_flight.release()
+
+    def _on_rate_limited(self, error: BaseException):
+        """Pause admissions after a 429, honouring retry-after when given."""
+        self.rate_limited += 1
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        state = parse_rate_limit_headers(headers)
+        pause = state.get("retry_after_s") or max(
+            state.get("reset_requests_s", 0.0), state.get("reset_tokens_s", 0.0), 1.0
+        )
+        self._paused_until = max(self._paused_until, self._clock() + pause)
+
+    def _adapt(self, admission: Admission):
+        """Correct buckets from usage and rate limit headers reported by the call."""
+        info = admission.call_info
+
+        # Served from the response cache: the provider never saw the call
+        if info.get("cache_hit"):
+            if self._requests:
+                self._requests.adjust(1)
+            if self._tokens:
+                self._tokens.adjust(admission.tokens)
+            return
+
+        if self._tokens and "usage_tokens" in info:
+            self._tokens.adjust(admission.tokens - info["usage_tokens"])
+
+        state = info.get("rate_limit") or {}
+        for kind in ("requests", "tokens"):
+            bucket_attr = f"_{kind}"
+            if getattr(self, bucket_attr) is None and f"limit_{kind}" in state:
+                self.learned[f"{kind}_per_minute"] = state[f"limit_{kind}"]
+                setattr(self, bucket_attr, TokenBucket(state[f"limit_{kind}"], self._clock))
+
+            bucket = getattr(self, bucket_attr)
+            remaining = state.get(f"remaining_{kind}")
+            if bucket is not None and remaining is not None:
+                bucket.cap(remaining)
+                if remaining <= 0 and f"reset_{kind}_s" in state:
+                    self._paused_until = max(
+                        self._paused_until, self._clock() + state[f"reset_{kind}_s"]
+                    )
+
+    def stats(self) -> dict[str, Any]:
+        """Return configured/learned limits and admission counters."""
+        return {
+            "requests_per_minute": self.config.requests_per_minute,
+            "tokens_per_minute": self.config.tokens_per_minute,
+            "max_in_flight": self.config.max_in_flight,
+            "learned": dict(self.learned),
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "rate_limited": self.rate_limited,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
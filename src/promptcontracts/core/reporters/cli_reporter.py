@@ -29,6 +29,41 @@ class CLIReporter:
             self.console.print(f"[bold cyan]📁 Artifacts saved to:[/bold cyan] {artifact_dir}")
             self.console.print()
 
+        # Show response cache counters if the cache was used
+        cache_stats = results.get("cache")
+        if cache_stats:
+            self.console.print(
+                f"[bold cyan]Cache:[/bold cyan] {cache_stats['hits']} hits, "
+                f"{cache_stats['misses']} misses (hit rate {cache_stats['hit_rate']:.0%})"
+            )
+            self.console.print()
+
+        # Show how many fixtures an incremental run could reuse
+        reuse_counts = results.get("incremental")
+        if reuse_counts:
+            self.console.print(
+                f"[bold cyan]Incremental:[/bold cyan] {reuse_counts['reuse']} reused, "
+                f"{reuse_counts['revalidate']} re-validated, "
+                f"{reuse_counts['regenerate']} regenerated"
+            )
+            self.console.print()
+
+        # Show check calls avoided by short-circuiting
+        check_costs = results.get("checks")
+        if check_costs:
+            skipped = {t: c["skipped"] for t, c in check_costs.items() if c["skipped"]}
+            detail = ", ".join(f"{t} {n}" for t, n in skipped.items()) or "none"
+            self.console.print(f"[bold cyan]Short-circuit:[/bold cyan] skipped checks: {detail}")
+            self.console.print()
+
+        # Show connection reuse per endpoint
+        for base_url, pool in results.get("transport", {}).items():
+            self.console.print(
+                f"[bold cyan]Connections:[/bold cyan] {base_url}: {pool['requests']} requests "
+                f"over {pool['connections_opened']} new connections "
+                f"({pool['connect_ms']:.0f} ms connecting)"
+            )
+
     def _report_target(self, target_result: dict[str, Any]):
         """Report results for a single target."""
         target = target_result["target"]
@@ -111,9 +146,12 @@ class CLIReporter:
         check_type = check.get("type")
         message = check.get("message")
 
-        status_symbol = "✓" if passed else "✗"
-        status_text = "PASS" if passed else "FAIL"
-        status_color = "green" if passed else "red"
+        if check.get("skipped"):
+            status_symbol, status_text, status_color = "-", "SKIP", "yellow"
+        else:
+            status_symbol = "✓" if passed else "✗"
+            status_text = "PASS" if passed else "FAIL"
+            status_color = "green" if passed else "red"
 
         self.console.print(
             f"  [{status_color}]{status_symbol} {status_text}[/{status_color}] | {check_type}"
@@ -136,6 +174,8 @@ class CLIReporter:
 
         self.console.print("=" * 60)
         summary_text = f"[bold]Summary:[/bold] {passed}/{total} checks passed"
+        if summary.get("skipped_checks"):
+            summary_text += f", {summary['skipped_checks']} skipped"
 
         # Add fixture status breakdown
         if fixture_statuses:
@@ -157,5 +197,10 @@ class CLIReporter:
         summary_text += f" — status: [{status_color}]{status}[/{status_color}]"
 
         self.console.print(summary_text)
+        truncated = summary.get("repairs", {}).get("truncation_repaired_passes", 0)
+        if truncated:
+            self.console.print(
+                f"[yellow]{truncated} PASS relied on closing truncated JSON[/yellow]"
+            )
         self.console.print("=" * 60)
         self.console.print()
@@ -0,0 +1,216 @@
+"""
+Incremental result assembly for streaming contract runs.
+
+ContractRunner emits a RunEvent per completed fixture and per completed
+target. TargetSummary folds fixture results into a target summary without
+retaining them, and ResultCollector rebuilds the classic results dict (in EP
+order) from a stream of events.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+EventKind = Literal["fixture", "target", "run"]
+
+
+@dataclass
+class RunEvent:
+    """
+    A unit of streamed results.
+
+    kind="fixture": payload is the fixture result item (same shape as in run()).
+    kind="target": payload is the target result with summary; its "fixtures"
+        list is empty because fixtures were already streamed.
+    kind="run": emitted last; payload holds run-level extras (e.g. "cache").
+    """
+
+    kind: EventKind
+    payload: dict[str, Any]
+    target_id: str | None = None
+    target_index: int | None = None
+    fixture_index: int | None = None
+
+
+@dataclass
+class TargetSummary:
+    """Accumulate a target summary from fixture results as they complete."""
+
+    total_checks: int = 0
+    passed_checks: int = 0
+    skipped_checks: int = 0
+    # Fixtures with a sample repaired by each step (repair ledger)
+    repairs: dict[str, int] = field(default_factory=dict)
+    # Passing fixtures whose output was completed by close_truncated_json
+    truncation_repaired_passes: int = 0
+    status_counts: dict[str, int] = field(default_factory=lambda: {"PASS": 0, "FAIL": 0})
+    latencies: list[float] = field(default_factory=list)
+    ttfts: list[float] = field(default_factory=list)
+    throughputs: list[float] = field(default_factory=list)
+    # Prompt prefix reuse reported by providers, summed over generated samples
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cached_latencies: list[float] = field(default_factory=list)
+    uncached_latencies: list[float] = field(default_factory=list)
+    prompt_eval_tokens: int = 0
+    prompt_eval_ms: list[float] = field(default_factory=list)
+
+    def add(self, fixture_result: dict[str, Any]):
+        """Fold one fixture result item into the summary."""
+        checks = fixture_result["checks"]
+        self.total_checks += len(checks)
+        self.passed_checks += sum(1 for c in checks if c["passed"])
+        self.skipped_checks += sum(1 for c in checks if c.get("skipped"))
+        status = fixture_result["status"]
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.latencies.append(fixture_result["latency_ms"])
+
+        steps = {
+            step
+            for details in fixture_result.get("repair_ledger", [])
+            for step in details.get("steps_applied", [])
+        }
+        for step in steps:
+            self.repairs[step] = self.repairs.get(step, 0) + 1
+        if "close_truncated_json" in steps and status == "PASS":
+            self.truncation_repaired_passes += 1
+
+        # Streamed samples; cache hits replay text without real timing
+        for sample in fixture_result.get("sampling_metadata", {}).get("samples", []):
+            if sample.get("cache_hit"):
+                continue
+            if "prompt_cache" in sample:
+                self._add_prompt_cache(sample["prompt_cache"], sample["latency_ms"])
+            stream = sample.get("stream")
+            if not stream:
+                continue
+            self.ttfts.append(stream["ttft_ms"])
+            if stream["tokens_per_s"] is not None:
+                self.throughputs.append(stream["tokens_per_s"])
+
+    def _add_prompt_cache(self, usage: dict[str, Any], latency_ms: float):
+        """Fold one sample's prompt token usage into the prefix reuse totals."""
+        if "cached_tokens" in usage:
+            self.prompt_tokens += usage.get("prompt_tokens", 0)
+            self.cached_tokens += usage["cached_tokens"]
+            if usage["cached_tokens"]:
+                self.cached_latencies.append(latency_ms)
+            else:
+                self.uncached_latencies.append(latency_ms)
+        if "prompt_eval_tokens" in usage:
+            self.prompt_eval_tokens += usage["prompt_eval_tokens"]
+        if "prompt_eval_ms" in usage:
+            self.prompt_eval_ms.append(usage["prompt_eval_ms"])
+
+    def prompt_cache_summary(self) -> dict[str, Any]:
+        """Return the prompt prefix reuse totals (empty if no provider reported any)."""
+        summary: dict[str, Any] = {}
+        if self.cached_latencies or self.uncached_latencies:
+            summary["prompt_tokens"] = self.prompt_tokens
+            summary["cached_tokens"] = self.cached_tokens
+            summary["cached_token_rate"] = (
+                self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+            )
+            summary["requests_with_cache_hit"] = len(self.cached_latencies)
+            summary["mean_latency_ms"] = {
+                "cached": _mean(self.cached_latencies),
+                "uncached": _mean(self.uncached_latencies),
+            }
+        if self.prompt_eval_ms:
+            summary["prompt_eval_tokens"] = self.prompt_eval_tokens
+            summary["mean_prompt_eval_ms"] = _mean(self.prompt_eval_ms)
+        return summary
+
+    def finalize(
+        self, is_nonenforceable: bool, target_check_results: list[dict[str, Any]] = ()
+    ) -> dict[str, Any]:
+        """
+        Produce the target summary dict.
+
+        Args:
+            is_nonenforceable: Whether the target was marked NONENFORCEABLE
+            target_check_results: Target-level check results (e.g. latency budgets)
+
+        Returns:
+            Summary dict as stored under target_result["summary"]
+        """
+        total_checks = self.total_checks + len(target_check_results)
+        passed_checks = self.passed_checks + sum(1 for r in target_check_results if r["passed"])
+        pass_rate = passed_checks / total_checks if total_checks > 0 else 0
+
+        # Count statuses
+        status_counts = {
+            "PASS": self.status_counts.get("PASS", 0),
+            "REPAIRED": 0,  # Deprecated in v0.3.0
+            "FAIL": self.status_counts.get("FAIL", 0),
+            "NONENFORCEABLE": 1 if is_nonenforceable else 0,
+        }
+
+        # Determine overall status
+        if is_nonenforceable:
+            status = "YELLOW"
+        elif status_counts["FAIL"] > 0:
+            status = "RED"
+        else:
+            status = "GREEN"
+
+        summary = {
+            "total_checks": total_checks,
+            "passed_checks": passed_checks,
+            "pass_rate": pass_rate,
+            "status": status,
+            "fixture_statuses": status_counts,
+        }
+        if self.skipped_checks:
+            summary["skipped_checks"] = self.skipped_checks
+        if self.repairs:
+            # Truncation repairs salvage cut-off outputs; keep them visible
+            # apart from PASS so they cannot pass for clean successes
+            summary["repairs"] = {
+                "by_step": dict(self.repairs),
+                "truncation_repaired_passes": self.truncation_repaired_passes,
+            }
+        if prompt_cache := self.prompt_cache_summary():
+            summary["prompt_cache"] = prompt_cache
+        if target_check_results:
+            summary["target_checks"] = list(target_check_results)
+        return summary
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+class ResultCollector:
+    """Rebuild the results dict from a stream of RunEvents."""
+
+    def __init__(self, header: dict[str, Any]):
+        """
+        Initialize collector.
+
+        Args:
+            header: Run-level fields (artifact_base_dir, pcsl_version, ...)
+        """
+        self._header = header
+        self._extras: dict[str, Any] = {}
+        self._targets: dict[int, dict[str, Any]] = {}
+        self._fixtures: dict[int, dict[int, dict[str, Any]]] = {}
+
+    def add(self, event: RunEvent):
+        """Consume one event."""
+        if event.kind == "fixture":
+            self._fixtures.setdefault(event.target_index, {})[event.fixture_index] = event.payload
+        elif event.kind == "target":
+            self._targets[event.target_index] = event.payload
+        elif event.kind == "run":
+            self._extras.update(event.payload)
+
+    def results(self) -> dict[str, Any]:
+        """Return the assembled results with targets and fixtures in EP order."""
+        targets = []
+        for target_index in sorted(self._targets):
+            fixtures = self._fixtures.get(target_index, {})
+            target_result = dict(self._targets[target_index])
+            target_result["fixtures"] = [fixtures[i] for i in sorted(fixtures)]
+            targets.append(target_result)
+
+        return {"targets": targets, **self._header, **self._extras}
@@ -5,17 +5,137 @@ Version 0.3.0: Added probabilistic sampling, enhanced parsing, repair policies,
 and capability negotiation.
 """
 
-import hashlib
-import json
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .adapters import OllamaAdapter, OpenAIAdapter
+from ..utils import jsoncodec
+from .adapters import (
+    CachingAdapter,
+    OllamaAdapter,
+    OpenAIAdapter,
+    capture_call_info,
+    consume_stream,
+)
+from .cache import CacheConfig, ResponseCache
 from .capability import CapabilityNegotiator, ProviderCapabilities
-from .parser import json_loose
-from .sampling import SampleResult, create_sampler
-from .validator import CheckRegistry, Validator, build_constraints_block, derive_json_schema_from_es
+from .checkpoint import CheckpointJournal, artifact_hashes
+from .execution import ConcurrencyConfig, ConcurrencyLimiter, run_sync
+from .incremental import PriorRun, ReuseDecision, evaluation_fingerprint, generation_fingerprint
+from .memo import PER_CALL_CHECKS, MemoEntry, OutputMemo, OutputMemoConfig
+from .parser import ParseContext
+from .ratelimit import RateLimitConfig, RateLimiter, estimate_tokens
+from .results import ResultCollector, RunEvent, TargetSummary
+from .sampling import AggregatedResult, SampleResult, create_sampler
+from .sharding import ShardSpec
+from .template import PROMPT_LAYOUTS, PromptTemplate
+from .transport import TransportConfig, shared_transport, transport_stats_delta
+from .validator import (
+    STREAM_CHECKS,
+    TARGET_LEVEL_CHECKS,
+    CheckCostModel,
+    CheckPlan,
+    CheckRegistry,
+    IncrementalValidation,
+    Validator,
+    derive_json_schema_from_es,
+)
+from .workqueue import QueueDispatcher, WorkQueue, unit_key
+
+FIXTURE_ORDERS = ("listed", "shared_prefix")
+
+# Incremental checks judging the raw text, which output repair may rewrite
+TEXT_REWRITE_SENSITIVE_CHECKS = (
+    "pc.check.json_valid",
+    "pc.check.regex_absent",
+    "pc.check.token_budget",
+    "pc.check.contains_any",
+)
+
+# Call details showing prompt prefix reuse (provider cache or Ollama KV cache)
+PROMPT_CACHE_FIELDS = ("prompt_tokens", "cached_tokens", "prompt_eval_tokens", "prompt_eval_ms")
+
+# Call details that describe a whole request rather than one of its choices
+_REQUEST_USAGE_FIELDS = ("usage_tokens", "output_tokens", *PROMPT_CACHE_FIELDS)
+
+
+class CompletionBatch:
+    """
+    Samples of one fixture generated together by a single generate_many() call.
+
+    The first sample to take() its generation issues the request for all of
+    them; the others wait for it and take their own choice.
+    """
+
+    def __init__(self, sample_ids: list[int]):
+        """
+        Initialize an unfetched batch.
+
+        Args:
+            sample_ids: Samples whose generation the batch provides
+        """
+        self.sample_ids = sample_ids
+        self.results: dict[int, tuple[str, float, dict[str, Any]]] | None = None
+        self._lock = asyncio.Lock()
+
+    def __contains__(self, sample_id: int) -> bool:
+        return sample_id in self.sample_ids
+
+    async def take(
+        self,
+        sample_id: int,
+        fetch: Callable[[list[int]], Awaitable[dict[int, tuple[str, float, dict[str, Any]]]]],
+    ) -> tuple[str, float, dict[str, Any]]:
+        """
+        Return one sample's generation, fetching the whole batch on first use.
+
+        Args:
+            sample_id: Sample to return
+            fetch: Coroutine function generating the given samples
+
+        Returns:
+            (raw_output, latency_ms, call_info)
+        """
+        async with self._lock:
+            if self.results is None:
+                self.results = await fetch(self.sample_ids)
+        return self.results.pop(sample_id)
+
+
+@dataclass
+class FixtureRun:
+    """Everything the samples of one (target, fixture) pair share."""
+
+    target_index: int
+    target_id: str
+    target: dict[str, Any]
+    fixture_id: str
+    adapter: Any
+    schema: dict | None
+    final_prompt: str
+    slot: asyncio.Semaphore
+    rate_limiter: RateLimiter | None = None
+    reuse: ReuseDecision = "regenerate"
+    prior_samples: dict[int, SampleResult] = field(default_factory=dict)
+    batch: CompletionBatch | None = None
+
+    def unit_key(self, sample_id: int) -> tuple[int, str, str, int]:
+        """Checkpoint journal key of one sample."""
+        return (self.target_index, self.target_id, self.fixture_id, sample_id)
+
+    def unit_payload(self, sample_id: int) -> dict[str, Any]:
+        """Work queue payload from which a worker can generate one sample."""
+        return {
+            "target_index": self.target_index,
+            "target": self.target,
+            "final_prompt": self.final_prompt,
+            "schema": self.schema,
+            "sample_id": sample_id,
+        }
 
 
 class ContractRunner:
@@ -29,6 +149,13 @@ class ContractRunner:
         save_io_dir: str | None = None,
         embedding_adapter: Any = None,
         judge_adapter: Any = None,
+        on_fixture_complete: Callable[[str, dict[str, Any]], None] | None = None,
+        on_target_complete: Callable[[dict[str, Any]], None] | None = None,
+        checkpoint_dir: str | None = None,
+        resume: bool = False,
+        reuse_dir: str | None = None,
+        shard: ShardSpec | None = None,
+        work_queue: str | None = None,
     ):
         """
         Initialize runner with artifacts.
@@ -40,14 +167,31 @@ class ContractRunner:
             save_io_dir: Optional directory to save IO artifacts
             embedding_adapter: Optional embedding adapter for similarity checks
             judge_adapter: Optional judge adapter for LLM-as-judge checks
+            on_fixture_complete: Optional hook called with (target_id, fixture_result)
+                as soon as each fixture finishes
+            on_target_complete: Optional hook called with the target result (summary
+                included, fixtures already streamed) when each target finishes
+            checkpoint_dir: Optional directory for the checkpoint journal
+            resume: Replay completed units from the journal in checkpoint_dir
+                instead of starting it afresh
+            reuse_dir: Optional ``--save-io`` directory of a previous run; fixtures
+                whose prompt, input and target params are unchanged reuse its
+                outputs (re-validated offline if the checks changed)
+            shard: Optional shard of the fixtures to run; see merge_shard_results()
+            work_queue: Optional SQLite queue file; samples are then generated by
+                ``prompt-contracts worker`` processes instead of in this process,
+                and execution.concurrency limits do not apply
         """
         self.pd = pd
         self.es = es
         self.ep = ep
         self.save_io_dir = Path(save_io_dir) if save_io_dir else None
         self.validator = Validator(CheckRegistry())
+        self.check_plan: CheckPlan | None = None
         self.embedding_adapter = embedding_adapter
         self.judge_adapter = judge_adapter
+        self.on_fixture_complete = on_fixture_complete
+        self.on_target_complete = on_target_complete
 
         # Parse execution config with defaults
         execution = ep.get("execution", {})
@@ -58,6 +202,56 @@ class ContractRunner:
             "auto_repair", {"strip_markdown_fences": True, "lowercase_fields": []}
         )
 
+        # Prompt layout and generation order, for provider-side prefix caching
+        self.prompt_layout = execution.get("prompt_layout", "input_first")
+        if self.prompt_layout not in PROMPT_LAYOUTS:
+            raise ValueError(f"Unknown prompt_layout: {self.prompt_layout}")
+        self.fixture_order = execution.get("fixture_order", "listed")
+        if self.fixture_order not in FIXTURE_ORDERS:
+            raise ValueError(f"Unknown fixture_order: {self.fixture_order}")
+        # Compiled prompt templates by effective mode, shared by all targets
+        self._templates: dict[str, PromptTemplate] = {}
+
+        # Abort streamed generations once an incremental check has failed for good
+        self.early_abort = execution.get("early_abort", False)
+
+        # Stream generations to time TTFT and decode throughput (implied by their budgets)
+        self.stream = (
+            execution.get("stream", False)
+            or self.early_abort
+            or any(c.get("type") in STREAM_CHECKS for c in es.get("checks", []))
+        )
+
+        # Run cheap checks first and skip the rest once a response has failed
+        self.short_circuit = execution.get("short_circuit", False)
+        self.check_costs = CheckCostModel() if self.short_circuit else None
+
+        # Concurrency limits for the async engine
+        self.concurrency = ConcurrencyConfig.from_dict(execution.get("concurrency"))
+
+        # Pooled keep-alive HTTP clients shared by all adapters with these settings
+        self.transport = shared_transport(TransportConfig.from_dict(execution.get("transport")))
+
+        # Persistent response cache (opened per run)
+        self.cache_config = CacheConfig.from_dict(execution.get("cache"))
+        self.response_cache: ResponseCache | None = None
+
+        # Checkpoint journal (opened per run)
+        self.checkpoint_dir = checkpoint_dir
+        self.resume = resume
+        self.journal: CheckpointJournal | None = None
+
+        # Incremental re-run against a previous save-io directory
+        self.prior_run = PriorRun(reuse_dir) if reuse_dir else None
+        self.reuse_counts: dict[str, int] = {}
+
+        # Run only this shard's fixtures (None = all)
+        self.shard = shard
+
+        # Distribute generation to workers through a durable queue (opened per run)
+        self.work_queue_path = work_queue
+        self.dispatcher: QueueDispatcher | None = None
+
         # v0.3.0: Repair policy
         self.repair_policy = execution.get(
             "repair_policy",
@@ -68,12 +262,33 @@ class ContractRunner:
             },
         )
 
+        # Evaluate each distinct output once; repeats are served from the memo
+        memo_config = OutputMemoConfig.from_dict(execution.get("output_memo"))
+        self.output_memo: OutputMemo | None = None
+        if memo_config.enabled:
+            self.output_memo = OutputMemo(
+                evaluation_fingerprint(pd, es, self.repair_policy), memo_config.max_entries
+            )
+        self.per_call_plan: tuple[list[int], CheckPlan] | None = None
+
         # v0.3.0: Sampling config
         sampling_cfg = ep.get("sampling", {})
         self.n_samples = sampling_cfg.get("n", 1)
         self.seed = sampling_cfg.get("seed")
         self.aggregation = sampling_cfg.get("aggregation", "first")
         self.bootstrap_samples = sampling_cfg.get("bootstrap_samples", 1000)
+        self.early_stopping = sampling_cfg.get("early_stopping", False)
+        self.ci_stopping = sampling_cfg.get("ci_stopping")
+
+        # Collapse N-sampling of deterministic generations to a small probe
+        collapse = sampling_cfg.get("collapse_deterministic", False)
+        if collapse is True:
+            collapse = {"enabled": True}
+        self.collapse_probe = None
+        if collapse and collapse.get("enabled", True):
+            self.collapse_probe = collapse.get("probe", 2)
+            if self.collapse_probe < 2:
+                raise ValueError("sampling.collapse_deterministic.probe must be >= 2")
 
     def _create_adapter(self, target: dict[str, Any]):
         """Create an adapter for a target."""
@@ -82,9 +297,16 @@ class ContractRunner:
         params = target.get("params", {})
 
         if target_type == "openai":
-            return OpenAIAdapter(model, params)
+            return OpenAIAdapter(
+                model, params, transport=self.transport, base_url=target.get("base_url")
+            )
         elif target_type == "ollama":
-            return OllamaAdapter(model, params)
+            return OllamaAdapter(
+                model,
+                params,
+                base_url=target.get("base_url", "http://localhost:11434"),
+                transport=self.transport,
+            )
         else:
             raise ValueError(f"Unknown target type: {target_type}")
 
@@ -120,92 +342,273 @@ class ContractRunner:
             result.negotiation_log,
         )
 
+    def _prompt_template(self, effective_mode: str) -> PromptTemplate:
+        """
+        Return the compiled prompt template for an effective mode.
+
+        The PD prompt and constraints block are rendered (and the static
+        prefix hashed) once per mode; targets negotiating the same mode share
+        the template. Templates are only ever added, so concurrent targets
+        compiling the same mode at worst build equal copies.
+        """
+        template = self._templates.get(effective_mode)
+        if template is None:
+            template = PromptTemplate.compile(
+                self.pd, self.es, effective_mode, layout=self.prompt_layout
+            )
+            self._templates[effective_mode] = template
+        return template
+
     def _build_prompt(self, fixture: dict[str, Any], effective_mode: str) -> str:
-        """Build final prompt with fixture input and optional constraints."""
-        base_prompt = self.pd.get("prompt", "")
-        fixture_input = fixture.get("input", "")
+        """
+        Build final prompt with fixture input and optional constraints.
 
-        # Combine base + fixture input
-        prompt = f"{base_prompt}\n\n[USER INPUT]\n{fixture_input}"
+        The ``static_first`` layout puts the constraints before the fixture
+        input, so that everything but the input is a prefix shared by all
+        fixtures (reusable by provider prompt caches and Ollama's KV cache).
+        """
+        return self._prompt_template(effective_mode).render(fixture.get("input", ""))
 
-        # Add constraints block for assist/enforce modes
-        if effective_mode in ["assist", "enforce"]:
-            constraints = build_constraints_block(self.es)
-            if constraints:
-                prompt += constraints
+    def _ordered_fixtures(self, effective_mode: str) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Return this shard's fixtures in the order their generations are scheduled.
 
-        return prompt
+        With ``fixture_order: shared_prefix`` fixtures are sorted by final
+        prompt, so prompts sharing the longest prefixes run back to back while
+        the provider still caches them. Results keep EP order either way.
+        """
+        fixtures = self._shard_fixtures()
+        if self.fixture_order == "shared_prefix":
+            fixtures.sort(key=lambda item: self._build_prompt(item[1], effective_mode))
+        return fixtures
 
-    def _parse_output(self, raw_output: str, repair_steps: list[str]) -> tuple[str, Any, dict]:
+    def _parse_output(self, raw_output: str) -> ParseContext:
         """
         Parse output with repair policy.
 
         Args:
             raw_output: Raw LLM output
-            repair_steps: List of allowed repair steps
 
         Returns:
-            (normalized_output, parsed_json, repair_details)
+            ParseContext with normalized output, parsed JSON and repair details
         """
-        normalized = raw_output
-        parsed = None
-        repair_details = {"steps_applied": []}
-
-        expects = self.pd.get("io", {}).get("expects", "text")
-
-        if expects == "structured/json":
-            # Try direct parse first
-            try:
-                parsed = json.loads(normalized)
-                return normalized, parsed, repair_details
-            except json.JSONDecodeError:
-                pass
-
-            # Apply repair steps
-            if self.repair_policy.get("enabled", True):
-                # Step 1: strip markdown fences
-                if "strip_markdown_fences" in repair_steps:
-                    from .parser import strip_markdown_fences
-
-                    stripped = strip_markdown_fences(normalized)
-                    if stripped != normalized:
-                        normalized = stripped
-                        repair_details["steps_applied"].append("strip_markdown_fences")
-                        try:
-                            parsed = json.loads(normalized)
-                            return normalized, parsed, repair_details
-                        except json.JSONDecodeError:
-                            pass
-
-                # Step 2: json_loose parse
-                if "json_loose_parse" in repair_steps:
-                    try:
-                        parsed = json_loose(raw_output)
-                        normalized = json.dumps(parsed)
-                        repair_details["steps_applied"].append("json_loose_parse")
-                        return normalized, parsed, repair_details
-                    except Exception:
-                        pass
-
-        return normalized, parsed, repair_details
-
-    def _validate_response(
-        self, response_text: str, parsed_json: Any = None
-    ) -> list[dict[str, Any]]:
-        """Run validation checks on response."""
-        checks = self.es.get("checks", [])
-
-        # Filter out latency checks (handled separately)
-        non_latency_checks = [c for c in checks if c.get("type") != "pc.check.latency_budget"]
-
-        return self.validator.run_checks(
-            check_specs=non_latency_checks,
-            response_text=response_text,
-            parsed_json=parsed_json,
+        expects_json = self.pd.get("io", {}).get("expects", "text") == "structured/json"
+        repair_steps = ()
+        if self.repair_policy.get("enabled", True):
+            repair_steps = self.repair_policy.get(
+                "allowed", ["strip_markdown_fences", "json_loose_parse"]
+            )
+        return ParseContext.from_output(raw_output, expects_json, repair_steps)
+
+    def _validate_response(self, context: ParseContext) -> list[dict[str, Any]]:
+        """Run validation checks on a parsed response."""
+        return self.validator.run_plan(
+            self._compiled_checks(),
+            response_text=context.text,
+            parsed_json=context.parsed,
             embedding_adapter=self.embedding_adapter,
             judge_adapter=self.judge_adapter,
+            short_circuit=self.short_circuit,
+            cost_model=self.check_costs,
+            parse_context=context,
+        )
+
+    def _compiled_checks(self) -> CheckPlan:
+        """Return the per-response checks compiled once (target-level budgets excluded)."""
+        if self.check_plan is None:
+            checks = self.es.get("checks", [])
+            self.check_plan = self.validator.compile(
+                [c for c in checks if c.get("type") not in TARGET_LEVEL_CHECKS]
+            )
+        return self.check_plan
+
+    def _generate(
+        self, adapter, final_prompt: str, schema: dict | None, sample_id: int
+    ) -> tuple[str, float, dict[str, Any]]:
+        """
+        Call the adapter and collect the call details it reports.
+
+        Must run in the thread that performs the call.
+
+        Returns:
+            (raw_output, latency_ms, call_info)
+        """
+        with capture_call_info() as call_info:
+            if self.stream:
+                kwargs = {"sample_index": sample_id} if isinstance(adapter, CachingAdapter) else {}
+                incremental = self._incremental_validation()
+                raw_output, timing = consume_stream(
+                    adapter.generate_stream(final_prompt, schema=schema, **kwargs),
+                    incremental.feed if incremental else None,
+                )
+                # A replayed cache hit reports the latency measured when it was generated
+                latency_ms = call_info.pop("cached_latency_ms", timing.total_ms)
+                call_info["stream"] = timing.to_dict()
+                if timing.aborted:
+                    call_info["early_abort"] = {
+                        "check": incremental.failed_spec,
+                        "result": incremental.failure,
+                    }
+            elif isinstance(adapter, CachingAdapter):
+                raw_output, latency_ms = adapter.generate(
+                    final_prompt, schema=schema, sample_index=sample_id
+                )
+            else:
+                raw_output, latency_ms = adapter.generate(final_prompt, schema=schema)
+
+        return raw_output, latency_ms, call_info
+
+    def _incremental_validation(self) -> IncrementalValidation | None:
+        """Build incremental checks for early abort (None when disabled or none apply)."""
+        if not self.early_abort:
+            return None
+
+        # Final checks judge the repaired text, so while a repair step can still
+        # rewrite the output no verdict on the raw stream is final
+        exclude = ()
+        expects_json = self.pd.get("io", {}).get("expects") == "structured/json"
+        if expects_json and self.repair_policy.get("enabled", True):
+            if {"strip_markdown_fences", "close_truncated_json", "json_loose_parse"} & set(
+                self.repair_policy.get("allowed", [])
+            ):
+                exclude = TEXT_REWRITE_SENSITIVE_CHECKS
+
+        incremental = self.validator.incremental(self.es.get("checks", []), exclude)
+        return incremental if incremental.checks else None
+
+    def _evaluate_sample(
+        self,
+        sample_id: int,
+        raw_output: str,
+        latency_ms: float,
+        call_info: dict[str, Any] | None = None,
+    ) -> SampleResult:
+        """
+        Parse, repair and validate a generated output.
+
+        Args:
+            sample_id: Sample identifier
+            raw_output: Raw LLM output
+            latency_ms: Generation latency
+            call_info: Details reported by the adapter for this call
+
+        Returns:
+            SampleResult with output and check results
+        """
+        metadata = dict(call_info or {})
+        if metadata.get("early_abort"):
+            context = self._parse_output(raw_output)
+            entry = MemoEntry(
+                context.text,
+                context.parsed,
+                context.repair_details,
+                tuple(self._aborted_check_results(metadata["early_abort"])),
+            )
+        elif self.output_memo is not None:
+            entry = self._memoized_evaluation(raw_output)
+        else:
+            entry = self._evaluate_output(raw_output)
+        check_results = list(entry.check_results)
+        checks_passed = all(r["passed"] for r in check_results)
+
+        return SampleResult(
+            sample_id=sample_id,
+            output=entry.output,
+            parsed=entry.parsed,
+            latency_ms=latency_ms,
+            checks_passed=checks_passed,
+            check_results=check_results,
+            metadata=metadata,
+            raw_output=raw_output,
+            repair_details=entry.repair_details,
         )
 
+    def _evaluate_output(self, raw_output: str) -> MemoEntry:
+        """Parse, repair and validate an output text."""
+        # Parse and repair (each candidate text is decoded once)
+        context = self._parse_output(raw_output)
+        check_results = self._validate_response(context)
+        return MemoEntry(context.text, context.parsed, context.repair_details, tuple(check_results))
+
+    def _memoized_evaluation(self, raw_output: str) -> MemoEntry:
+        """
+        Evaluate an output, serving repeats of an earlier output from the memo.
+
+        Per-call checks (judge) are re-run on a hit unless short-circuiting
+        already skipped them. Hits are only counted run-wide, since which
+        sample of a repeated output misses depends on evaluation order.
+
+        Returns:
+            Evaluation with fresh result dicts
+        """
+        key = self.output_memo.key(raw_output)
+        cached = self.output_memo.get(key)
+        if cached is None:
+            entry = self._evaluate_output(raw_output)
+            self.output_memo.put(key, entry)
+            return self._copy_entry(entry)
+
+        entry = self._copy_entry(cached)
+        indices, plan = self._per_call_checks()
+        # With short-circuiting, a failed memoized check means per-call checks were skipped
+        skipped = self.short_circuit and any(
+            not result["passed"] for i, result in enumerate(entry.check_results) if i not in indices
+        )
+        if indices and not skipped:
+            results = self.validator.run_plan(
+                plan,
+                response_text=entry.output,
+                parsed_json=entry.parsed,
+                embedding_adapter=self.embedding_adapter,
+                judge_adapter=self.judge_adapter,
+                short_circuit=self.short_circuit,
+                cost_model=self.check_costs,
+            )
+            for index, result in zip(indices, results, strict=True):
+                entry.check_results[index].clear()
+                entry.check_results[index].update(result)
+        return entry
+
+    @staticmethod
+    def _copy_entry(entry: MemoEntry) -> MemoEntry:
+        """Copy the mutable parts of a memo entry handed to a sample."""
+        return MemoEntry(
+            entry.output,
+            entry.parsed,
+            dict(entry.repair_details),
+            tuple(dict(result) for result in entry.check_results),
+        )
+
+    def _per_call_checks(self) -> tuple[list[int], CheckPlan]:
+        """Return the plan positions and sub-plan of the per-call checks."""
+        if self.per_call_plan is None:
+            plan = self._compiled_checks()
+            indices = [
+                i for i, check in enumerate(plan.checks) if check.check_type in PER_CALL_CHECKS
+            ]
+            self.per_call_plan = (indices, CheckPlan(tuple(plan.checks[i] for i in indices)))
+        return self.per_call_plan
+
+    def _aborted_check_results(self, early_abort: dict[str, Any]) -> list[dict[str, Any]]:
+        """Check results of a sample whose generation an incremental check aborted."""
+        failure = early_abort["result"]
+        results = []
+        for check in self.es.get("checks", []):
+            if check.get("type") in TARGET_LEVEL_CHECKS:
+                continue
+            if check == early_abort["check"]:
+                results.append(failure)
+            else:
+                results.append(
+                    {
+                        "type": check.get("type"),
+                        "passed": False,
+                        "message": f"Not evaluated: generation aborted by {failure['type']}",
+                        "data": None,
+                    }
+                )
+        return results
+
     def _run_single_sample(
         self,
         adapter,
@@ -226,55 +629,282 @@ class ContractRunner:
             SampleResult with output and check results
         """
         # Generate response
-        raw_output, latency_ms = adapter.generate(final_prompt, schema=schema)
+        raw_output, latency_ms, call_info = self._generate(adapter, final_prompt, schema, sample_id)
 
-        # Parse and repair
-        repair_steps = self.repair_policy.get(
-            "allowed", ["strip_markdown_fences", "json_loose_parse"]
-        )
-        normalized_output, parsed_json, repair_details = self._parse_output(
-            raw_output, repair_steps
-        )
+        return self._evaluate_sample(sample_id, raw_output, latency_ms, call_info)
 
-        # Validate
-        check_results = self._validate_response(normalized_output, parsed_json)
-        checks_passed = all(r["passed"] for r in check_results)
+    async def _arun_single_sample(
+        self, limiter: ConcurrencyLimiter, run: FixtureRun, sample_id: int
+    ) -> SampleResult:
+        """
+        Run a single sample with generation admitted through the limiter.
 
-        return SampleResult(
-            sample_id=sample_id,
-            output=normalized_output,
-            parsed=parsed_json,
-            latency_ms=latency_ms,
-            checks_passed=checks_passed,
-            check_results=check_results,
+        Samples already recorded in the checkpoint journal are replayed
+        without calling the adapter; new samples are appended to it.
+        """
+        if self.journal is not None:
+            recorded = self.journal.get(run.unit_key(sample_id))
+            if recorded is not None:
+                return recorded
+
+        prior = run.prior_samples.get(sample_id)
+        if prior is not None and run.reuse == "reuse":
+            sample = prior
+        elif prior is not None:
+            # Checks changed but generation inputs did not: re-validate offline
+            sample = await limiter.offload(
+                self._evaluate_sample, sample_id, prior.raw_output, prior.latency_ms, prior.metadata
+            )
+        elif self.dispatcher is not None:
+            sample = await self._adispatch(limiter, run, sample_id)
+        else:
+            async with run.slot:
+                raw_output, latency_ms, call_info = await self._agenerate(limiter, run, sample_id)
+
+                sample = await limiter.offload(
+                    self._evaluate_sample, sample_id, raw_output, latency_ms, call_info
+                )
+
+        if self.journal is not None:
+            self.journal.record(run.unit_key(sample_id), sample)
+
+        return sample
+
+    async def _adispatch(
+        self, limiter: ConcurrencyLimiter, run: FixtureRun, sample_id: int
+    ) -> SampleResult:
+        """
+        Generate and evaluate one sample on a queue worker.
+
+        The target's rate limiter admits units here, so its limits hold across
+        all workers. Judge and embedding adapters given to this runner cannot
+        be handed to workers, so with either the sample is re-evaluated here.
+        """
+        key, payload = unit_key(*run.unit_key(sample_id)), run.unit_payload(sample_id)
+        if run.rate_limiter is None:
+            result = await self.dispatcher.submit(key, payload)
+        else:
+            tokens = estimate_tokens(
+                run.final_prompt, run.target.get("params", {}).get("max_tokens")
+            )
+            async with run.rate_limiter.admit(tokens) as admission:
+                result = await self.dispatcher.submit(key, payload)
+                admission.report(result.get("metadata") or {})
+
+        sample = SampleResult.from_dict(result)
+        if self.judge_adapter is None and self.embedding_adapter is None:
+            return sample
+        return await limiter.offload(
+            self._evaluate_sample, sample_id, sample.raw_output, sample.latency_ms, sample.metadata
         )
 
-    def _run_fixture_with_sampling(
-        self,
-        adapter,
-        schema: dict | None,
-        final_prompt: str,
-        fixture_id: str,
+    async def _agenerate(
+        self, limiter: ConcurrencyLimiter, run: FixtureRun, sample_id: int
+    ) -> tuple[str, float, dict[str, Any]]:
+        """Generate one sample, admitted by the target's rate limiter and the limiter."""
+        if run.batch is not None and sample_id in run.batch:
+            return await run.batch.take(
+                sample_id, functools.partial(self._agenerate_many, limiter, run)
+            )
+
+        if run.rate_limiter is None:
+            return await limiter.call(
+                run.target_id,
+                self._generate,
+                run.adapter,
+                run.final_prompt,
+                run.schema,
+                sample_id,
+            )
+
+        tokens = estimate_tokens(run.final_prompt, run.target.get("params", {}).get("max_tokens"))
+        async with run.rate_limiter.admit(tokens) as admission:
+            raw_output, latency_ms, call_info = await limiter.call(
+                run.target_id,
+                self._generate,
+                run.adapter,
+                run.final_prompt,
+                run.schema,
+                sample_id,
+            )
+            admission.report(call_info)
+
+        return raw_output, latency_ms, call_info
+
+    async def _agenerate_many(
+        self, limiter: ConcurrencyLimiter, run: FixtureRun, sample_ids: list[int]
+    ) -> dict[int, tuple[str, float, dict[str, Any]]]:
+        """Generate several samples with one generate_many() call, admitted like _agenerate()."""
+        if run.rate_limiter is None:
+            return await limiter.call(
+                run.target_id,
+                self._generate_many,
+                run.adapter,
+                run.final_prompt,
+                run.schema,
+                sample_ids,
+            )
+
+        # The prompt is charged once, the output budget per choice
+        max_tokens = run.target.get("params", {}).get("max_tokens") or 0
+        tokens = estimate_tokens(run.final_prompt, max_tokens * len(sample_ids))
+        async with run.rate_limiter.admit(tokens) as admission:
+            results = await limiter.call(
+                run.target_id,
+                self._generate_many,
+                run.adapter,
+                run.final_prompt,
+                run.schema,
+                sample_ids,
+            )
+            admission.report(results[sample_ids[0]][2])
+
+        return results
+
+    def _generate_many(
+        self, adapter, final_prompt: str, schema: dict | None, sample_ids: list[int]
+    ) -> dict[int, tuple[str, float, dict[str, Any]]]:
+        """
+        Call the adapter's generate_many() and split the reported call details per sample.
+
+        Must run in the thread that performs the call.
+
+        Returns:
+            {sample_id: (raw_output, latency_ms, call_info)}
+        """
+        with capture_call_info() as call_info:
+            kwargs = {"sample_indices": sample_ids} if isinstance(adapter, CachingAdapter) else {}
+            completions = adapter.generate_many(
+                final_prompt, len(sample_ids), schema=schema, **kwargs
+            )
+
+        cache_hits = call_info.pop("cache_hits", None)
+        results = {}
+        for index, (sample_id, (raw_output, latency_ms)) in enumerate(
+            zip(sample_ids, completions, strict=True)
+        ):
+            info = {**call_info, "multi_completion": {"choices": len(sample_ids), "index": index}}
+            if index:
+                # Usage is counted once, on the first choice
+                for name in _REQUEST_USAGE_FIELDS:
+                    info.pop(name, None)
+            if cache_hits is not None:
+                info["cache_hit"] = cache_hits[index]
+            results[sample_id] = (raw_output, latency_ms, info)
+        return results
+
+    def _completion_batch(self, run: FixtureRun, collapsing: bool) -> CompletionBatch | None:
+        """
+        Batch a fixture's samples into one multi-completion request where possible.
+
+        Needs an adapter advertising ``multi_completion`` and is skipped when
+        samples are streamed, drawn by queue workers, stopped early or
+        collapsed, since those decide per sample whether to generate at all.
+        """
+        if (
+            self.n_samples < 2
+            or self.stream
+            or self.dispatcher is not None
+            or collapsing
+            or self.early_stopping
+            or self.ci_stopping
+            or not run.adapter.capabilities().multi_completion
+        ):
+            return None
+
+        pending = [
+            sample_id
+            for sample_id in range(self.n_samples)
+            if sample_id not in run.prior_samples
+            and (self.journal is None or self.journal.get(run.unit_key(sample_id)) is None)
+        ]
+        return CompletionBatch(pending) if len(pending) > 1 else None
+
+    async def _arun_fixture_with_sampling(
+        self, limiter: ConcurrencyLimiter, run: FixtureRun
     ) -> dict[str, Any]:
         """
         Run a fixture with N-sampling and aggregation.
 
         Returns fixture result dict with status, checks, sampling metadata, etc.
         """
+        collapse_blocker = self._collapse_blocker(run) if self.collapse_probe else None
+        run.batch = self._completion_batch(
+            run, self.collapse_probe is not None and collapse_blocker is None
+        )
+
         # Create sampler
         sampler = create_sampler(
             n=self.n_samples,
             seed=self.seed,
             aggregation=self.aggregation,
             bootstrap_samples=self.bootstrap_samples,
+            collapse_probe=self.collapse_probe if collapse_blocker is None else None,
+            **self._stopping_kwargs(),
         )
 
         # Generate samples
-        def generator(sample_id: int) -> SampleResult:
-            return self._run_single_sample(adapter, schema, final_prompt, sample_id)
-
-        aggregated = sampler.sample_n(generator)
+        async def generator(sample_id: int) -> SampleResult:
+            return await self._arun_single_sample(limiter, run, sample_id)
+
+        aggregated = await sampler.asample_n(generator)
+        if collapse_blocker and self.n_samples > self.collapse_probe:
+            aggregated.aggregation_metadata["collapse"] = {
+                "collapsed": False,
+                "reason": collapse_blocker,
+            }
 
+        return self._build_fixture_result(run.fixture_id, aggregated)
+
+    def _collapse_blocker(self, run: FixtureRun) -> str | None:
+        """Why a target's generations are not provably deterministic (None if they are)."""
+        params = run.target.get("params", {})
+        if params.get("temperature") != 0:
+            return "temperature is not 0"
+        if params.get("seed") is None:
+            return "no seed in target params"
+        if not run.adapter.capabilities().supports_seed:
+            return "provider does not support seeds"
+        return None
+
+    def _sample_summary(self, sample: SampleResult) -> dict[str, Any]:
+        """Summarize a sample for sampling_metadata."""
+        summary = {
+            "sample_id": sample.sample_id,
+            "latency_ms": sample.latency_ms,
+            "checks_passed": sample.checks_passed,
+        }
+        # Cache hits replay the recorded latency; flag them so budgets can be audited
+        if "cache_hit" in sample.metadata:
+            summary["cache_hit"] = sample.metadata["cache_hit"]
+        if "stream" in sample.metadata:
+            summary["stream"] = sample.metadata["stream"]
+        prompt_cache = {
+            name: sample.metadata[name] for name in PROMPT_CACHE_FIELDS if name in sample.metadata
+        }
+        if prompt_cache:
+            summary["prompt_cache"] = prompt_cache
+        if "multi_completion" in sample.metadata:
+            summary["multi_completion"] = sample.metadata["multi_completion"]["choices"]
+        if "collapsed_from" in sample.metadata:
+            summary["collapsed_from"] = sample.metadata["collapsed_from"]
+        if sample.metadata.get("early_abort"):
+            summary["aborted_by"] = sample.metadata["early_abort"]["result"]["type"]
+        return summary
+
+    def _stopping_kwargs(self) -> dict[str, Any]:
+        """Translate EP early-stopping settings into create_sampler() kwargs."""
+        kwargs: dict[str, Any] = {"early_stopping": self.early_stopping}
+        if self.ci_stopping:
+            kwargs["ci_stop_threshold"] = self.ci_stopping["threshold"]
+            kwargs["ci_stop_method"] = self.ci_stopping.get("method", "wilson")
+            kwargs["ci_stop_min_samples"] = self.ci_stopping.get("min_samples", 2)
+        return kwargs
+
+    def _build_fixture_result(
+        self, fixture_id: str, aggregated: AggregatedResult
+    ) -> dict[str, Any]:
+        """Build the fixture result dict from aggregated samples."""
         # Determine status
         if aggregated.all_passed:
             status = "PASS"
@@ -282,10 +912,19 @@ class ContractRunner:
             status = "FAIL"
 
         # Build repair ledger from samples
-        repair_ledger = []
-        for sample in aggregated.samples:
-            if hasattr(sample, "repair_details"):
-                repair_ledger.append(sample.repair_details)
+        repair_ledger = [sample.repair_details for sample in aggregated.samples]
+
+        sampling_metadata = {
+            "n_samples": len(aggregated.samples),
+            "aggregation_policy": aggregated.aggregation_policy,
+            "pass_rate": aggregated.pass_rate,
+            "confidence_interval": aggregated.confidence_interval,
+            "samples": [self._sample_summary(s) for s in aggregated.samples],
+        }
+        if "early_stopping" in aggregated.aggregation_metadata:
+            sampling_metadata["early_stopping"] = aggregated.aggregation_metadata["early_stopping"]
+        if "collapse" in aggregated.aggregation_metadata:
+            sampling_metadata["collapse"] = aggregated.aggregation_metadata["collapse"]
 
         return {
             "fixture_id": fixture_id,
@@ -298,20 +937,8 @@ class ContractRunner:
             "repair_ledger": repair_ledger,
             "status": status,
             "checks": aggregated.samples[0].check_results,
-            "sampling_metadata": {
-                "n_samples": len(aggregated.samples),
-                "aggregation_policy": aggregated.aggregation_policy,
-                "pass_rate": aggregated.pass_rate,
-                "confidence_interval": aggregated.confidence_interval,
-                "samples": [
-                    {
-                        "sample_id": s.sample_id,
-                        "latency_ms": s.latency_ms,
-                        "checks_passed": s.checks_passed,
-                    }
-                    for s in aggregated.samples
-                ],
-            },
+            "sampling_metadata": sampling_metadata,
+            "samples": aggregated.samples,
         }
 
     def _save_artifacts(
@@ -353,7 +980,7 @@ class ContractRunner:
         }
         metadata["artifact_paths"] = artifact_paths
 
-        run_json_path.write_text(json.dumps(metadata, indent=2))
+        run_json_path.write_text(jsoncodec.dumps(metadata, indent=2), encoding="utf-8")
 
         return artifact_paths
 
@@ -361,158 +988,362 @@ class ContractRunner:
         """
         Execute the contract and return results.
 
+        Thin synchronous wrapper over arun().
+
         Returns:
             Results dict with targets, fixtures, summaries, and artifact paths
         """
-        targets = self.ep.get("targets", [])
-        fixtures = self.ep.get("fixtures", [])
-        checks = self.es.get("checks", [])
+        return run_sync(self.arun())
 
-        results = {
-            "targets": [],
-            "artifact_base_dir": str(self.save_io_dir) if self.save_io_dir else None,
-            "pcsl_version": "0.3.0",
-        }
+    async def arun(self) -> dict[str, Any]:
+        """
+        Execute the contract asynchronously and return results.
 
-        for target in targets:
-            adapter = self._create_adapter(target)
+        Collects the event stream of aiter_results(); fixture order in the
+        results follows the EP regardless of completion order.
 
-            # Determine effective mode using capability negotiation
-            effective_mode, is_nonenforceable, negotiation_log = self._determine_effective_mode(
-                self.exec_mode, adapter
-            )
-
-            target_id = f"{target.get('type')}:{target.get('model')}"
-
-            # Derive schema if enforce mode
-            schema = None
-            if effective_mode == "enforce":
-                capabilities = adapter.capabilities()
-                if capabilities.schema_guided_json:
-                    schema = derive_json_schema_from_es(self.es)
-
-            target_result = {
-                "target": target,
-                "target_id": target_id,
-                "execution": {
-                    "requested_mode": self.exec_mode,
-                    "effective_mode": effective_mode,
-                    "is_nonenforceable": is_nonenforceable,
-                    "negotiation_log": negotiation_log,
-                    "max_retries": self.max_retries,
-                    "repair_policy": self.repair_policy,
-                    "sampling": {
-                        "n": self.n_samples,
-                        "seed": self.seed,
-                        "aggregation": self.aggregation,
-                    },
-                },
-                "fixtures": [],
-                "summary": {},
+        Returns:
+            Results dict with targets, fixtures, summaries, and artifact paths
+        """
+        collector = ResultCollector(
+            {
+                "artifact_base_dir": str(self.save_io_dir) if self.save_io_dir else None,
+                "pcsl_version": "0.3.0",
             }
+        )
 
-            all_latencies = []
-            all_check_results = []
+        async for event in self.aiter_results():
+            collector.add(event)
 
-            # Run each fixture
-            for fixture in fixtures:
-                fixture_id = fixture.get("id")
-                final_prompt = self._build_prompt(fixture, effective_mode)
+        return collector.results()
 
-                # Run with sampling
-                fixture_result = self._run_fixture_with_sampling(
-                    adapter, schema, final_prompt, fixture_id
-                )
+    def iter_results(self) -> Iterator[RunEvent]:
+        """
+        Execute the contract, yielding RunEvents as fixtures and targets complete.
 
-                all_latencies.append(fixture_result["latency_ms"])
-                all_check_results.extend(fixture_result["checks"])
-
-                # Save artifacts and get paths
-                artifact_paths = {}
-                if self.save_io_dir:
-                    # Compute prompt hash
-                    prompt_hash = hashlib.sha256(final_prompt.encode()).hexdigest()
-
-                    metadata = {
-                        "pcsl": self.pd.get("pcsl", "0.3.0"),
-                        "target": target_id,
-                        "params": target.get("params", {}),
-                        "execution": target_result["execution"],
-                        "latency_ms": fixture_result["latency_ms"],
-                        "status": fixture_result["status"],
-                        "sampling_metadata": fixture_result.get("sampling_metadata", {}),
-                        "repair_ledger": fixture_result.get("repair_ledger", []),
-                        "checks": fixture_result["checks"],
-                        "prompt_hash": prompt_hash,
-                        "timestamp": datetime.utcnow().isoformat() + "Z",
-                    }
+        Execution pauses while the consumer handles an event. Must not be called
+        from a thread with a running event loop; use aiter_results() there.
 
-                    artifact_paths = self._save_artifacts(
-                        target_id,
-                        fixture_id,
-                        final_prompt,
-                        fixture_result["raw_output"],
-                        fixture_result["normalized_output"],
-                        metadata,
-                    )
+        Yields:
+            RunEvent per completed fixture and target, then a final "run" event
+        """
+        loop = asyncio.new_event_loop()
+        events = self.aiter_results()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(events.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(events.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def aiter_results(self) -> AsyncIterator[RunEvent]:
+        """
+        Execute the contract, yielding RunEvents as fixtures and targets complete.
+
+        Targets, fixtures and samples run concurrently under the limits of
+        ``execution.concurrency``. Events arrive in completion order and carry
+        target/fixture indices into the EP. The on_fixture_complete and
+        on_target_complete hooks fire as each event is emitted.
+
+        Yields:
+            RunEvent per completed fixture and target, then a final "run" event
+        """
+        targets = self.ep.get("targets", [])
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        if self.checkpoint_dir:
+            self.journal = CheckpointJournal(
+                self.checkpoint_dir,
+                artifact_hashes(self.pd, self.es, self.ep),
+                resume=self.resume,
+            )
 
-                # Add to results
-                fixture_result_item = {
-                    "fixture_id": fixture_id,
-                    "status": fixture_result["status"],
-                    "latency_ms": fixture_result["latency_ms"],
-                    "mean_latency_ms": fixture_result.get("mean_latency_ms", 0),
-                    "sampling_metadata": fixture_result.get("sampling_metadata", {}),
-                    "repair_ledger": fixture_result.get("repair_ledger", []),
-                    "checks": fixture_result["checks"],
+        if self.cache_config.enabled:
+            self.response_cache = ResponseCache.from_config(self.cache_config)
+
+        work_queue = None
+        if self.work_queue_path:
+            work_queue = WorkQueue(self.work_queue_path)
+            work_queue.prepare(
+                artifact_hashes(self.pd, self.es, self.ep),
+                {"pd": self.pd, "es": self.es, "ep": self.ep},
+            )
+            self.dispatcher = QueueDispatcher(work_queue)
+
+        limiter = ConcurrencyLimiter(self.concurrency)
+        self.reuse_counts = {"reuse": 0, "revalidate": 0, "regenerate": 0}
+        transport_before = self.transport.stats()
+
+        async def produce():
+            try:
+                await asyncio.gather(
+                    *(
+                        self._arun_target(limiter, target_index, target, queue.put_nowait)
+                        for target_index, target in enumerate(targets)
+                    )
+                )
+            finally:
+                queue.put_nowait(done)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while (event := await queue.get()) is not done:
+                if event.kind == "fixture" and self.on_fixture_complete:
+                    self.on_fixture_complete(event.target_id, event.payload)
+                elif event.kind == "target" and self.on_target_complete:
+                    self.on_target_complete(event.payload)
+                yield event
+
+            # Surface producer errors
+            await producer
+
+            run_extras = {}
+            if self.response_cache:
+                run_extras["cache"] = self.response_cache.stats()
+            if self.prior_run:
+                run_extras["incremental"] = dict(self.reuse_counts)
+            if work_queue:
+                run_extras["work_queue"] = work_queue.stats()
+            if self.check_costs:
+                run_extras["checks"] = self.check_costs.stats()
+            if self.output_memo and self.output_memo.hits + self.output_memo.misses:
+                run_extras["output_memo"] = self.output_memo.stats()
+            if transport := transport_stats_delta(transport_before, self.transport.stats()):
+                run_extras["transport"] = transport
+            if self.shard:
+                run_extras["shard"] = {
+                    **self.shard.to_dict(),
+                    "fixture_indices": [i for i, _ in self._shard_fixtures()],
                 }
+            yield RunEvent(kind="run", payload=run_extras)
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+            limiter.close()
+            if self.response_cache:
+                self.response_cache.close()
+                self.response_cache = None
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            if work_queue:
+                await self.dispatcher.aclose()
+                self.dispatcher = None
+                work_queue.close_run()
+                work_queue.close()
+
+    def _shard_fixtures(self) -> list[tuple[int, dict[str, Any]]]:
+        """Return (EP index, fixture) pairs this runner's shard is responsible for."""
+        fixtures = list(enumerate(self.ep.get("fixtures", [])))
+        if self.shard is None:
+            return fixtures
+        return [(i, fixture) for i, fixture in fixtures if self.shard.owns(fixture.get("id"))]
+
+    async def _arun_target(
+        self,
+        limiter: ConcurrencyLimiter,
+        target_index: int,
+        target: dict[str, Any],
+        emit: Callable[[RunEvent], None],
+    ):
+        """Run all fixtures against one target, emitting fixture and target events."""
+        adapter = self._create_adapter(target)
 
-                # Add artifact paths if they were saved
-                if artifact_paths:
-                    fixture_result_item["artifact_paths"] = artifact_paths
+        # Determine effective mode using capability negotiation
+        effective_mode, is_nonenforceable, negotiation_log = self._determine_effective_mode(
+            self.exec_mode, adapter
+        )
 
-                target_result["fixtures"].append(fixture_result_item)
+        target_id = f"{target.get('type')}:{target.get('model')}"
+
+        # Derive schema if enforce mode
+        schema = None
+        if effective_mode == "enforce":
+            capabilities = adapter.capabilities()
+            if capabilities.schema_guided_json:
+                schema = derive_json_schema_from_es(self.es)
+
+        if self.response_cache:
+            adapter = CachingAdapter(adapter, self.response_cache, target.get("type"))
+
+        # Pace generate calls when the target declares (possibly empty) rate limits
+        rate_limiter = None
+        if "rate_limit" in target:
+            rate_limiter = RateLimiter(RateLimitConfig.from_dict(target["rate_limit"]))
+
+        target_result = {
+            "target": target,
+            "target_id": target_id,
+            "execution": {
+                "requested_mode": self.exec_mode,
+                "effective_mode": effective_mode,
+                "is_nonenforceable": is_nonenforceable,
+                "negotiation_log": negotiation_log,
+                "max_retries": self.max_retries,
+                "repair_policy": self.repair_policy,
+                "sampling": {
+                    "n": self.n_samples,
+                    "seed": self.seed,
+                    "aggregation": self.aggregation,
+                },
+            },
+            "fixtures": [],
+            "summary": {},
+        }
 
-            # Run latency budget checks if any
-            latency_checks = [c for c in checks if c.get("type") == "pc.check.latency_budget"]
-            for check in latency_checks:
-                result = self.validator.run_check(
-                    check_spec=check,
-                    response_text="",
-                    all_latencies=all_latencies,
+        summary = TargetSummary()
+
+        async def run_fixture(fixture_index: int, fixture: dict[str, Any]):
+            fixture_result = await self._arun_fixture(
+                limiter,
+                target_index,
+                target,
+                target_id,
+                target_result,
+                adapter,
+                rate_limiter,
+                schema,
+                fixture,
+            )
+            summary.add(fixture_result)
+            emit(
+                RunEvent(
+                    kind="fixture",
+                    payload=fixture_result,
+                    target_id=target_id,
+                    target_index=target_index,
+                    fixture_index=fixture_index,
                 )
-                all_check_results.append(result)
-
-            # Calculate summary
-            total_checks = len(all_check_results)
-            passed_checks = sum(1 for r in all_check_results if r["passed"])
-            pass_rate = passed_checks / total_checks if total_checks > 0 else 0
-
-            # Count statuses
-            fixture_statuses = [f["status"] for f in target_result["fixtures"]]
-            status_counts = {
-                "PASS": fixture_statuses.count("PASS"),
-                "REPAIRED": 0,  # Deprecated in v0.3.0
-                "FAIL": fixture_statuses.count("FAIL"),
-                "NONENFORCEABLE": 1 if is_nonenforceable else 0,
-            }
+            )
 
-            # Determine overall status
-            if is_nonenforceable:
-                status = "YELLOW"
-            elif status_counts["FAIL"] > 0:
-                status = "RED"
-            else:
-                status = "GREEN"
-
-            target_result["summary"] = {
-                "total_checks": total_checks,
-                "passed_checks": passed_checks,
-                "pass_rate": pass_rate,
-                "status": status,
-                "fixture_statuses": status_counts,
+        await asyncio.gather(
+            *(run_fixture(i, fixture) for i, fixture in self._ordered_fixtures(effective_mode))
+        )
+
+        if rate_limiter:
+            target_result["execution"]["rate_limit"] = rate_limiter.stats()
+        adaptive = limiter.adaptive_limit(target_id)
+        if adaptive is not None:
+            target_result["execution"]["concurrency"] = adaptive.stats()
+
+        target_result["summary"] = summary.finalize(
+            is_nonenforceable, self._run_latency_checks(summary)
+        )
+        emit(
+            RunEvent(
+                kind="target",
+                payload=target_result,
+                target_id=target_id,
+                target_index=target_index,
+            )
+        )
+
+    async def _arun_fixture(
+        self,
+        limiter: ConcurrencyLimiter,
+        target_index: int,
+        target: dict[str, Any],
+        target_id: str,
+        target_result: dict[str, Any],
+        adapter,
+        rate_limiter: RateLimiter | None,
+        schema: dict | None,
+        fixture: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Run one fixture, save its artifacts and return the result item."""
+        fixture_id = fixture.get("id")
+        effective_mode = target_result["execution"]["effective_mode"]
+        template = self._prompt_template(effective_mode)
+        fixture_input = fixture.get("input", "")
+        final_prompt = template.render(fixture_input)
+        prompt_hash = template.hash(fixture_input)
+        # Custom adapters and test doubles need not talk to a server
+        base_url = getattr(adapter, "base_url", None)
+        generation_fp = generation_fingerprint(
+            final_prompt,
+            target,
+            schema,
+            prompt_hash,
+            base_url if isinstance(base_url, str) else None,
+        )
+        evaluation_fp = evaluation_fingerprint(self.pd, self.es, self.repair_policy)
+
+        run = FixtureRun(
+            target_index=target_index,
+            target_id=target_id,
+            target=target,
+            fixture_id=fixture_id,
+            adapter=adapter,
+            rate_limiter=rate_limiter,
+            schema=schema,
+            final_prompt=final_prompt,
+            slot=limiter.fixture_slot(),
+        )
+        if self.prior_run:
+            run.reuse, run.prior_samples = self.prior_run.plan(
+                target_id, fixture_id, generation_fp, evaluation_fp
+            )
+            self.reuse_counts[run.reuse] += 1
+
+        # Run with sampling
+        fixture_result = await self._arun_fixture_with_sampling(limiter, run)
+
+        # Save artifacts and get paths
+        artifact_paths = {}
+        if self.save_io_dir:
+            metadata = {
+                "pcsl": self.pd.get("pcsl", "0.3.0"),
+                "target": target_id,
+                "params": target.get("params", {}),
+                "execution": target_result["execution"],
+                "latency_ms": fixture_result["latency_ms"],
+                "status": fixture_result["status"],
+                "sampling_metadata": fixture_result.get("sampling_metadata", {}),
+                "repair_ledger": fixture_result.get("repair_ledger", []),
+                "checks": fixture_result["checks"],
+                "prompt_hash": prompt_hash,
+                "fingerprints": {"generation": generation_fp, "evaluation": evaluation_fp},
+                "samples": [s.to_dict() for s in fixture_result["samples"]],
+                "timestamp": datetime.utcnow().isoformat() + "Z",
             }
 
-            results["targets"].append(target_result)
+            artifact_paths = self._save_artifacts(
+                target_id,
+                fixture_id,
+                final_prompt,
+                fixture_result["raw_output"],
+                fixture_result["normalized_output"],
+                metadata,
+            )
 
-        return results
+        # Add to results
+        fixture_result_item = {
+            "fixture_id": fixture_id,
+            "status": fixture_result["status"],
+            "latency_ms": fixture_result["latency_ms"],
+            "mean_latency_ms": fixture_result.get("mean_latency_ms", 0),
+            "sampling_metadata": fixture_result.get("sampling_metadata", {}),
+            "repair_ledger": fixture_result.get("repair_ledger", []),
+            "checks": fixture_result["checks"],
+        }
+
+        # Add artifact paths if they were saved
+        if artifact_paths:
+            fixture_result_item["artifact_paths"] = artifact_paths
+
+        if self.prior_run:
+            fixture_result_item["reuse"] = run.reuse
+
+        return fixture_result_item
+
+    def _run_latency_checks(self, summary: TargetSummary) -> list[dict[str, Any]]:
+        """Run target-level latency, TTFT and throughput budgets over a target's samples."""
+        return self.validator.run_latency_checks(
+            self.es.get("checks", []), summary.latencies, summary.ttfts, summary.throughputs
+        )
@@ -5,15 +5,19 @@ Provides N-sampling with configurable seeds, aggregation policies,
 and bootstrap confidence intervals for statistical validation.
 """
 
+import asyncio
 import random
 from collections import Counter
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
 import numpy as np
 
+from ..stats.intervals import jeffreys_interval, wilson_interval
+
 AggregationPolicy = Literal["majority", "all", "any", "first"]
+IntervalMethod = Literal["wilson", "jeffreys"]
 
 
 @dataclass
@@ -25,6 +29,11 @@ class SamplingConfig:
     aggregation: AggregationPolicy = "first"
     bootstrap_samples: int = 1000
     confidence_level: float = 0.95
+    early_stopping: bool = False
+    ci_stop_threshold: float | None = None
+    ci_stop_method: IntervalMethod = "wilson"
+    ci_stop_min_samples: int = 2
+    collapse_probe: int | None = None
 
 
 @dataclass
@@ -37,6 +46,38 @@ class SampleResult:
     latency_ms: float
     checks_passed: bool
     check_results: list[dict[str, Any]]
+    metadata: dict[str, Any] = field(default_factory=dict)
+    raw_output: str | None = None
+    repair_details: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for journals and saved artifacts."""
+        return {
+            "sample_id": self.sample_id,
+            "raw_output": self.raw_output,
+            "output": self.output,
+            "parsed": self.parsed,
+            "latency_ms": self.latency_ms,
+            "checks_passed": self.checks_passed,
+            "check_results": self.check_results,
+            "metadata": self.metadata,
+            "repair_details": self.repair_details,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SampleResult":
+        """Rebuild a sample serialized by to_dict()."""
+        return cls(
+            sample_id=data["sample_id"],
+            output=data["output"],
+            parsed=data["parsed"],
+            latency_ms=data["latency_ms"],
+            checks_passed=data["checks_passed"],
+            check_results=data["check_results"],
+            metadata=data.get("metadata", {}),
+            raw_output=data.get("raw_output"),
+            repair_details=data.get("repair_details", {}),
+        )
 
 
 @dataclass
@@ -182,22 +223,268 @@ class Sampler:
 
         return (lower, upper)
 
+    @property
+    def stopping_enabled(self) -> bool:
+        """Whether any early-stopping rule is configured."""
+        return self.config.early_stopping or self.config.ci_stop_threshold is not None
+
+    def stop_reason(self, samples: list[SampleResult]) -> str | None:
+        """
+        Decide whether drawing further samples can still change the outcome.
+
+        Args:
+            samples: Samples drawn so far, in sample_id order
+
+        Returns:
+            Reason string if sampling can stop, otherwise None
+        """
+        n = self.config.n
+        k = len(samples)
+        if k >= n:
+            return None
+
+        passes = sum(1 for s in samples if s.checks_passed)
+        failures = k - passes
+
+        if self.config.early_stopping:
+            policy = self.config.aggregation
+            if policy == "first" and k >= 1:
+                return "policy:first sample decides"
+            if policy == "any" and passes > 0:
+                return "policy:any passed"
+            if policy == "all" and failures > 0:
+                return "policy:all failed"
+            if policy == "majority":
+                if passes > n / 2:
+                    return "policy:majority passed"
+                if failures >= n / 2:
+                    return "policy:majority failed"
+
+        threshold = self.config.ci_stop_threshold
+        if threshold is not None and k >= self.config.ci_stop_min_samples:
+            interval_fn = (
+                jeffreys_interval if self.config.ci_stop_method == "jeffreys" else wilson_interval
+            )
+            lower, upper = interval_fn(passes, k, self.config.confidence_level)
+            if lower > threshold:
+                return f"ci:{self.config.ci_stop_method} lower {lower:.3f} > {threshold}"
+            if upper < threshold:
+                return f"ci:{self.config.ci_stop_method} upper {upper:.3f} < {threshold}"
+
+        return None
+
+    def _finalize(self, samples: list[SampleResult], reason: str | None) -> AggregatedResult:
+        """Aggregate samples and attach early-stopping metadata."""
+        aggregated = self.aggregate(samples)
+
+        if self.stopping_enabled:
+            aggregated.aggregation_metadata["early_stopping"] = {
+                "stopped_early": reason is not None,
+                "reason": reason,
+                "samples_drawn": len(samples),
+                "samples_saved": self.config.n - len(samples),
+            }
+
+        return aggregated
+
     def sample_n(self, generator_fn: Callable[[int], SampleResult]) -> AggregatedResult:
         """
         Run N samples using the provided generator function.
 
+        With early stopping enabled, stops as soon as stop_reason() fires.
+        With a collapse probe, the probe samples are drawn first (see
+        collapse()).
+
         Args:
             generator_fn: Function that takes sample_id and returns SampleResult
 
         Returns:
             Aggregated result
         """
+        probe = self._collapse_probe_size()
+        if probe:
+            probe_samples = [generator_fn(i) for i in range(probe)]
+            collapsed = self.collapse(probe_samples)
+            if collapsed is not None:
+                return collapsed
+            generator_fn = _replay(probe_samples, generator_fn)
+
         samples = []
+        reason = None
         for i in range(self.config.n):
             sample = generator_fn(i)
             samples.append(sample)
 
-        return self.aggregate(samples)
+            if self.stopping_enabled:
+                reason = self.stop_reason(samples)
+                if reason:
+                    break
+
+        return self._annotate_collapse(self._finalize(samples, reason), probe)
+
+    async def asample_n(
+        self, generator_fn: Callable[[int], Awaitable[SampleResult]]
+    ) -> AggregatedResult:
+        """
+        Run N samples concurrently using the provided coroutine function.
+
+        Samples are aggregated in sample_id order regardless of completion order.
+        With early stopping enabled, the stopping rule is evaluated on the
+        contiguous prefix of finished samples (so the decision does not depend
+        on timing) and samples still pending or in flight are cancelled. A
+        provider call already running cannot be interrupted: it completes (and
+        is billed), and its sample keeps its concurrency slots until then. With
+        a collapse probe, the probe samples are drawn first (see collapse()).
+
+        Args:
+            generator_fn: Coroutine function that takes sample_id and returns SampleResult
+
+        Returns:
+            Aggregated result
+        """
+        probe = self._collapse_probe_size()
+        if probe:
+            probe_samples = list(await asyncio.gather(*(generator_fn(i) for i in range(probe))))
+            collapsed = self.collapse(probe_samples)
+            if collapsed is not None:
+                return collapsed
+            generator_fn = _areplay(probe_samples, generator_fn)
+
+        return self._annotate_collapse(await self._asample_all(generator_fn), probe)
+
+    async def _asample_all(
+        self, generator_fn: Callable[[int], Awaitable[SampleResult]]
+    ) -> AggregatedResult:
+        """Run all N samples concurrently (see asample_n())."""
+        if not self.stopping_enabled:
+            samples = await asyncio.gather(*(generator_fn(i) for i in range(self.config.n)))
+            return self.aggregate(list(samples))
+
+        finished: dict[int, SampleResult] = {}
+        prefix: list[SampleResult] = []
+        decision: dict[str, str | None] = {"reason": None}
+        tasks: list[asyncio.Task] = []
+
+        def cancel_others(current: asyncio.Task | None):
+            for task in tasks:
+                if task is not current and not task.done():
+                    task.cancel()
+
+        async def run_one(i: int):
+            # Bookkeeping runs synchronously after the sample returns, before any
+            # sibling woken by the released fixture slot gets to start generating.
+            try:
+                finished[i] = await generator_fn(i)
+            except Exception:
+                cancel_others(asyncio.current_task())
+                raise
+
+            while decision["reason"] is None and len(prefix) in finished:
+                prefix.append(finished[len(prefix)])
+                decision["reason"] = self.stop_reason(prefix)
+
+            if decision["reason"]:
+                cancel_others(asyncio.current_task())
+
+        tasks.extend(asyncio.ensure_future(run_one(i)) for i in range(self.config.n))
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+
+        return self._finalize(prefix, decision["reason"])
+
+    def _collapse_probe_size(self) -> int | None:
+        """Number of probe samples to draw, or None if collapsing cannot save any."""
+        probe = self.config.collapse_probe
+        return probe if probe and self.config.n > probe else None
+
+    def collapse(self, probe_samples: list[SampleResult]) -> AggregatedResult | None:
+        """
+        Synthesize the remaining samples if the probe samples are identical.
+
+        Meant for provably deterministic generation (temperature 0 with a
+        seed the provider honours): identical raw outputs from the probe show
+        further samples would repeat them. Synthesized samples copy the first
+        probe sample, replay its latency and are marked with
+        ``metadata["collapsed_from"]``.
+
+        Args:
+            probe_samples: The first samples, in sample_id order
+
+        Returns:
+            Aggregated result over all N samples, or None if the probe diverged
+        """
+        first = probe_samples[0]
+        text = _sample_text(first)
+        if any(_sample_text(sample) != text for sample in probe_samples[1:]):
+            return None
+
+        samples = list(probe_samples)
+        for sample_id in range(len(probe_samples), self.config.n):
+            samples.append(
+                SampleResult(
+                    sample_id=sample_id,
+                    output=first.output,
+                    parsed=first.parsed,
+                    latency_ms=first.latency_ms,
+                    checks_passed=first.checks_passed,
+                    check_results=[dict(result) for result in first.check_results],
+                    metadata={"collapsed_from": first.sample_id},
+                    raw_output=first.raw_output,
+                    repair_details=dict(first.repair_details),
+                )
+            )
+
+        aggregated = self._finalize(samples, None)
+        aggregated.aggregation_metadata["collapse"] = {
+            "collapsed": True,
+            "probe_samples": len(probe_samples),
+            "samples_synthesized": self.config.n - len(probe_samples),
+        }
+        return aggregated
+
+    def _annotate_collapse(self, aggregated: AggregatedResult, probe: int | None):
+        """Record that a collapse probe diverged and full sampling ran."""
+        if probe:
+            aggregated.aggregation_metadata["collapse"] = {
+                "collapsed": False,
+                "probe_samples": probe,
+                "reason": "probe outputs diverged",
+            }
+        return aggregated
+
+
+def _sample_text(sample: SampleResult) -> str:
+    """Text compared across probe samples (the raw output when recorded)."""
+    return sample.raw_output if sample.raw_output is not None else sample.output
+
+
+def _replay(
+    probe_samples: list[SampleResult], generator_fn: Callable[[int], SampleResult]
+) -> Callable[[int], SampleResult]:
+    """Wrap a generator so the probe samples are not drawn again."""
+
+    def generate(sample_id: int) -> SampleResult:
+        if sample_id < len(probe_samples):
+            return probe_samples[sample_id]
+        return generator_fn(sample_id)
+
+    return generate
+
+
+def _areplay(
+    probe_samples: list[SampleResult], generator_fn: Callable[[int], Awaitable[SampleResult]]
+) -> Callable[[int], Awaitable[SampleResult]]:
+    """Wrap a coroutine function so the probe samples are not drawn again."""
+
+    async def generate(sample_id: int) -> SampleResult:
+        if sample_id < len(probe_samples):
+            return probe_samples[sample_id]
+        return await generator_fn(sample_id)
+
+    return generate
 
 
 def create_sampler(
@@ -206,6 +493,11 @@ def create_sampler(
     aggregation: AggregationPolicy = "first",
     bootstrap_samples: int = 1000,
     confidence_level: float = 0.95,
+    early_stopping: bool = False,
+    ci_stop_threshold: float | None = None,
+    ci_stop_method: IntervalMethod = "wilson",
+    ci_stop_min_samples: int = 2,
+    collapse_probe: int | None = None,
 ) -> Sampler:
     """
     Create a sampler with the given configuration.
@@ -216,6 +508,12 @@ def create_sampler(
         aggregation: Aggregation policy
         bootstrap_samples: Number of bootstrap samples for CI
         confidence_level: Confidence level for CI
+        early_stopping: Stop once the aggregation outcome can no longer change
+        ci_stop_threshold: Stop once the pass-rate interval excludes this threshold
+        ci_stop_method: Interval used for CI-based stopping ("wilson" or "jeffreys")
+        ci_stop_min_samples: Minimum samples before CI-based stopping applies
+        collapse_probe: Draw this many samples first and synthesize the rest if
+            they are identical (for deterministic generation only)
 
     Returns:
         Configured Sampler instance
@@ -226,5 +524,10 @@ def create_sampler(
         aggregation=aggregation,
         bootstrap_samples=bootstrap_samples,
         confidence_level=confidence_level,
+        early_stopping=early_stopping,
+        ci_stop_threshold=ci_stop_threshold,
+        ci_stop_method=ci_stop_method,
+        ci_stop_min_samples=ci_stop_min_samples,
+        collapse_probe=collapse_probe,
     )
     return Sampler(config)
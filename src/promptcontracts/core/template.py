@@ -0,0 +1,94 @@
+"""
+Compiled prompt templates.
+
+The final prompt of a fixture is the PD prompt and, in assist/enforce mode,
+the ES constraints block around the fixture input. Everything but the input
+is the same for every fixture of a run, so it is rendered once per effective
+mode into a PromptTemplate, together with a SHA-256 state that has already
+consumed the static prefix. Building and hashing a fixture's prompt then only
+touches the fixture input and the (usually empty) static suffix.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from .validator import build_constraints_block
+
+PROMPT_LAYOUTS = ("input_first", "static_first")
+
+_INPUT_HEADER = "\n\n[USER INPUT]\n"
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """Static prompt segments around the fixture input, with the prefix pre-hashed."""
+
+    prefix: str
+    suffix: str
+    _prefix_hash: Any = field(repr=False, compare=False)
+    _suffix_bytes: bytes = field(repr=False, compare=False)
+
+    @classmethod
+    def compile(
+        cls,
+        pd: dict[str, Any],
+        es: dict[str, Any],
+        effective_mode: str,
+        layout: str = "input_first",
+    ) -> "PromptTemplate":
+        """
+        Render the static segments of a run's prompts.
+
+        Args:
+            pd: Prompt Definition
+            es: Expectation Suite (constraints block in assist/enforce mode)
+            effective_mode: Negotiated execution mode
+            layout: "input_first" (constraints after the input) or
+                "static_first" (constraints before it, a prefix shared by
+                every fixture)
+
+        Returns:
+            Compiled template
+
+        Raises:
+            ValueError: If the layout is unknown
+        """
+        if layout not in PROMPT_LAYOUTS:
+            raise ValueError(f"Unknown prompt_layout: {layout}")
+
+        base_prompt = pd.get("prompt", "")
+        constraints = ""
+        if effective_mode in ["assist", "enforce"]:
+            constraints = build_constraints_block(es)
+
+        if layout == "static_first":
+            prefix, suffix = f"{base_prompt}{constraints}{_INPUT_HEADER}", ""
+        else:
+            prefix, suffix = f"{base_prompt}{_INPUT_HEADER}", constraints
+
+        return cls(
+            prefix=prefix,
+            suffix=suffix,
+            _prefix_hash=hashlib.sha256(prefix.encode("utf-8")),
+            _suffix_bytes=suffix.encode("utf-8"),
+        )
+
+    def render(self, fixture_input: Any) -> str:
+        """Return the final prompt for a fixture input."""
+        return f"{self.prefix}{fixture_input}{self.suffix}"
+
+    def hash(self, fixture_input: Any) -> str:
+        """
+        Return the SHA-256 of render(fixture_input) without re-hashing the prefix.
+
+        Args:
+            fixture_input: Fixture input
+
+        Returns:
+            Hex digest, equal to compute_prompt_hash(render(fixture_input))
+        """
+        hasher = self._prefix_hash.copy()
+        hasher.update(f"{fixture_input}".encode())
+        hasher.update(self._suffix_bytes)
+        return hasher.hexdigest()
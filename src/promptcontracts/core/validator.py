@@ -2,14 +2,34 @@
 Validator: Check registry and execution.
 """
 
+import functools
 import json
 import re
+import threading
+import time
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 from jsonpath_ng import parse as jsonpath_parse
 
+from ..utils import jsoncodec
 from .checks import (
+    compile_contains_all,
+    compile_contains_any,
+    compile_contains_any_batch,
+    compile_enum,
+    compile_enum_batch,
+    compile_json_required,
+    compile_json_required_batch,
+    compile_judge_batch,
+    compile_regex_absent,
+    compile_regex_absent_batch,
+    compile_regex_present,
+    compile_regex_present_batch,
+    compile_similarity_batch,
+    compile_token_budget,
+    compile_token_budget_batch,
     contains_all_check,
     contains_any_check,
     enum_check,
@@ -20,15 +40,38 @@ from .checks import (
     regex_absent_check,
     regex_present_check,
     similarity_check,
+    throughput_budget_check,
     token_budget_check,
+    ttft_budget_check,
+)
+from .checks.incremental import (
+    ContainsAnyIncremental,
+    IncrementalCheck,
+    JsonValidIncremental,
+    RegexAbsentIncremental,
+    TokenBudgetIncremental,
+)
+from .parser import ParseContext
+
+# Checks evaluated once per target over all samples rather than per response
+TARGET_LEVEL_CHECKS = (
+    "pc.check.latency_budget",
+    "pc.check.ttft_budget",
+    "pc.check.throughput_budget",
 )
 
+# Target-level checks that need streamed generation
+STREAM_CHECKS = ("pc.check.ttft_budget", "pc.check.throughput_budget")
+
 
 class CheckRegistry:
     """Registry for check types."""
 
     def __init__(self):
         self._checks: dict[str, Callable] = {}
+        self._incremental: dict[str, type[IncrementalCheck]] = {}
+        self._compilers: dict[str, Callable] = {}
+        self._batch_compilers: dict[str, Callable] = {}
         self._register_builtin_checks()
 
     def _register_builtin_checks(self):
@@ -39,16 +82,79 @@ class CheckRegistry:
         self.register("pc.check.regex_absent", regex_absent_check)
         self.register("pc.check.token_budget", token_budget_check)
         self.register("pc.check.latency_budget", latency_budget_check)
+        self.register("pc.check.ttft_budget", ttft_budget_check)
+        self.register("pc.check.throughput_budget", throughput_budget_check)
         # v0.3.0 semantic checks
         self.register("pc.check.contains_all", contains_all_check)
         self.register("pc.check.contains_any", contains_any_check)
         self.register("pc.check.regex_present", regex_present_check)
         self.register("pc.check.similarity", similarity_check)
         self.register("pc.check.judge", judge_check)
+        # Compilers moving per-check setup (regexes, JSONPath, value sets) out of the hot path
+        self.register_compiler("pc.check.json_required", compile_json_required)
+        self.register_compiler("pc.check.enum", compile_enum)
+        self.register_compiler("pc.check.regex_absent", compile_regex_absent)
+        self.register_compiler("pc.check.token_budget", compile_token_budget)
+        self.register_compiler("pc.check.contains_all", compile_contains_all)
+        self.register_compiler("pc.check.contains_any", compile_contains_any)
+        self.register_compiler("pc.check.regex_present", compile_regex_present)
+        # Batch compilers evaluating one check over a column of outputs
+        self.register_batch_compiler("pc.check.json_required", compile_json_required_batch)
+        self.register_batch_compiler("pc.check.enum", compile_enum_batch)
+        self.register_batch_compiler("pc.check.regex_absent", compile_regex_absent_batch)
+        self.register_batch_compiler("pc.check.token_budget", compile_token_budget_batch)
+        self.register_batch_compiler("pc.check.contains_any", compile_contains_any_batch)
+        self.register_batch_compiler("pc.check.regex_present", compile_regex_present_batch)
+        self.register_batch_compiler("pc.check.similarity", compile_similarity_batch)
+        self.register_batch_compiler("pc.check.judge", compile_judge_batch)
+        # Checks decidable on a partial (streamed) response
+        self.register_incremental("pc.check.regex_absent", RegexAbsentIncremental)
+        self.register_incremental("pc.check.token_budget", TokenBudgetIncremental)
+        self.register_incremental("pc.check.contains_any", ContainsAnyIncremental)
+        self.register_incremental("pc.check.json_valid", JsonValidIncremental)
 
     def register(self, check_type: str, check_func: Callable):
-        """Register a check function."""
+        """Register a check function (replacing any compilers of a built-in type)."""
         self._checks[check_type] = check_func
+        self._compilers.pop(check_type, None)
+        self._batch_compilers.pop(check_type, None)
+
+    def register_compiler(self, check_type: str, compiler: Callable):
+        """
+        Register a compiler for a check type.
+
+        A compiler takes the check spec and returns an evaluator called as
+        ``evaluator(response_text, parsed_json=..., **kwargs)`` with the same
+        result as the check function.
+        """
+        self._compilers[check_type] = compiler
+
+    def get_compiler(self, check_type: str) -> Callable | None:
+        """Get the compiler of a check type (None if it has none)."""
+        return self._compilers.get(check_type)
+
+    def register_batch_compiler(self, check_type: str, compiler: Callable):
+        """
+        Register a batch compiler for a check type.
+
+        A batch compiler takes the check spec and returns an evaluator called
+        as ``evaluator(outputs, parsed=..., **kwargs)`` that returns True or the
+        failure message for each output, or None if the spec must be evaluated
+        per output.
+        """
+        self._batch_compilers[check_type] = compiler
+
+    def get_batch_compiler(self, check_type: str) -> Callable | None:
+        """Get the batch compiler of a check type (None if it has none)."""
+        return self._batch_compilers.get(check_type)
+
+    def register_incremental(self, check_type: str, check_class: type[IncrementalCheck]):
+        """Register a chunk-consuming evaluator for a check type."""
+        self._incremental[check_type] = check_class
+
+    def get_incremental(self, check_type: str) -> type[IncrementalCheck] | None:
+        """Get the incremental evaluator of a check type (None if it has none)."""
+        return self._incremental.get(check_type)
 
     def get(self, check_type: str) -> Callable:
         """Get a check function by type."""
@@ -61,6 +167,208 @@ class CheckRegistry:
         return check_type in self._checks
 
 
+def _as_result(check_type: str, outcome: tuple) -> dict[str, Any]:
+    """Build a check result from a (passed, message[, data]) tuple."""
+    passed, message, *rest = outcome
+    return {
+        "type": check_type,
+        "passed": passed,
+        "message": message,
+        "data": rest[0] if rest else None,
+    }
+
+
+def _failed_result(check_type: str, message: str) -> dict[str, Any]:
+    return {"type": check_type, "passed": False, "message": message, "data": None}
+
+
+def _skipped_result(check_type: str, failed_type: str) -> dict[str, Any]:
+    # A skipped check did not pass: the response already failed another check
+    return {
+        "type": check_type,
+        "passed": False,
+        "skipped": True,
+        "message": f"SKIPPED: response already failed {failed_type}",
+        "data": None,
+    }
+
+
+# Assumed per-call cost (ms) of a check type until timings have been observed
+DEFAULT_CHECK_COSTS_MS = {
+    "pc.check.judge": 1000.0,
+    "pc.check.similarity": 100.0,
+}
+DEFAULT_CHECK_COST_MS = 0.05
+
+
+class CheckCostModel:
+    """
+    Per-check-type cost learned from timings during a run.
+
+    Costs start at DEFAULT_CHECK_COSTS_MS priors (LLM judges and embedding
+    similarity are expensive, deterministic checks cheap) and follow an
+    exponentially weighted moving average of observed durations. Thread-safe.
+    """
+
+    def __init__(self, priors: dict[str, float] | None = None, alpha: float = 0.2):
+        """
+        Initialize cost model.
+
+        Args:
+            priors: Cost (ms) per check type before any observation
+                (defaults to DEFAULT_CHECK_COSTS_MS)
+            alpha: EWMA weight of a new observation
+        """
+        self.priors = DEFAULT_CHECK_COSTS_MS if priors is None else priors
+        self.alpha = alpha
+        self._mean_ms: dict[str, float] = {}
+        self._runs: dict[str, int] = {}
+        self._skipped: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def cost(self, check_type: str) -> float:
+        """Return the expected cost (ms) of one call of a check type."""
+        with self._lock:
+            if check_type in self._mean_ms:
+                return self._mean_ms[check_type]
+        return self.priors.get(check_type, DEFAULT_CHECK_COST_MS)
+
+    def observe(self, check_type: str, elapsed_ms: float):
+        """Record the duration of one check call."""
+        with self._lock:
+            mean = self._mean_ms.get(check_type)
+            # The first timing replaces the prior
+            self._mean_ms[check_type] = (
+                elapsed_ms if mean is None else mean + self.alpha * (elapsed_ms - mean)
+            )
+            self._runs[check_type] = self._runs.get(check_type, 0) + 1
+
+    def skip(self, check_type: str):
+        """Record a check call avoided by short-circuiting."""
+        with self._lock:
+            self._skipped[check_type] = self._skipped.get(check_type, 0) + 1
+
+    def order(self, plan: "CheckPlan") -> list[int]:
+        """Return plan indices cheapest first (ties keep ES order)."""
+        return sorted(range(len(plan)), key=lambda i: self.cost(plan.checks[i].check_type))
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return learned cost, call count and skip count per check type."""
+        with self._lock:
+            check_types = sorted(set(self._runs) | set(self._skipped))
+            return {
+                check_type: {
+                    "mean_ms": round(self._mean_ms.get(check_type, 0.0), 3),
+                    "runs": self._runs.get(check_type, 0),
+                    "skipped": self._skipped.get(check_type, 0),
+                }
+                for check_type in check_types
+            }
+
+
+@dataclass(frozen=True)
+class CompiledCheck:
+    """One check of a CheckPlan with its setup work already done."""
+
+    check_type: str
+    spec: dict[str, Any]
+    evaluate: Callable[..., tuple]
+
+
+@dataclass(frozen=True)
+class CheckPlan:
+    """An Expectation Suite's checks compiled once for evaluating many responses."""
+
+    checks: tuple[CompiledCheck, ...]
+
+    def __len__(self) -> int:
+        return len(self.checks)
+
+
+@dataclass
+class BatchResult:
+    """
+    Pass/fail matrix of checks (rows) over outputs (columns).
+
+    passed[i][j] is 1 if check i passed output j; messages are kept only for
+    failures, keyed by (check index, output index).
+    """
+
+    check_types: list[str]
+    n_outputs: int
+    passed: list[bytearray] = field(default_factory=list)
+    failures: dict[tuple[int, int], str] = field(default_factory=dict)
+
+    def output_passed(self) -> list[bool]:
+        """Return, per output, whether every check passed."""
+        if not self.passed:
+            return [True] * self.n_outputs
+        return [all(column) for column in zip(*self.passed, strict=True)]
+
+    def pass_rates(self) -> list[float]:
+        """Return the pass rate of each check over all outputs."""
+        n = self.n_outputs
+        return [sum(row) / n if n else 0.0 for row in self.passed]
+
+    def failed(self, check_index: int) -> dict[int, str]:
+        """Return failure messages of one check keyed by output index."""
+        return {j: msg for (i, j), msg in self.failures.items() if i == check_index}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "check_types": list(self.check_types),
+            "n_outputs": self.n_outputs,
+            "passed": [list(row) for row in self.passed],
+            "failures": [
+                {"check": i, "output": j, "message": msg}
+                for (i, j), msg in sorted(self.failures.items())
+            ],
+        }
+
+
+def _unknown_check(message: str, response_text: str, **kwargs) -> tuple[bool, str, Any]:
+    return False, message, None
+
+
+class IncrementalValidation:
+    """Feed a streamed response to the incremental checks of an ES."""
+
+    def __init__(self, checks: list[IncrementalCheck]):
+        """
+        Initialize with one evaluator per incremental check.
+
+        Args:
+            checks: Incremental check evaluators
+        """
+        self.checks = checks
+        self.failed_spec: dict[str, Any] | None = None
+        self.failure: dict[str, Any] | None = None
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume a chunk.
+
+        Returns:
+            True once a check has failed decisively (the generation can stop)
+        """
+        for check in self.checks:
+            if check.feed(chunk) == "FAIL":
+                self.failed_spec = check.check_spec
+                self.failure = {
+                    "type": check.check_spec.get("type"),
+                    "passed": False,
+                    "message": f"{check.message} (generation aborted)",
+                    "data": {"aborted_after_chars": len(check.text)},
+                }
+                return True
+        return False
+
+    def verdicts(self) -> dict[str, str]:
+        """Return the current verdict of each check type."""
+        return {check.check_spec.get("type"): check.verdict for check in self.checks}
+
+
 class Validator:
     """Execute checks against responses."""
 
@@ -75,6 +383,9 @@ class Validator:
         all_latencies: list[int] = None,
         embedding_adapter: Any = None,
         judge_adapter: Any = None,
+        all_ttfts: list[float] = None,
+        all_throughputs: list[float] = None,
+        parse_context: ParseContext | None = None,
     ) -> dict[str, Any]:
         """
         Run a single check.
@@ -100,23 +411,213 @@ class Validator:
         check_func = self.registry.get(check_type)
 
         try:
-            passed, message, data = check_func(
+            outcome = check_func(
                 response_text=response_text,
                 check_spec=check_spec,
                 parsed_json=parsed_json,
                 all_latencies=all_latencies,
                 embedding_adapter=embedding_adapter,
                 judge_adapter=judge_adapter,
+                all_ttfts=all_ttfts,
+                all_throughputs=all_throughputs,
+                parse_context=parse_context,
             )
-
-            return {"type": check_type, "passed": passed, "message": message, "data": data}
+            return _as_result(check_type, outcome)
         except Exception as e:
-            return {
-                "type": check_type,
-                "passed": False,
-                "message": f"Check execution failed: {e}",
-                "data": None,
-            }
+            return _failed_result(check_type, f"Check execution failed: {e}")
+
+    def compile(self, check_specs: list[dict[str, Any]]) -> CheckPlan:
+        """
+        Compile checks into a CheckPlan.
+
+        Regexes, JSONPath expressions and allowed-value sets are prepared here
+        once, so run_plan() does no per-response parsing. Checks without a
+        compiler are bound to their check function.
+
+        Args:
+            check_specs: ES check specs (evaluated in this order)
+
+        Returns:
+            Immutable CheckPlan
+        """
+        compiled = []
+        for check_spec in check_specs:
+            check_type = check_spec.get("type", "")
+            compiler = self.registry.get_compiler(check_type)
+
+            if not self.registry.has(check_type):
+                message = f"Unknown check type: {check_type}"
+                evaluate = functools.partial(_unknown_check, message)
+            else:
+                evaluate = None
+                if compiler is not None:
+                    try:
+                        evaluate = compiler(check_spec)
+                    except Exception:
+                        # Let the check function report the problem per response
+                        evaluate = None
+                if evaluate is None:
+                    check_func = self.registry.get(check_type)
+                    evaluate = functools.partial(check_func, check_spec=check_spec)
+
+            compiled.append(CompiledCheck(check_type, check_spec, evaluate))
+
+        return CheckPlan(tuple(compiled))
+
+    def run_plan(
+        self,
+        plan: CheckPlan,
+        response_text: str,
+        parsed_json: Any = None,
+        embedding_adapter: Any = None,
+        judge_adapter: Any = None,
+        short_circuit: bool = False,
+        cost_model: CheckCostModel | None = None,
+        parse_context: ParseContext | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run a compiled CheckPlan against one response.
+
+        With short_circuit, checks run cheapest first according to cost_model
+        and, once one fails, the remaining ones are not called and reported as
+        SKIPPED (the response can no longer pass). Check durations are recorded
+        in cost_model whenever one is given.
+
+        Args:
+            plan: Compiled checks
+            response_text: Response to check
+            parsed_json: Parsed JSON response, if any
+            embedding_adapter: Adapter for similarity checks
+            judge_adapter: Adapter for judge checks
+            short_circuit: Order checks by cost and skip the rest after a failure
+            cost_model: Learned check costs (priors only if None)
+            parse_context: Parse state of the response, reused instead of re-decoding
+
+        Returns:
+            Check results in plan order (same shape as run_checks())
+        """
+
+        def evaluate(check: CompiledCheck) -> dict[str, Any]:
+            try:
+                outcome = check.evaluate(
+                    response_text=response_text,
+                    parsed_json=parsed_json,
+                    embedding_adapter=embedding_adapter,
+                    judge_adapter=judge_adapter,
+                    parse_context=parse_context,
+                )
+                return _as_result(check.check_type, outcome)
+            except Exception as e:
+                return _failed_result(check.check_type, f"Check execution failed: {e}")
+
+        if not short_circuit and cost_model is None:
+            return [evaluate(check) for check in plan.checks]
+
+        if short_circuit and cost_model is None:
+            cost_model = CheckCostModel()
+        order = cost_model.order(plan) if short_circuit else range(len(plan))
+
+        results: list[dict[str, Any] | None] = [None] * len(plan)
+        failed_type = None
+        for index in order:
+            check = plan.checks[index]
+            if failed_type is not None:
+                results[index] = _skipped_result(check.check_type, failed_type)
+                cost_model.skip(check.check_type)
+                continue
+
+            start = time.perf_counter_ns()
+            result = evaluate(check)
+            cost_model.observe(check.check_type, (time.perf_counter_ns() - start) / 1e6)
+            results[index] = result
+
+            if short_circuit and not result["passed"]:
+                failed_type = check.check_type
+
+        return results
+
+    def run_checks_batch(
+        self,
+        check_specs: list[dict[str, Any]],
+        outputs: list[str],
+        parsed: list[Any] | None = None,
+        embedding_adapter: Any = None,
+        judge_adapter: Any = None,
+    ) -> BatchResult:
+        """
+        Evaluate each check over a whole column of outputs.
+
+        Checks with a batch compiler scan all outputs in one call (compiled
+        regexes, set membership for enums, one embedding batch for similarity,
+        concurrent judge calls); the others run their compiled per-output
+        evaluator. Pass/fail matches run_checks() on each output.
+
+        Args:
+            check_specs: ES check specs (per-response checks)
+            outputs: Response texts
+            parsed: Parsed JSON per output (None entries for non-JSON output)
+            embedding_adapter: Adapter for similarity checks
+            judge_adapter: Adapter for judge checks
+
+        Returns:
+            BatchResult with one row per check
+
+        Raises:
+            ValueError: If parsed and outputs differ in length
+        """
+        if parsed is None:
+            parsed = [None] * len(outputs)
+        elif len(parsed) != len(outputs):
+            raise ValueError(f"Got {len(parsed)} parsed values for {len(outputs)} outputs")
+
+        plan = self.compile(check_specs)
+        kwargs = {"embedding_adapter": embedding_adapter, "judge_adapter": judge_adapter}
+        result = BatchResult([c.check_type for c in plan.checks], n_outputs=len(outputs))
+
+        for check_index, check in enumerate(plan.checks):
+            outcomes = self._evaluate_batch(check, outputs, parsed, kwargs)
+            row = bytearray(len(outputs))
+            for output_index, outcome in enumerate(outcomes):
+                if outcome is True:
+                    row[output_index] = 1
+                else:
+                    result.failures[(check_index, output_index)] = outcome
+            result.passed.append(row)
+
+        return result
+
+    def _evaluate_batch(
+        self,
+        check: CompiledCheck,
+        outputs: list[str],
+        parsed: list[Any],
+        kwargs: dict[str, Any],
+    ) -> list[bool | str]:
+        """Evaluate one compiled check over all outputs (True or failure message each)."""
+        compiler = self.registry.get_batch_compiler(check.check_type)
+        evaluate_batch = None
+        if compiler is not None:
+            try:
+                evaluate_batch = compiler(check.spec)
+            except Exception:
+                evaluate_batch = None
+
+        if evaluate_batch is not None:
+            try:
+                return evaluate_batch(outputs, parsed=parsed, **kwargs)
+            except Exception as e:
+                return [f"Check execution failed: {e}"] * len(outputs)
+
+        outcomes = []
+        for response_text, parsed_json in zip(outputs, parsed, strict=True):
+            try:
+                passed, message, *_ = check.evaluate(
+                    response_text=response_text, parsed_json=parsed_json, **kwargs
+                )
+                outcomes.append(True if passed else message)
+            except Exception as e:
+                outcomes.append(f"Check execution failed: {e}")
+        return outcomes
 
     def run_checks(
         self,
@@ -143,6 +644,58 @@ class Validator:
 
         return results
 
+    def incremental(
+        self, check_specs: list[dict[str, Any]], exclude: tuple[str, ...] = ()
+    ) -> IncrementalValidation:
+        """
+        Build incremental evaluators for the checks that support them.
+
+        Args:
+            check_specs: ES checks (checks without an incremental form are skipped)
+            exclude: Check types not to evaluate incrementally
+
+        Returns:
+            IncrementalValidation to feed streamed chunks to
+        """
+        checks = []
+        for check_spec in check_specs:
+            check_type = check_spec.get("type", "")
+            check_class = self.registry.get_incremental(check_type)
+            if check_class is not None and check_type not in exclude:
+                checks.append(check_class(check_spec))
+        return IncrementalValidation(checks)
+
+    def run_latency_checks(
+        self,
+        check_specs: list[dict[str, Any]],
+        all_latencies: list[float],
+        all_ttfts: list[float] = None,
+        all_throughputs: list[float] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run the target-level checks among check_specs.
+
+        Args:
+            check_specs: ES checks (non target-level checks are skipped)
+            all_latencies: Latency of every fixture in milliseconds
+            all_ttfts: Time-to-first-token of every streamed sample
+            all_throughputs: Output tokens/sec of every streamed sample
+
+        Returns:
+            Check results of the latency, TTFT and throughput budgets
+        """
+        latency_checks = [c for c in check_specs if c.get("type") in TARGET_LEVEL_CHECKS]
+        return [
+            self.run_check(
+                check_spec=check,
+                response_text="",
+                all_latencies=all_latencies,
+                all_ttfts=all_ttfts,
+                all_throughputs=all_throughputs,
+            )
+            for check in latency_checks
+        ]
+
 
 def normalize_output(raw_text: str, auto_repair_cfg: dict[str, Any]) -> tuple[str, dict[str, Any]]:
     """
@@ -175,7 +728,7 @@ def normalize_output(raw_text: str, auto_repair_cfg: dict[str, Any]) -> tuple[st
     lowercase_fields = auto_repair_cfg.get("lowercase_fields", [])
     if lowercase_fields:
         try:
-            parsed = json.loads(normalized)
+            parsed = jsoncodec.loads(normalized)
 
             for field_path in lowercase_fields:
                 try:
@@ -0,0 +1,429 @@
+"""
+Durable work queue for distributing sample generation across worker processes.
+
+A coordinator (ContractRunner with ``work_queue`` set) enqueues one unit per
+(target, fixture, sample) into a SQLite file and waits for results; any number
+of ``prompt-contracts worker`` processes lease units, execute them through the
+normal adapter and validator path and store the evaluated sample. Leases
+expire, so units held by a dead worker are handed to another one, and failed
+units are retried up to a maximum number of attempts.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..utils import jsoncodec
+from ..utils.errors import ExecutionError
+from .adapters import CachingAdapter
+from .cache import ResponseCache
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+@dataclass
+class WorkUnit:
+    """A leased unit of work."""
+
+    key: str
+    payload: dict[str, Any]
+    attempts: int
+
+
+def unit_key(target_index: int, target_id: str, fixture_id: str, sample_id: int) -> str:
+    """Encode a (target, fixture, sample) unit as a queue key."""
+    return json.dumps([target_index, target_id, fixture_id, sample_id])
+
+
+class WorkQueue:
+    """
+    SQLite-backed queue of (target, fixture, sample) units.
+
+    Safe to share between threads of one process and between processes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a queue file.
+
+        Args:
+            path: Path of the SQLite queue file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " state TEXT NOT NULL DEFAULT 'pending',"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " worker TEXT,"
+            " lease_expires REAL,"
+            " result TEXT,"
+            " error TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_units_state ON units (state)")
+
+    def _get_meta(self, key: str) -> Any:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_meta(self, key: str, value: Any):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, json.dumps(value, sort_keys=True))
+        )
+
+    # Coordinator side
+
+    def prepare(
+        self,
+        hashes: dict[str, str],
+        artefacts: dict[str, Any],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Open the queue for a run.
+
+        Units left by an earlier coordinator for the same artefacts are kept, so
+        a restarted coordinator reuses completed work; otherwise the queue is
+        cleared.
+
+        Args:
+            hashes: Artefact hashes from checkpoint.artifact_hashes()
+            artefacts: {"pd": ..., "es": ..., "ep": ...} for workers to load
+            max_attempts: Leases per unit before it is marked failed
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._get_meta("hashes") != hashes:
+                    self._conn.execute("DELETE FROM units")
+                self._set_meta("hashes", hashes)
+                self._set_meta("artefacts", artefacts)
+                self._set_meta("max_attempts", max_attempts)
+                self._set_meta("closed", False)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def enqueue(self, key: str, payload: dict[str, Any]):
+        """Add a unit; a cancelled or failed unit with the same key is re-queued."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO units (key, payload) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET state = 'pending', attempts = 0, "
+                "worker = NULL, lease_expires = NULL, error = NULL "
+                "WHERE state IN ('cancelled', 'failed')",
+                (key, jsoncodec.dumps(payload)),
+            )
+
+    def cancel(self, key: str):
+        """Withdraw a unit that is no longer needed (e.g. early stopping)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET state = 'cancelled' WHERE key = ? AND state IN ('pending', 'leased')",
+                (key,),
+            )
+
+    def finished(self, keys: list[str]) -> dict[str, tuple[str, str | None, str | None]]:
+        """
+        Look up which of the given units are done or failed.
+
+        Returns:
+            Dict key -> (state, result JSON, error) for finished units only
+        """
+        finished = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._conn.execute(
+                    "SELECT key, state, result, error FROM units "
+                    f"WHERE state IN ('done', 'failed') AND key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                finished.update({key: (state, result, error) for key, state, result, error in rows})
+        return finished
+
+    def close_run(self):
+        """Mark the run finished so idle workers exit."""
+        with self._lock:
+            self._set_meta("closed", True)
+
+    def stats(self) -> dict[str, Any]:
+        """Return unit counts by state and the total number of leases."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*), COALESCE(SUM(attempts), 0) FROM units GROUP BY state"
+            ).fetchall()
+
+        stats: dict[str, Any] = {
+            "path": str(self.path),
+            **dict.fromkeys(("pending", "leased", "done", "failed", "cancelled"), 0),
+        }
+        stats.update({state: count for state, count, _ in rows})
+        stats["attempts"] = sum(attempts for _, _, attempts in rows)
+        return stats
+
+    # Worker side
+
+    def run_hashes(self) -> dict[str, str] | None:
+        """Return the artefact hashes of the current run, or None before prepare()."""
+        with self._lock:
+            return self._get_meta("hashes")
+
+    def artefacts(self) -> dict[str, Any]:
+        """Return the PD/ES/EP of the current run."""
+        with self._lock:
+            return self._get_meta("artefacts")
+
+    def is_closed(self) -> bool:
+        """Return whether the coordinator has finished the run."""
+        with self._lock:
+            return bool(self._get_meta("closed"))
+
+    def lease(
+        self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> WorkUnit | None:
+        """
+        Lease the oldest pending unit, or a unit whose lease expired.
+
+        Units whose lease expired after their last allowed attempt are marked
+        failed instead of being handed out again.
+
+        Args:
+            worker_id: Identifier of the leasing worker
+            lease_seconds: How long the worker may hold the unit
+
+        Returns:
+            WorkUnit or None if nothing is available
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                max_attempts = self._get_meta("max_attempts") or DEFAULT_MAX_ATTEMPTS
+                self._conn.execute(
+                    "UPDATE units SET state = 'failed', error = 'lease expired' "
+                    "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (now, max_attempts),
+                )
+                row = self._conn.execute(
+                    "SELECT key, payload, attempts FROM units "
+                    "WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                    "ORDER BY rowid LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE units SET state = 'leased', worker = ?, lease_expires = ?, "
+                        "attempts = attempts + 1 WHERE key = ?",
+                        (worker_id, now + lease_seconds, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        return WorkUnit(key=row[0], payload=jsoncodec.loads(row[1]), attempts=row[2] + 1)
+
+    def complete(self, key: str, result: dict[str, Any]):
+        """Store a unit's result; the first result for a unit wins."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET state = 'done', result = ?, error = NULL "
+                "WHERE key = ? AND state IN ('pending', 'leased')",
+                (jsoncodec.dumps(result), key),
+            )
+
+    def fail(self, key: str, worker_id: str, error: str):
+        """Release a unit after an error; it is retried until attempts run out."""
+        with self._lock:
+            max_attempts = self._get_meta("max_attempts") or DEFAULT_MAX_ATTEMPTS
+            self._conn.execute(
+                "UPDATE units SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, worker = NULL, lease_expires = NULL "
+                "WHERE key = ? AND state = 'leased' AND worker = ?",
+                (max_attempts, error, key, worker_id),
+            )
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class QueueDispatcher:
+    """Submit units from the coordinator's event loop and await their results."""
+
+    def __init__(self, queue: WorkQueue, poll_interval: float = 0.05):
+        """
+        Initialize dispatcher.
+
+        Args:
+            queue: Prepared work queue
+            poll_interval: Seconds between polls for finished units
+        """
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self._waiting: dict[str, asyncio.Future] = {}
+        self._poller: asyncio.Task | None = None
+
+    async def submit(self, key: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Enqueue a unit and wait for a worker to complete it.
+
+        Cancelling the wait withdraws the unit from the queue.
+
+        Returns:
+            The result stored by the worker
+
+        Raises:
+            ExecutionError: If the unit failed on every attempt
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[key] = future
+        self.queue.enqueue(key, payload)
+
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll())
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self._waiting.pop(key, None)
+            self.queue.cancel(key)
+            raise
+
+    async def _poll(self):
+        while self._waiting:
+            await asyncio.sleep(self.poll_interval)
+            for key, (state, result, error) in self.queue.finished(list(self._waiting)).items():
+                future = self._waiting.pop(key, None)
+                if future is None or future.done():
+                    continue
+                if state == "done":
+                    future.set_result(jsoncodec.loads(result))
+                else:
+                    future.set_exception(ExecutionError(f"Work unit {key} failed: {error}"))
+
+    async def aclose(self):
+        """Stop polling."""
+        if self._poller is not None and not self._poller.done():
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+
+
+def default_worker_id() -> str:
+    """Return a worker id unique to this host, process and thread."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def run_worker(
+    queue_path: str,
+    worker_id: str | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_interval: float = 0.5,
+    idle_timeout: float | None = None,
+    max_units: int | None = None,
+) -> int:
+    """
+    Process units from a work queue until the coordinator closes the run.
+
+    Workers read the run's artefacts from the queue and apply its response
+    cache (``execution.cache``). Target rate limits are enforced by the
+    coordinator when it dispatches units, and checks needing the
+    coordinator's judge or embedding adapters are re-run there.
+
+    Args:
+        queue_path: Path of the SQLite queue file
+        worker_id: Worker identifier (defaults to host:pid:thread)
+        lease_seconds: Lease duration per unit; must exceed the slowest call
+        poll_interval: Seconds to wait when no unit is available
+        idle_timeout: Exit after this many idle seconds (None = wait for close)
+        max_units: Exit after processing this many units (None = unlimited)
+
+    Returns:
+        Number of units processed
+    """
+    from .runner import ContractRunner
+
+    worker_id = worker_id or default_worker_id()
+    queue = WorkQueue(queue_path)
+    runner = None
+    cache: ResponseCache | None = None
+    runner_hashes = None
+    adapters: dict[int, Any] = {}
+    processed = 0
+    idle_since = time.monotonic()
+
+    try:
+        while max_units is None or processed < max_units:
+            hashes = queue.run_hashes()
+            unit = queue.lease(worker_id, lease_seconds) if hashes else None
+
+            if unit is None:
+                if hashes and queue.is_closed():
+                    break
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            # Rebuild the runner when the coordinator starts a run with new artefacts
+            if hashes != runner_hashes:
+                artefacts = queue.artefacts()
+                runner = ContractRunner(artefacts["pd"], artefacts["es"], artefacts["ep"])
+                runner_hashes = hashes
+                adapters = {}
+                if cache is not None:
+                    cache.close()
+                cache = None
+                if runner.cache_config.enabled:
+                    cache = ResponseCache.from_config(runner.cache_config)
+
+            payload = unit.payload
+            sample_id = payload["sample_id"]
+            try:
+                target_index = payload["target_index"]
+                if target_index not in adapters:
+                    adapter = runner._create_adapter(payload["target"])
+                    if cache is not None:
+                        adapter = CachingAdapter(adapter, cache, payload["target"].get("type"))
+                    adapters[target_index] = adapter
+                raw_output, latency_ms, call_info = runner._generate(
+                    adapters[target_index], payload["final_prompt"], payload["schema"], sample_id
+                )
+                sample = runner._evaluate_sample(sample_id, raw_output, latency_ms, call_info)
+            except Exception as e:
+                queue.fail(unit.key, worker_id, f"{type(e).__name__}: {e}")
+            else:
+                queue.complete(unit.key, sample.to_dict())
+
+            processed += 1
+            idle_since = time.monotonic()
+    finally:
+        if cache is not None:
+            cache.close()
+        queue.close()
+
+    return processed
@@ -0,0 +1,218 @@
+"""
+Pluggable JSON codec with optional high-speed backends.
+
+loads() and dumps() use orjson or msgspec when installed and the standard
+library otherwise. The fast backends are only trusted where they agree with
+``json``: a document they reject is decoded again with json.loads(), so
+error messages and values json accepts but they do not (NaN, integers
+beyond 64 bits, lone surrogates) are unchanged. Documents they could
+misread (integers of 19 or more digits, which orjson turns into floats) or
+nest too deeply for them go to json.loads() directly. Objects they would
+encode differently (non-string keys, non-finite floats, types json rejects) are
+encoded with json.dumps().
+
+The backend is chosen once per process ("auto": orjson, then msgspec, then
+json) and can be forced with the ``PROMPTCONTRACTS_JSON_BACKEND`` environment
+variable or set_backend(). Output that must stay byte-stable (cache keys,
+artefact hashes, normalized response text seen by checks) keeps using json
+directly.
+"""
+
+import importlib.util
+import json
+import math
+import os
+from collections.abc import Callable
+from typing import Any
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+# Nesting depth the fast decoders are trusted with
+_MAX_DEPTH = 1024
+
+# Maps digits to "0", opening brackets to "[" and all other bytes to " "
+_SHAPE = bytes(48 if 48 <= i <= 57 else 91 if i in (91, 123) else 32 for i in range(256))
+# 19 digits can exceed the signed 64-bit range fast decoders read exactly
+_LONG_INTEGER = b"0" * 19
+
+# Re-exported so callers can catch decode errors without importing json
+JSONDecodeError = json.JSONDecodeError
+
+
+def available_backends() -> list[str]:
+    """Return the installed backends in preference order ("json" always last)."""
+    return [name for name in BACKENDS if name == "json" or importlib.util.find_spec(name)]
+
+
+def _needs_stdlib(text: Any, depth_limited: bool) -> bool:
+    """Whether a document must be decoded by json rather than a fast backend."""
+    if not isinstance(text, str):
+        return True
+    # One C-speed pass instead of a regex scan, which costs more than decoding
+    shape = text.encode("utf-8", "surrogatepass").translate(_SHAPE)
+    if _LONG_INTEGER in shape:
+        return True
+    # The bracket count bounds the nesting depth
+    return not depth_limited and shape.count(b"[") > _MAX_DEPTH
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether obj contains a NaN or infinite float (written as null by the fast encoders)."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            stack.extend(value)
+    return False
+
+
+def _stdlib_dumps(obj: Any, indent: int | None, sort_keys: bool) -> str:
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+def _orjson_codec() -> tuple[Callable[[str], Any], Callable[..., str]]:
+    import orjson
+
+    # Dataclasses and datetimes are rejected by json, so pass them through to it
+    base_option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    # Older orjson releases recurse without limit and crash on deep nesting
+    try:
+        orjson.loads("[" * (_MAX_DEPTH + 1) + "]" * (_MAX_DEPTH + 1))
+        depth_limited = False
+    except orjson.JSONDecodeError:
+        depth_limited = True
+
+    def loads(text: str) -> Any:
+        if _needs_stdlib(text, depth_limited):
+            return json.loads(text)
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+    def dumps(obj: Any, indent: int | None, sort_keys: bool) -> str:
+        if indent not in (None, 2):
+            return _stdlib_dumps(obj, indent, sort_keys)
+        option = base_option
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            return _stdlib_dumps(obj, indent, sort_keys)
+        if b"null" in data and _has_non_finite(obj):
+            return _stdlib_dumps(obj, indent, sort_keys)
+        return data.decode()
+
+    return loads, dumps
+
+
+def _msgspec_codec() -> tuple[Callable[[str], Any], Callable[..., str]]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(text: str) -> Any:
+        # msgspec raises RecursionError on deep nesting, as json does
+        if _needs_stdlib(text, depth_limited=True):
+            return json.loads(text)
+        try:
+            return decoder.decode(text)
+        except msgspec.DecodeError:
+            return json.loads(text)
+
+    # msgspec encodes dataclasses, datetimes and non-string keys that json
+    # rejects or rewrites, so encoding stays with json
+    return loads, _stdlib_dumps
+
+
+def _stdlib_codec() -> tuple[Callable[[str], Any], Callable[..., str]]:
+    return json.loads, _stdlib_dumps
+
+
+_CODECS = {"orjson": _orjson_codec, "msgspec": _msgspec_codec, "json": _stdlib_codec}
+
+_backend = "json"
+_loads, _dumps = _stdlib_codec()
+
+
+def set_backend(name: str = "auto") -> str:
+    """
+    Select the JSON backend.
+
+    Args:
+        name: "auto", "orjson", "msgspec" or "json"
+
+    Returns:
+        Name of the backend now in use
+
+    Raises:
+        ValueError: If the name is unknown or the backend is not installed
+    """
+    global _backend, _loads, _dumps
+
+    if name == "auto":
+        name = available_backends()[0]
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON backend {name!r} (expected auto or one of {BACKENDS})")
+    if name not in available_backends():
+        raise ValueError(f"JSON backend {name!r} is not installed")
+
+    _loads, _dumps = _CODECS[name]()
+    _backend = name
+    return name
+
+
+def get_backend() -> str:
+    """Return the name of the backend in use."""
+    return _backend
+
+
+def loads(text: str) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Decoded value, equal to json.loads(text)
+
+    Raises:
+        json.JSONDecodeError: Exactly as json.loads() raises it
+    """
+    return _loads(text)
+
+
+def dumps(obj: Any, indent: int | None = None, sort_keys: bool = False) -> str:
+    """
+    Encode a value as JSON text.
+
+    The result decodes to the same value as json.dumps(obj, ...) but may
+    differ in formatting: compact output has no spaces after separators,
+    non-ASCII characters are not escaped and floats use the shortest
+    round-tripping spelling. Use json.dumps() where the exact text matters.
+
+    Args:
+        obj: Value to encode
+        indent: Indentation width, or None for a single line
+        sort_keys: Sort object keys
+
+    Returns:
+        JSON text
+
+    Raises:
+        TypeError: If obj contains a value json cannot encode
+    """
+    return _dumps(obj, indent, sort_keys)
+
+
+set_backend(os.getenv("PROMPTCONTRACTS_JSON_BACKEND", "auto"))
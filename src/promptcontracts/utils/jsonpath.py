@@ -0,0 +1,43 @@
+"""Compiled JSONPath lookups with a fast path for simple dotted paths."""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from jsonpath_ng import parse
+
+_SIMPLE_PATH = re.compile(r"^\$(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+def compile_jsonpath(path: str) -> Callable[[Any], list[Any]]:
+    """
+    Compile a JSONPath expression into a function returning matched values.
+
+    Paths of the form ``$`` or ``$.a.b`` (plain identifiers) are resolved by
+    walking dicts directly, which gives the same matches as jsonpath_ng without
+    its per-lookup overhead; anything else is parsed once by jsonpath_ng.
+
+    Args:
+        path: JSONPath expression
+
+    Returns:
+        Function mapping a document to the list of matched values
+
+    Raises:
+        Exception: jsonpath_ng parse errors for invalid expressions
+    """
+    if _SIMPLE_PATH.match(path):
+        keys = tuple(path.split(".")[1:])
+
+        def find_simple(document: Any) -> list[Any]:
+            value = document
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    return []
+                value = value[key]
+            return [value]
+
+        return find_simple
+
+    expression = parse(path)
+    return lambda document: [match.value for match in expression.find(document)]
@@ -0,0 +1,79 @@
+"""Shared fixtures for runner tests."""
+
+from contextlib import AbstractContextManager
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from promptcontracts.core.runner import ContractRunner
+
+
+def _make_artifacts(
+    *,
+    prompt: str = "Classify.",
+    checks: list[dict[str, Any]] | None = None,
+    targets: list[dict[str, Any]] | None = None,
+    fixtures: int | list[dict[str, Any]] = 3,
+    n_samples: int = 1,
+    mode: str = "observe",
+    execution: dict[str, Any] | None = None,
+    sampling: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """
+    Build a minimal structured/json PD, ES and EP.
+
+    Args:
+        prompt: PD prompt
+        checks: ES checks (default: json_valid only)
+        targets: EP targets (default: one Ollama target)
+        fixtures: Fixture list, or a count of fixtures ``f{i}`` with input ``input {i}``
+        n_samples: sampling.n (bootstrap disabled)
+        mode: execution.mode
+        execution: Further execution settings
+        sampling: Further sampling settings
+
+    Returns:
+        (pd, es, ep)
+    """
+    if isinstance(fixtures, int):
+        fixtures = [{"id": f"f{i}", "input": f"input {i}"} for i in range(fixtures)]
+    pd = {"pcsl": "0.3.0", "io": {"expects": "structured/json"}, "prompt": prompt}
+    es = {"pcsl": "0.3.0", "checks": checks or [{"type": "pc.check.json_valid"}]}
+    ep = {
+        "pcsl": "0.3.0",
+        "targets": targets or [{"type": "ollama", "model": "test-model"}],
+        "fixtures": fixtures,
+        "execution": {"mode": mode, **(execution or {})},
+        "sampling": {"n": n_samples, "bootstrap_samples": 0, **(sampling or {})},
+    }
+    return pd, es, ep
+
+
+def _use_adapter(adapter) -> AbstractContextManager:
+    """Make every runner target use adapter instead of a real provider."""
+    return patch.object(ContractRunner, "_create_adapter", return_value=adapter)
+
+
+def _run_contract(artifacts, adapter, **runner_kwargs) -> dict[str, Any]:
+    """Run artifacts against adapter and return the results."""
+    with _use_adapter(adapter):
+        return ContractRunner(*artifacts, **runner_kwargs).run()
+
+
+@pytest.fixture
+def make_artifacts():
+    """Factory for (pd, es, ep); keyword arguments override the defaults."""
+    return _make_artifacts
+
+
+@pytest.fixture
+def use_adapter():
+    """Context manager patching ContractRunner to use a given adapter."""
+    return _use_adapter
+
+
+@pytest.fixture
+def run_contract():
+    """Run (pd, es, ep) against an adapter: run_contract(artifacts, adapter, **runner_kwargs)."""
+    return _run_contract
@@ -0,0 +1,113 @@
+"""Tests for batch (column-wise) check evaluation."""
+
+import json
+import random
+
+import pytest
+
+from promptcontracts.core.adapters.judge_openai import DummyJudgeAdapter
+from promptcontracts.core.validator import CheckRegistry, Validator
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.json_required", "fields": ["label", "score"]},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["spam", "ham", 1]},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["SPAM"], "case_insensitive": True},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": [["a"]]},
+    {"type": "pc.check.regex_absent", "pattern": r"(?i)\bsorry\b"},
+    {"type": "pc.check.regex_absent", "pattern": "("},
+    {"type": "pc.check.regex_present", "pattern": "^\\{", "flags": "m"},
+    {"type": "pc.check.token_budget", "max_out": 4},
+    {"type": "pc.check.contains_any", "options": ["SPAM", "ham"], "case_sensitive": False},
+    {"type": "pc.check.contains_all", "required": ["label"]},
+    {"type": "pc.check.unknown"},
+]
+
+
+def _corpus(n=300, seed=7):
+    rng = random.Random(seed)
+    labels = ["spam", "Spam", "ham", "other", 1, True, None, ["a"], {"x": 1}]
+    outputs, parsed = [], []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.7:
+            data = {"label": rng.choice(labels)}
+            if rng.random() < 0.8:
+                data["score"] = rng.random()
+            text = json.dumps(data)
+        elif kind < 0.85:
+            data = [1, 2]
+            text = "[1, 2]"
+        else:
+            data = None
+            text = rng.choice(["Sorry, no.", "plain words here and more words", ""])
+        outputs.append(text)
+        parsed.append(data)
+    return outputs, parsed
+
+
+def test_batch_matches_per_output_results():
+    """Test the pass/fail matrix and failure messages match run_checks()."""
+    validator = Validator(CheckRegistry())
+    outputs, parsed = _corpus()
+
+    batch = validator.run_checks_batch(CHECKS, outputs, parsed)
+    assert batch.check_types == [c["type"] for c in CHECKS]
+    assert batch.n_outputs == len(outputs)
+
+    for j, (text, data) in enumerate(zip(outputs, parsed, strict=True)):
+        expected = validator.run_checks(CHECKS, text, data)
+        for i, result in enumerate(expected):
+            assert bool(batch.passed[i][j]) == result["passed"], (CHECKS[i], text)
+            if not result["passed"]:
+                assert batch.failures[(i, j)] == result["message"]
+        assert batch.output_passed()[j] == all(r["passed"] for r in expected)
+
+    assert len(batch.failures) == sum(row.count(0) for row in batch.passed)
+
+
+class CountingEmbedder:
+    """Embedding adapter recording how it was called."""
+
+    def __init__(self):
+        self.batches = []
+
+    def embed(self, text):
+        return [1.0, float(len(text))]
+
+    def embed_batch(self, texts):
+        self.batches.append(len(texts))
+        return [self.embed(text) for text in texts]
+
+
+def test_similarity_embeds_outputs_in_one_batch():
+    """Test similarity embeds the column once and keeps per-output verdicts."""
+    embedder = CountingEmbedder()
+    spec = {"type": "pc.check.similarity", "reference": "abc", "threshold": 0.999}
+    outputs = ["xyz", "a much longer answer", "abd"]
+
+    batch = Validator().run_checks_batch([spec], outputs, embedding_adapter=embedder)
+
+    assert embedder.batches == [3]
+    assert list(batch.passed[0]) == [1, 0, 1]
+    expected = Validator().run_check(spec, outputs[1], embedding_adapter=embedder)
+    assert batch.failures[(0, 1)] == expected["message"]
+
+
+def test_judge_batch_and_summary_helpers():
+    """Test judge checks go through judge_batch() and BatchResult aggregates."""
+    spec = {"type": "pc.check.judge", "criteria": "Be nice"}
+    checks = [spec, {"type": "pc.check.token_budget", "max_out": 1}]
+
+    batch = Validator().run_checks_batch(
+        checks, ["ok", "too long"], judge_adapter=DummyJudgeAdapter(default_verdict=False)
+    )
+
+    assert batch.pass_rates() == [0.0, 0.5]
+    assert batch.output_passed() == [False, False]
+    assert batch.failed(1) == {1: "Token count ~2 > 1"}
+    assert batch.failures[(0, 0)].startswith("Judge failed: Dummy judge response")
+    assert batch.to_dict()["passed"] == [[0, 0], [1, 0]]
+
+    with pytest.raises(ValueError):
+        Validator().run_checks_batch(checks, ["a"], parsed=[None, None])
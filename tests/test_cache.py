@@ -0,0 +1,175 @@
+"""Tests for the persistent response cache."""
+
+import time
+from unittest.mock import patch
+
+from promptcontracts.core.adapters import CachingAdapter
+from promptcontracts.core.adapters.base import AbstractAdapter, capture_call_info
+from promptcontracts.core.cache import ResponseCache, make_cache_key
+from promptcontracts.core.runner import ContractRunner
+
+
+class CountingAdapter(AbstractAdapter):
+    """Adapter returning a fixed output and counting calls."""
+
+    def __init__(self, params=None):
+        super().__init__("test-model", params or {"temperature": 0})
+        self.calls = 0
+
+    def generate(self, prompt, schema=None):
+        self.calls += 1
+        return f'{{"n": {self.calls}}}', 120
+
+
+def test_cache_key_distinguishes_inputs():
+    """Test every key component changes the cache key."""
+    base = make_cache_key("p", "openai", "m", {"temperature": 0}, None, 0)
+
+    assert base == make_cache_key("p", "openai", "m", {"temperature": 0}, None, 0)
+    assert base != make_cache_key("q", "openai", "m", {"temperature": 0}, None, 0)
+    assert base != make_cache_key("p", "ollama", "m", {"temperature": 0}, None, 0)
+    assert base != make_cache_key("p", "openai", "m2", {"temperature": 0}, None, 0)
+    assert base != make_cache_key("p", "openai", "m", {"temperature": 1}, None, 0)
+    assert base != make_cache_key("p", "openai", "m", {"temperature": 0}, {"type": "x"}, 0)
+    assert base != make_cache_key("p", "openai", "m", {"temperature": 0}, None, 1)
+    assert base != make_cache_key("p", "openai", "m", {"temperature": 0}, None, 0, "http://a/v1")
+    assert make_cache_key("p", "openai", "m", None, None, 0, "http://a/v1") != make_cache_key(
+        "p", "openai", "m", None, None, 0, "http://b/v1"
+    )
+
+
+def test_cache_roundtrip_and_persistence(tmp_path):
+    """Test entries survive reopening the cache directory."""
+    cache = ResponseCache(str(tmp_path))
+    assert cache.get("k") is None
+    cache.put("k", "hello", 42.0)
+    cache.close()
+
+    cache = ResponseCache(str(tmp_path))
+    entry = cache.get("k")
+    assert entry.response_text == "hello"
+    assert entry.latency_ms == 42.0
+    assert cache.stats()["hits"] == 1
+    cache.close()
+
+
+def test_cache_ttl_expiry(tmp_path):
+    """Test expired entries are treated as misses and removed."""
+    cache = ResponseCache(str(tmp_path), ttl_seconds=10)
+
+    with patch("promptcontracts.core.cache.time.time", return_value=1000.0):
+        cache.put("k", "hello", 1.0)
+    with patch("promptcontracts.core.cache.time.time", return_value=1005.0):
+        assert cache.get("k") is not None
+    with patch("promptcontracts.core.cache.time.time", return_value=1011.0):
+        assert cache.get("k") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["size_bytes"] == 0
+    cache.close()
+
+
+def test_cache_lru_eviction_by_size(tmp_path):
+    """Test least recently used entries are evicted once over budget."""
+    cache = ResponseCache(str(tmp_path), max_size_mb=250 / (1024 * 1024))
+
+    with patch("promptcontracts.core.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        cache.put("a", "x" * 100, 1.0)
+        cache.put("b", "x" * 100, 1.0)
+        cache.get("a")  # refresh a, so b is least recently used
+        cache.put("c", "x" * 100, 1.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+
+def test_caching_adapter_replays_latency(tmp_path):
+    """Test cache hits return the recorded latency and are flagged."""
+    inner = CountingAdapter()
+    cache = ResponseCache(str(tmp_path))
+    adapter = CachingAdapter(inner, cache, "openai")
+
+    with capture_call_info() as info:
+        first = adapter.generate("prompt")
+    assert info == {"cache_hit": False}
+
+    with capture_call_info() as info:
+        second = adapter.generate("prompt")
+    assert info == {"cache_hit": True}
+    assert second == first
+    assert inner.calls == 1
+
+    adapter.generate("prompt", sample_index=1)
+    assert inner.calls == 2
+    cache.close()
+
+
+def test_caching_adapter_keys_by_server(tmp_path):
+    """Test the same model on different servers does not share cache entries."""
+    cache = ResponseCache(str(tmp_path))
+    local, remote = CountingAdapter(), CountingAdapter()
+    local.base_url, remote.base_url = "http://localhost:11434", "http://gpu-box:11434"
+
+    CachingAdapter(local, cache, "ollama").generate("prompt")
+    CachingAdapter(remote, cache, "ollama").generate("prompt")
+    CachingAdapter(CountingAdapter(), cache, "ollama").generate("prompt")
+
+    assert (local.calls, remote.calls) == (1, 1)
+    assert cache.stats()["misses"] == 3
+    cache.close()
+
+
+def test_runner_second_run_served_from_cache(tmp_path, make_artifacts, use_adapter):
+    """Test an unchanged re-run makes no provider calls."""
+    artifacts = make_artifacts(
+        targets=[{"type": "ollama", "model": "test-model", "params": {"temperature": 0}}],
+        fixtures=2,
+        execution={"cache": {"enabled": True, "dir": str(tmp_path)}},
+    )
+    adapter = CountingAdapter()
+
+    with use_adapter(adapter):
+        first = ContractRunner(*artifacts).run()
+        second = ContractRunner(*artifacts).run()
+
+    assert adapter.calls == 2
+    assert first["cache"]["misses"] == 2
+    assert second["cache"]["hits"] == 2
+    fixture = second["targets"][0]["fixtures"][0]
+    assert fixture["sampling_metadata"]["samples"][0]["cache_hit"] is True
+    assert fixture["latency_ms"] == 120
+
+
+class SlowAdapter(CountingAdapter):
+    """Adapter taking 30 ms per call."""
+
+    def generate(self, prompt, schema=None):
+        time.sleep(0.03)
+        return super().generate(prompt, schema)
+
+
+def test_streamed_cache_hits_keep_generation_latency(tmp_path, make_artifacts, use_adapter):
+    """Test replayed streams report the cached latency, so budgets see real timings."""
+    artifacts = make_artifacts(
+        checks=[{"type": "pc.check.json_valid"}, {"type": "pc.check.latency_budget", "p95_ms": 20}],
+        targets=[{"type": "ollama", "model": "test-model", "params": {"temperature": 0}}],
+        fixtures=2,
+        execution={"stream": True, "cache": {"enabled": True, "dir": str(tmp_path)}},
+    )
+    adapter = SlowAdapter()
+
+    with use_adapter(adapter):
+        first = ContractRunner(*artifacts).run()
+        second = ContractRunner(*artifacts).run()
+
+    assert adapter.calls == 2
+    assert second["cache"]["hits"] == 2
+    for results in (first, second):
+        (budget,) = results["targets"][0]["summary"]["target_checks"]
+        assert budget["type"] == "pc.check.latency_budget"
+        assert not budget["passed"]
+    assert all(f["latency_ms"] >= 30 for f in second["targets"][0]["fixtures"])
@@ -0,0 +1,178 @@
+"""Tests for compiled check plans."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from jsonpath_ng import parse
+
+from promptcontracts.core.adapters import Capability
+from promptcontracts.core.validator import CheckCostModel, CheckRegistry, Validator
+from promptcontracts.utils.jsonpath import compile_jsonpath
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.json_required", "fields": ["label", "meta"]},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["Spam", "Ham"]},
+    {
+        "type": "pc.check.enum",
+        "field": "$.label",
+        "allowed": ["spam", "ham"],
+        "case_insensitive": True,
+    },
+    {"type": "pc.check.regex_absent", "pattern": r"\bsorry\b"},
+    {"type": "pc.check.token_budget", "max_out": 5},
+    {"type": "pc.check.contains_any", "options": ["Spam"]},
+    {"type": "pc.check.unknown"},
+]
+
+RESPONSES = [
+    ('{"label": "Spam", "meta": {}}', {"label": "Spam", "meta": {}}),
+    ('{"label": "spam"}', {"label": "spam"}),
+    ("sorry, I cannot help with that request today", None),
+    ('{"label": ["Ham"], "meta": 1}', {"label": ["Ham"], "meta": 1}),
+]
+
+
+def test_plan_matches_run_checks():
+    """Test a compiled plan gives the same results as per-call evaluation."""
+    validator = Validator(CheckRegistry())
+    plan = validator.compile(CHECKS)
+    assert len(plan) == len(CHECKS)
+
+    for response_text, parsed in RESPONSES:
+        expected = validator.run_checks(CHECKS, response_text, parsed)
+        assert validator.run_plan(plan, response_text, parsed) == expected
+
+
+@pytest.mark.parametrize("path", ["$", "$.a", "$.a.b"])
+def test_simple_jsonpath_matches_jsonpath_ng(path):
+    """Test the dotted-path fast path finds what jsonpath_ng finds."""
+    documents = [{"a": {"b": [1]}}, {"a": None}, {"a": [{"b": 1}]}, [{"a": 1}], "x", {}]
+    find = compile_jsonpath(path)
+    for document in documents:
+        assert find(document) == [m.value for m in parse(path).find(document)]
+
+
+def test_invalid_specs_fail_per_response():
+    """Test invalid regexes and JSONPaths are reported on evaluation, not at compile time."""
+    checks = [
+        {"type": "pc.check.regex_absent", "pattern": "("},
+        {"type": "pc.check.enum", "field": "$[", "allowed": ["a"]},
+    ]
+    validator = Validator(CheckRegistry())
+    plan = validator.compile(checks)
+
+    results = validator.run_plan(plan, '{"x": 1}', {"x": 1})
+    assert results == validator.run_checks(checks, '{"x": 1}', {"x": 1})
+    assert [r["passed"] for r in results] == [False, False]
+
+
+def test_custom_check_replaces_builtin_compiler():
+    """Test re-registering a built-in check type is honoured by compiled plans."""
+    registry = CheckRegistry()
+    registry.register("pc.check.token_budget", lambda response_text, **kwargs: (True, "ok", None))
+    validator = Validator(registry)
+
+    plan = validator.compile([{"type": "pc.check.token_budget", "max_out": 1}])
+    assert validator.run_plan(plan, "far too many words")[0]["message"] == "ok"
+
+
+def test_semantic_two_tuple_checks_run_through_validator():
+    """Test checks returning (passed, message) are wrapped instead of erroring."""
+    validator = Validator(CheckRegistry())
+    result = validator.run_check(
+        {"type": "pc.check.contains_all", "required": ["a", "b"]}, "a and b"
+    )
+    assert result["passed"] is True
+    assert result["data"] is None
+
+
+class SpyJudge:
+    """Judge adapter counting calls; always passes."""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def judge(self, prompt, budget=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"verdict": True, "explanation": "fine", "tokens_used": 1, "latency_ms": 1}
+
+
+JUDGED_CHECKS = [
+    {"type": "pc.check.judge", "criteria": "Is it polite?"},
+    {"type": "pc.check.json_required", "fields": ["label"]},
+    {"type": "pc.check.regex_absent", "pattern": "sorry"},
+]
+
+
+def test_short_circuit_skips_expensive_checks_after_failure():
+    """Test cheap checks run first and the judge is skipped once one fails."""
+    validator = Validator(CheckRegistry())
+    plan = validator.compile(JUDGED_CHECKS)
+    judge = SpyJudge()
+
+    results = validator.run_plan(
+        plan, "sorry", None, judge_adapter=judge, short_circuit=True, cost_model=CheckCostModel()
+    )
+    assert judge.calls == 0
+    # Results keep ES order
+    assert [r["type"] for r in results] == [c["type"] for c in JUDGED_CHECKS]
+    assert results[0]["skipped"] and not results[0]["passed"]
+    assert results[0]["message"] == "SKIPPED: response already failed pc.check.json_required"
+    assert not results[1]["passed"] and "skipped" not in results[1]
+    assert results[2]["skipped"]
+
+    passing = validator.run_plan(plan, '{"label": 1}', {"label": 1}, judge_adapter=judge)
+    short_circuited = validator.run_plan(
+        plan, '{"label": 1}', {"label": 1}, judge_adapter=SpyJudge(), short_circuit=True
+    )
+    assert short_circuited == passing
+    assert judge.calls == 1
+
+
+def test_cost_model_learns_order_from_timings():
+    """Test observed durations replace priors and reorder checks."""
+    validator = Validator(CheckRegistry())
+    plan = validator.compile(JUDGED_CHECKS)
+    model = CheckCostModel()
+    assert model.order(plan) == [1, 2, 0]
+
+    model.observe("pc.check.judge", 0.001)
+    model.observe("pc.check.json_required", 5.0)
+    assert model.order(plan) == [0, 2, 1]
+
+    # Later timings move the average gradually
+    model.observe("pc.check.judge", 10.0)
+    assert model.cost("pc.check.judge") == pytest.approx(0.001 + 0.2 * (10.0 - 0.001))
+
+    model.skip("pc.check.regex_absent")
+    assert model.stats()["pc.check.regex_absent"] == {"mean_ms": 0.0, "runs": 0, "skipped": 1}
+    assert model.stats()["pc.check.judge"]["runs"] == 2
+
+
+def test_runner_short_circuit_reports_skipped_checks(make_artifacts, run_contract):
+    """Test EP execution.short_circuit skips the judge on failing samples."""
+    artifacts = make_artifacts(
+        checks=JUDGED_CHECKS,
+        fixtures=[{"id": "ok", "input": "a"}, {"id": "bad", "input": "b"}],
+        execution={"short_circuit": True},
+    )
+
+    adapter = MagicMock()
+    adapter.capabilities.return_value = Capability()
+    adapter.generate.side_effect = lambda prompt, schema=None: (
+        ('{"label": "x"}', 1) if prompt.endswith("a") else ('{"oops": 1}', 1)
+    )
+    # Slower than the other checks, as real judges are, so the learned order keeps it last
+    judge = SpyJudge(delay=0.01)
+
+    results = run_contract(artifacts, adapter, judge_adapter=judge)
+
+    assert judge.calls == 1
+    target = results["targets"][0]
+    assert target["summary"]["skipped_checks"] == 1
+    judge_stats = results["checks"]["pc.check.judge"]
+    assert (judge_stats["runs"], judge_stats["skipped"]) == (1, 1)
@@ -0,0 +1,129 @@
+"""Tests for checkpoint journaling and resume."""
+
+import json
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter
+from promptcontracts.core.checkpoint import JOURNAL_FILENAME, CheckpointJournal, artifact_hashes
+from promptcontracts.utils.errors import ExecutionError
+
+
+class FlakyAdapter(AbstractAdapter):
+    """Adapter answering from the prompt that dies after a number of calls."""
+
+    def __init__(self, fail_after: int | None = None):
+        super().__init__("flaky-model", {})
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def generate(self, prompt, schema=None):
+        if self.fail_after is not None and self.calls >= self.fail_after:
+            raise ConnectionError("network blip")
+        self.calls += 1
+        label = "a" if prompt.endswith(("0", "2", "4")) else "b"
+        return json.dumps({"label": label}), 10 + len(prompt) % 7
+
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["a"]},
+]
+
+
+@pytest.fixture
+def artifacts(make_artifacts):
+    return make_artifacts(checks=CHECKS, fixtures=5, n_samples=2)
+
+
+def test_resume_skips_completed_units_and_matches_full_run(tmp_path, artifacts, run_contract):
+    """Test an interrupted run resumes where it stopped with identical results."""
+    expected = run_contract(artifacts, FlakyAdapter())
+
+    with pytest.raises(ConnectionError):
+        run_contract(artifacts, FlakyAdapter(fail_after=6), checkpoint_dir=str(tmp_path))
+
+    adapter = FlakyAdapter()
+    resumed = run_contract(artifacts, adapter, checkpoint_dir=str(tmp_path), resume=True)
+
+    assert adapter.calls == 4
+    assert resumed == expected
+
+
+def test_journal_records_raw_output_and_checks(tmp_path, make_artifacts, run_contract):
+    """Test each completed sample is appended with outputs and check results."""
+    artifacts = make_artifacts(checks=CHECKS, fixtures=2, n_samples=2)
+    run_contract(artifacts, FlakyAdapter(), checkpoint_dir=str(tmp_path))
+
+    lines = (tmp_path / JOURNAL_FILENAME).read_text().splitlines()
+    header, records = json.loads(lines[0]), [json.loads(line) for line in lines[1:]]
+
+    assert header["type"] == "header"
+    assert set(header["hashes"]) == {"pd", "es", "ep"}
+    assert len(records) == 4
+    assert records[0]["raw_output"] == '{"label": "a"}'
+    assert records[0]["check_results"]
+
+
+def test_resume_rejects_changed_artifacts(tmp_path, make_artifacts, run_contract):
+    """Test the journal is re-validated against the PD/ES/EP hashes."""
+    pd, es, ep = make_artifacts(fixtures=1)
+    run_contract((pd, es, ep), FlakyAdapter(), checkpoint_dir=str(tmp_path))
+
+    es["checks"].append({"type": "pc.check.token_budget", "max_out": 50})
+    with pytest.raises(ExecutionError, match="changed: es"):
+        run_contract((pd, es, ep), FlakyAdapter(), checkpoint_dir=str(tmp_path), resume=True)
+
+
+def test_resume_allows_changed_concurrency(make_artifacts):
+    """Test scheduling-only settings are excluded from the EP hash."""
+    pd, es, ep = make_artifacts(fixtures=1)
+    hashes = artifact_hashes(pd, es, ep)
+
+    ep["execution"]["concurrency"] = {"global": 8}
+    assert artifact_hashes(pd, es, ep) == hashes
+
+
+def test_resume_ignores_truncated_trailing_line(tmp_path, make_artifacts, run_contract):
+    """Test a partially written last record is dropped on load."""
+    artifacts = make_artifacts(fixtures=1)
+    run_contract(artifacts, FlakyAdapter(), checkpoint_dir=str(tmp_path))
+
+    with open(tmp_path / JOURNAL_FILENAME, "a") as f:
+        f.write('{"type": "sample", "target_ind')
+
+    journal = CheckpointJournal(str(tmp_path), artifact_hashes(*artifacts), resume=True)
+    assert len(journal) == 1
+    journal.close()
+
+
+def test_resume_after_two_interrupted_writes(tmp_path, artifacts, run_contract):
+    """Test records appended after a truncated line survive a second resume."""
+    expected = run_contract(artifacts, FlakyAdapter())
+    journal_path = tmp_path / JOURNAL_FILENAME
+
+    with pytest.raises(ConnectionError):
+        run_contract(artifacts, FlakyAdapter(fail_after=3), checkpoint_dir=str(tmp_path))
+    with open(journal_path, "a") as f:
+        f.write('{"type": "sample", "target_ind')
+
+    with pytest.raises(ConnectionError):
+        run_contract(
+            artifacts,
+            FlakyAdapter(fail_after=4),
+            checkpoint_dir=str(tmp_path),
+            resume=True,
+        )
+    assert all(json.loads(line) for line in journal_path.read_text().splitlines())
+
+    adapter = FlakyAdapter()
+    resumed = run_contract(artifacts, adapter, checkpoint_dir=str(tmp_path), resume=True)
+
+    assert adapter.calls == 10 - 3 - 4
+    assert resumed == expected
+
+
+def test_resume_requires_existing_journal(tmp_path):
+    """Test resuming from an empty directory fails clearly."""
+    with pytest.raises(ExecutionError, match="No checkpoint journal"):
+        CheckpointJournal(str(tmp_path), {}, resume=True)
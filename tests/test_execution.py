@@ -0,0 +1,271 @@
+"""Tests for the async execution engine and concurrency limits."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter, Capability
+from promptcontracts.core.execution import (
+    AdaptiveConfig,
+    AdaptiveLimit,
+    ConcurrencyConfig,
+    run_sync,
+)
+from promptcontracts.core.runner import ContractRunner
+
+
+class SlowAdapter(AbstractAdapter):
+    """Adapter that sleeps and tracks peak concurrency."""
+
+    def __init__(self, delay: float = 0.02, output: str = '{"label": "a"}'):
+        super().__init__("slow-model", {})
+        self.delay = delay
+        self.output = output
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, schema=None):
+        with self._lock:
+            self.in_flight += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return self.output, 10
+
+
+def test_concurrency_config_defaults():
+    """Test defaults keep execution sequential."""
+    config = ConcurrencyConfig.from_dict(None)
+    assert config.to_dict() == {"global": 1, "per_target": 1, "per_fixture": 1}
+
+
+def test_concurrency_config_inherits_and_clamps():
+    """Test narrower limits inherit from and are clamped by wider ones."""
+    config = ConcurrencyConfig.from_dict({"global": 8, "per_target": 16})
+    assert config.target_limit == 8
+    assert config.fixture_limit == 8
+
+    config = ConcurrencyConfig.from_dict({"global": 8, "per_target": 4, "per_fixture": 2})
+    assert config.to_dict() == {"global": 8, "per_target": 4, "per_fixture": 2}
+
+
+def test_concurrency_config_rejects_invalid():
+    """Test non-positive limits are rejected."""
+    with pytest.raises(ValueError):
+        ConcurrencyConfig.from_dict({"global": 0})
+
+
+def test_run_is_sequential_by_default(make_artifacts, run_contract):
+    """Test default config never has more than one call in flight."""
+    adapter = SlowAdapter(delay=0.005)
+    results = run_contract(make_artifacts(fixtures=4), adapter)
+
+    assert adapter.peak == 1
+    assert adapter.calls == 4
+    assert results["targets"][0]["summary"]["status"] == "GREEN"
+
+
+def test_run_respects_global_limit_and_keeps_order(make_artifacts, run_contract):
+    """Test concurrent run is bounded and fixture order matches the EP."""
+    adapter = SlowAdapter()
+    artifacts = make_artifacts(fixtures=12, execution={"concurrency": {"global": 4}})
+    results = run_contract(artifacts, adapter)
+
+    assert 1 < adapter.peak <= 4
+    fixture_ids = [f["fixture_id"] for f in results["targets"][0]["fixtures"]]
+    assert fixture_ids == [f"f{i}" for i in range(12)]
+
+
+def test_per_fixture_limit_bounds_samples(make_artifacts, run_contract):
+    """Test samples of a single fixture respect per_fixture."""
+    adapter = SlowAdapter()
+    concurrency = {"global": 8, "per_fixture": 2}
+    artifacts = make_artifacts(fixtures=1, n_samples=6, execution={"concurrency": concurrency})
+    results = run_contract(artifacts, adapter)
+
+    assert adapter.peak == 2
+    sampling = results["targets"][0]["fixtures"][0]["sampling_metadata"]
+    assert [s["sample_id"] for s in sampling["samples"]] == list(range(6))
+
+
+def test_arun_matches_run_shape(make_artifacts, use_adapter):
+    """Test arun() and run() produce the same result structure."""
+    pd, es, ep = make_artifacts(execution={"concurrency": {"global": 3}})
+
+    with use_adapter(SlowAdapter(0.001)):
+        sync_results = ContractRunner(pd, es, ep).run()
+        async_results = asyncio.run(ContractRunner(pd, es, ep).arun())
+
+    assert sync_results == async_results
+
+
+def test_run_sync_inside_running_loop():
+    """Test run_sync works when called from within an event loop."""
+
+    async def inner():
+        return 42
+
+    async def outer():
+        return run_sync(inner())
+
+    assert asyncio.run(outer()) == 42
+
+
+def test_early_stopping_reports_saved_samples(make_artifacts, run_contract):
+    """Test early stopping saves generate calls and reports it per fixture."""
+    adapter = SlowAdapter(delay=0.001)
+    sampling = {"aggregation": "any", "early_stopping": True}
+    results = run_contract(make_artifacts(fixtures=2, n_samples=10, sampling=sampling), adapter)
+
+    assert adapter.calls == 2
+    for fixture in results["targets"][0]["fixtures"]:
+        assert fixture["sampling_metadata"]["early_stopping"]["samples_saved"] == 9
+
+
+class FirstCallFastAdapter(SlowAdapter):
+    """SlowAdapter whose first call returns at once."""
+
+    def generate(self, prompt, schema=None):
+        with self._lock:
+            self.in_flight += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.in_flight)
+            delay = 0 if self.calls == 1 else self.delay
+        time.sleep(delay)
+        with self._lock:
+            self.in_flight -= 1
+        return self.output, 10
+
+
+def test_early_stopping_keeps_slots_until_running_calls_return(make_artifacts, run_contract):
+    """Test calls cancelled mid-flight hold their slots, so the limit holds after a stop."""
+    adapter = FirstCallFastAdapter(delay=0.1)
+    concurrency = {"global": 4, "per_target": 2}
+    sampling = {"aggregation": "any", "early_stopping": True}
+    artifacts = make_artifacts(
+        fixtures=2, n_samples=3, execution={"concurrency": concurrency}, sampling=sampling
+    )
+    run_contract(artifacts, adapter)
+
+    assert adapter.peak <= 2
+
+
+class SeededAdapter(SlowAdapter):
+    """SlowAdapter that honours seeds."""
+
+    def capabilities(self):
+        return Capability(supports_seed=True)
+
+
+def test_deterministic_collapse_probes_then_synthesizes(make_artifacts, run_contract):
+    """Test seeded temperature-0 targets draw only the probe samples."""
+    adapter = SeededAdapter(delay=0.001)
+    artifacts = make_artifacts(
+        targets=[
+            {"type": "ollama", "model": "slow-model", "params": {"temperature": 0, "seed": 7}}
+        ],
+        fixtures=2,
+        n_samples=10,
+        sampling={"collapse_deterministic": True},
+    )
+
+    results = run_contract(artifacts, adapter)
+
+    assert adapter.calls == 4
+    for fixture in results["targets"][0]["fixtures"]:
+        metadata = fixture["sampling_metadata"]
+        assert metadata["n_samples"] == 10
+        assert metadata["collapse"]["samples_synthesized"] == 8
+        assert metadata["samples"][9]["collapsed_from"] == 0
+
+
+def test_deterministic_collapse_needs_seeded_greedy_target(make_artifacts, run_contract):
+    """Test collapse is skipped, with the reason recorded, without a seed."""
+    adapter = SeededAdapter(delay=0.001)
+    artifacts = make_artifacts(
+        targets=[{"type": "ollama", "model": "slow-model", "params": {"temperature": 0}}],
+        fixtures=1,
+        n_samples=4,
+        sampling={"collapse_deterministic": {"probe": 2}},
+    )
+
+    results = run_contract(artifacts, adapter)
+
+    assert adapter.calls == 4
+    collapse = results["targets"][0]["fixtures"][0]["sampling_metadata"]["collapse"]
+    assert collapse == {"collapsed": False, "reason": "no seed in target params"}
+
+
+def test_adaptive_config_parsing():
+    """Test adaptive accepts true or a settings dict and validates ranges."""
+    assert ConcurrencyConfig.from_dict({"adaptive": True}).adaptive == AdaptiveConfig()
+    assert ConcurrencyConfig.from_dict({"adaptive": {"enabled": False}}).adaptive is None
+    config = ConcurrencyConfig.from_dict({"global": 8, "adaptive": {"initial": 2, "max": 6}})
+    assert config.adaptive.max_limit == 6
+    assert config.to_dict()["adaptive"] is True
+
+    with pytest.raises(ValueError):
+        ConcurrencyConfig.from_dict({"adaptive": {"backoff": 1.5}})
+    with pytest.raises(ValueError):
+        ConcurrencyConfig.from_dict({"adaptive": {"initial": 4, "max": 2}})
+
+
+def test_adaptive_limit_grows_and_backs_off():
+    """Test slow start growth, multiplicative backoff and additive increase after it."""
+    controller = AdaptiveLimit(AdaptiveConfig(), ceiling=16)
+    for _ in range(7):
+        controller.on_success(0.01)
+    assert controller.limit == 8
+    assert controller.slow_start
+
+    controller.on_error()
+    assert controller.limit == 4
+    assert not controller.slow_start
+
+    # A second failure from the same round trip is not counted again
+    controller.on_error()
+    assert controller.limit == 4
+
+    for _ in range(4):
+        controller.on_success(0.01)
+    assert 4.9 < controller.limit < 5.1
+
+    for _ in range(150):
+        controller.on_success(0.01)
+    assert controller.limit == 16
+    assert controller.stats()["decreases"] == 1
+
+
+def test_adaptive_limit_backs_off_on_latency_inflation():
+    """Test smoothed latency above baseline x tolerance shrinks the limit."""
+    controller = AdaptiveLimit(AdaptiveConfig(initial=4), ceiling=16)
+    controller.on_success(0.001)
+    assert controller.limit == 5
+
+    controller.on_success(0.5)  # smoothed ~0.1s, 100x the baseline
+    assert controller.limit == 4
+    assert controller.stats()["baseline_latency_ms"] == 1.0
+
+
+def test_run_with_adaptive_concurrency_reports_state(make_artifacts, run_contract):
+    """Test adaptive runs ramp up concurrency and expose controller state."""
+    adapter = SlowAdapter(delay=0.01)
+    concurrency = {"global": 8, "adaptive": True}
+    results = run_contract(
+        make_artifacts(fixtures=40, execution={"concurrency": concurrency}), adapter
+    )
+
+    stats = results["targets"][0]["execution"]["concurrency"]
+    assert 1 < stats["peak_in_flight"] <= 8
+    assert adapter.peak == stats["peak_in_flight"]
+    assert stats["max_limit"] == 8
+    assert stats["mean_in_flight"] > 1
+    assert [f["fixture_id"] for f in results["targets"][0]["fixtures"]] == [
+        f"f{i}" for i in range(40)
+    ]
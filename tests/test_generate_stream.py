@@ -0,0 +1,162 @@
+"""Tests for streamed generation, TTFT/throughput metrics and their budgets."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from promptcontracts.core.adapters import (
+    AbstractAdapter,
+    OllamaAdapter,
+    OpenAIAdapter,
+    capture_call_info,
+    consume_stream,
+    record_call_info,
+)
+
+CHUNKS = ['{"lab', 'el": ', '"ok"}']
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Streams CHUNKS as Ollama NDJSON or OpenAI server-sent events."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        openai = self.path.endswith("/chat/completions")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if openai else "application/x-ndjson")
+        self.send_header("x-ratelimit-remaining-requests", "41")
+        self.end_headers()
+
+        for chunk in CHUNKS:
+            time.sleep(0.01)
+            if openai:
+                event = {
+                    "id": "c1",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "stub",
+                    "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}],
+                }
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+            else:
+                self.wfile.write((json.dumps({"response": chunk, "done": False}) + "\n").encode())
+            self.wfile.flush()
+
+        if openai:
+            usage = {"prompt_tokens": 5, "completion_tokens": 6, "total_tokens": 11}
+            final = {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "stub"}
+            self.wfile.write(
+                f"data: {json.dumps({**final, 'choices': [], 'usage': usage})}\n\n".encode()
+            )
+            self.wfile.write(b"data: [DONE]\n\n")
+        else:
+            done = {"response": "", "done": True, "prompt_eval_count": 5, "eval_count": 6}
+            self.wfile.write((json.dumps(done) + "\n").encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class PacedAdapter(AbstractAdapter):
+    """Streams fixed chunks after a first-token delay."""
+
+    def __init__(self, first_delay=0.03, gap=0.005):
+        super().__init__("paced", {})
+        self.first_delay = first_delay
+        self.gap = gap
+
+    def generate(self, prompt, schema=None):
+        return "".join(CHUNKS), 1
+
+    def generate_stream(self, prompt, schema=None):
+        time.sleep(self.first_delay)
+        for i, chunk in enumerate(CHUNKS):
+            if i:
+                time.sleep(self.gap)
+            yield chunk
+        record_call_info(output_tokens=7)
+
+
+def test_consume_stream_times_chunks():
+    """Test TTFT, inter-token gaps and throughput come from chunk arrival times."""
+    with capture_call_info():
+        text, timing = consume_stream(PacedAdapter(first_delay=0.03, gap=0.01).generate_stream(""))
+
+    assert text == "".join(CHUNKS)
+    assert timing.chunks == 3
+    assert timing.output_tokens == 7
+    assert 30 <= timing.ttft_ms < timing.total_ms
+    assert timing.decode_ms >= 20
+    assert timing.mean_itl_ms >= 10
+    assert timing.tokens_per_s == pytest.approx(6 / (timing.decode_ms / 1000))
+
+
+def test_default_generate_stream_falls_back_to_generate():
+    """Test adapters without streaming yield the whole response as one chunk."""
+
+    class Plain(AbstractAdapter):
+        def generate(self, prompt, schema=None):
+            return "whole", 3
+
+    text, timing = consume_stream(Plain("plain").generate_stream("x"))
+    assert text == "whole"
+    assert timing.chunks == 1
+    assert timing.tokens_per_s is None
+
+
+def test_ollama_streams_ndjson(stub_url):
+    """Test the Ollama adapter yields chunks and records eval_count as output tokens."""
+    with capture_call_info() as info:
+        text, timing = consume_stream(OllamaAdapter("stub", base_url=stub_url).generate_stream("x"))
+
+    assert text == "".join(CHUNKS)
+    assert timing.chunks == 3
+    assert info["output_tokens"] == 6
+    assert info["usage_tokens"] == 11
+
+
+def test_openai_streams_sse(stub_url, monkeypatch):
+    """Test the OpenAI adapter consumes SSE deltas and the final usage chunk."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"{stub_url}/v1")
+
+    with capture_call_info() as info:
+        text, timing = consume_stream(OpenAIAdapter("stub").generate_stream("x"))
+
+    assert text == "".join(CHUNKS)
+    assert timing.chunks == 3
+    assert timing.ttft_ms > 5
+    assert info["output_tokens"] == 6
+    assert info["rate_limit"]["remaining_requests"] == 41
+
+
+def test_runner_records_stream_metrics_and_budgets(make_artifacts, run_contract):
+    """Test TTFT/throughput budgets enable streaming and are checked per target."""
+    checks = [
+        {"type": "pc.check.json_valid"},
+        {"type": "pc.check.ttft_budget", "p95_ms": 10},
+        {"type": "pc.check.throughput_budget", "min_tokens_per_s": 1},
+    ]
+    results = run_contract(make_artifacts(checks=checks, n_samples=2), PacedAdapter())
+
+    target = results["targets"][0]
+    samples = target["fixtures"][0]["sampling_metadata"]["samples"]
+    assert all(s["stream"]["ttft_ms"] >= 30 for s in samples)
+    assert all(c["type"] == "pc.check.json_valid" for c in target["fixtures"][0]["checks"])
+
+    budgets = {r["type"]: r for r in target["summary"]["target_checks"]}
+    assert not budgets["pc.check.ttft_budget"]["passed"]
+    assert budgets["pc.check.throughput_budget"]["passed"]
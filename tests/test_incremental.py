@@ -0,0 +1,161 @@
+"""Tests for incremental re-runs against a previous --save-io directory."""
+
+import json
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter
+from promptcontracts.core.incremental import PriorRun
+from promptcontracts.core.sampling import SampleResult
+
+
+class CountingAdapter(AbstractAdapter):
+    """Adapter echoing a label derived from the fixture input."""
+
+    def __init__(self, base_url=None):
+        super().__init__("echo-model", {})
+        self.base_url = base_url
+        self.calls = 0
+
+    def generate(self, prompt, schema=None):
+        self.calls += 1
+        label = "yes" if prompt.endswith("1") else "no"
+        return json.dumps({"label": label}), 20
+
+
+@pytest.fixture
+def artifacts(make_artifacts):
+    return make_artifacts(
+        checks=[
+            {"type": "pc.check.json_valid"},
+            {"type": "pc.check.enum", "field": "$.label", "allowed": ["yes", "no"]},
+        ],
+        targets=[{"type": "ollama", "model": "echo-model", "params": {"temperature": 0}}],
+        n_samples=2,
+    )
+
+
+def _strip_paths(results):
+    for target in results["targets"]:
+        for fixture in target["fixtures"]:
+            fixture.pop("artifact_paths", None)
+            fixture.pop("reuse", None)
+    results.pop("artifact_base_dir", None)
+    results.pop("incremental", None)
+    return results
+
+
+def test_unchanged_artifacts_reuse_everything(tmp_path, artifacts, run_contract):
+    """Test an unchanged re-run makes no provider calls and matches the original."""
+    first = run_contract(artifacts, CountingAdapter(), save_io_dir=str(tmp_path / "a"))
+
+    adapter = CountingAdapter()
+    second = run_contract(
+        artifacts, adapter, save_io_dir=str(tmp_path / "b"), reuse_dir=str(tmp_path / "a")
+    )
+
+    assert adapter.calls == 0
+    assert second["incremental"] == {"reuse": 3, "revalidate": 0, "regenerate": 0}
+    assert _strip_paths(second) == _strip_paths(first)
+
+
+def test_check_edit_revalidates_offline(tmp_path, artifacts, run_contract):
+    """Test a changed ES re-validates stored outputs without generating."""
+    pd, es, ep = artifacts
+    run_contract((pd, es, ep), CountingAdapter(), save_io_dir=str(tmp_path))
+
+    es["checks"][1]["allowed"] = ["yes"]
+    adapter = CountingAdapter()
+    results = run_contract((pd, es, ep), adapter, reuse_dir=str(tmp_path))
+
+    assert adapter.calls == 0
+    assert results["incremental"] == {"reuse": 0, "revalidate": 3, "regenerate": 0}
+    statuses = [f["status"] for f in results["targets"][0]["fixtures"]]
+    assert statuses == ["FAIL", "PASS", "FAIL"]
+
+
+def test_prompt_input_and_params_edits_regenerate(tmp_path, artifacts, run_contract):
+    """Test generation-relevant edits regenerate only the affected fixtures."""
+    pd, es, ep = artifacts
+    run_contract((pd, es, ep), CountingAdapter(), save_io_dir=str(tmp_path))
+
+    ep["fixtures"][0]["input"] = "question 11"
+    adapter = CountingAdapter()
+    results = run_contract((pd, es, ep), adapter, reuse_dir=str(tmp_path))
+    assert adapter.calls == 2
+    assert [f["reuse"] for f in results["targets"][0]["fixtures"]] == [
+        "regenerate",
+        "reuse",
+        "reuse",
+    ]
+
+    ep["targets"][0]["params"]["temperature"] = 0.7
+    adapter = CountingAdapter()
+    run_contract((pd, es, ep), adapter, reuse_dir=str(tmp_path))
+    assert adapter.calls == 6
+
+    pd["prompt"] = "Answer briefly."
+    ep["targets"][0]["params"]["temperature"] = 0
+    adapter = CountingAdapter()
+    run_contract((pd, es, ep), adapter, reuse_dir=str(tmp_path))
+    assert adapter.calls == 6
+
+
+def test_extra_samples_are_generated(tmp_path, artifacts, run_contract):
+    """Test raising n reuses stored samples and only generates the new ones."""
+    pd, es, ep = artifacts
+    run_contract((pd, es, ep), CountingAdapter(), save_io_dir=str(tmp_path))
+
+    ep["sampling"]["n"] = 3
+    adapter = CountingAdapter()
+    run_contract((pd, es, ep), adapter, reuse_dir=str(tmp_path))
+
+    assert adapter.calls == 3
+
+
+def test_prior_run_without_fingerprints_regenerates(tmp_path):
+    """Test artifacts from older versions (no fingerprints) are not reused."""
+    run_dir = tmp_path / "ollama:echo-model" / "f0"
+    run_dir.mkdir(parents=True)
+    (run_dir / "run.json").write_text(json.dumps({"status": "PASS"}))
+
+    decision, samples = PriorRun(str(tmp_path)).plan("ollama:echo-model", "f0", "g", "e")
+    assert decision == "regenerate"
+    assert samples == {}
+
+
+def test_base_url_change_regenerates(tmp_path, artifacts, run_contract):
+    """Test pointing the same model at another server does not reuse its outputs."""
+    adapter = CountingAdapter(base_url="http://gpu-a:11434")
+    run_contract(artifacts, adapter, save_io_dir=str(tmp_path))
+
+    adapter = CountingAdapter(base_url="http://gpu-a:11434/")
+    run_contract(artifacts, adapter, reuse_dir=str(tmp_path))
+    assert adapter.calls == 0
+
+    adapter = CountingAdapter(base_url="http://gpu-b:11434")
+    results = run_contract(artifacts, adapter, reuse_dir=str(tmp_path))
+    assert adapter.calls == 6
+    assert results["incremental"] == {"reuse": 0, "revalidate": 0, "regenerate": 3}
+
+
+def test_early_aborted_samples_regenerate_after_check_edit(tmp_path):
+    """Test partial outputs of aborted generations are not re-validated."""
+    aborted = SampleResult(
+        sample_id=0,
+        output='{"note": "the api',
+        parsed=None,
+        latency_ms=5.0,
+        checks_passed=False,
+        check_results=[],
+        metadata={"early_abort": {"check": {"type": "pc.check.regex_absent"}, "result": {}}},
+        raw_output='{"note": "the api',
+    )
+    run_dir = tmp_path / "ollama:echo-model" / "f0"
+    run_dir.mkdir(parents=True)
+    saved = {"fingerprints": {"generation": "g", "evaluation": "e"}, "samples": [aborted.to_dict()]}
+    (run_dir / "run.json").write_text(json.dumps(saved))
+    prior = PriorRun(str(tmp_path))
+
+    assert prior.plan("ollama:echo-model", "f0", "g", "e")[0] == "reuse"
+    assert prior.plan("ollama:echo-model", "f0", "g", "e2") == ("regenerate", {})
@@ -0,0 +1,189 @@
+"""Tests for incremental (chunk-consuming) checks and early abort of generation."""
+
+import json
+import time
+
+from promptcontracts.core.adapters import AbstractAdapter, consume_stream
+from promptcontracts.core.checks.incremental import (
+    ContainsAnyIncremental,
+    JsonValidIncremental,
+    RegexAbsentIncremental,
+    TokenBudgetIncremental,
+)
+from promptcontracts.core.validator import Validator
+
+
+def _feed_all(check, chunks):
+    return [check.feed(chunk) for chunk in chunks]
+
+
+def test_regex_absent_fails_mid_stream():
+    """Test a forbidden pattern is final as soon as it is followed by more text."""
+    check = RegexAbsentIncremental({"pattern": r"\bpassword\b"})
+    assert _feed_all(check, ["the pass", "word", " is"]) == ["UNDECIDED", "UNDECIDED", "FAIL"]
+
+    # "foo$" matches the prefix "foo" but not "food"
+    anchored = RegexAbsentIncremental({"pattern": "foo$"})
+    assert _feed_all(anchored, ["foo", "d"]) == ["UNDECIDED", "UNDECIDED"]
+    assert anchored.finish() == "PASS"
+
+
+def test_token_budget_and_contains_any():
+    """Test an exceeded budget fails early and a found option passes early."""
+    budget = TokenBudgetIncremental({"max_out": 3})
+    assert _feed_all(budget, ["one two ", "three", " four"]) == ["UNDECIDED", "UNDECIDED", "FAIL"]
+
+    contains = ContainsAnyIncremental({"options": ["Yes"], "case_sensitive": False})
+    assert _feed_all(contains, ["ye", "s, indeed"]) == ["UNDECIDED", "PASS"]
+
+    missing = ContainsAnyIncremental({"options": ["maybe"]})
+    _feed_all(missing, ["no", "pe"])
+    assert missing.finish() == "FAIL"
+
+
+def test_json_valid_detects_unrecoverable_prefixes():
+    """Test bad starts, mismatched brackets and trailing data fail before the end."""
+    assert JsonValidIncremental({}).feed("Sure! {") == "FAIL"
+    assert _feed_all(JsonValidIncremental({}), ['{"a": [1, ', "2}"])[-1] == "FAIL"
+    assert _feed_all(JsonValidIncremental({}), ['{"a": "}"}', " x"])[-1] == "FAIL"
+
+    valid = JsonValidIncremental({})
+    assert _feed_all(valid, ['{"a": "[\\"', '"}', "  "]) == ["UNDECIDED"] * 3
+    assert valid.finish() == "PASS"
+
+
+def test_validator_builds_only_supported_incremental_checks():
+    """Test checks without an incremental form and excluded types are skipped."""
+    specs = [
+        {"type": "pc.check.json_valid"},
+        {"type": "pc.check.enum", "field": "$.a", "allowed": ["x"]},
+        {"type": "pc.check.regex_absent", "pattern": "secret"},
+    ]
+    validation = Validator().incremental(specs, exclude=("pc.check.json_valid",))
+    assert list(validation.verdicts()) == ["pc.check.regex_absent"]
+
+    assert validation.feed("a secret") is False
+    assert validation.feed("!") is True
+    assert validation.failure["type"] == "pc.check.regex_absent"
+    assert validation.failed_spec is specs[2]
+
+
+def test_consume_stream_closes_generator_on_stop():
+    """Test should_stop closes the adapter's stream so generation is cancelled."""
+    state = {"produced": 0, "closed": False}
+
+    def chunks():
+        try:
+            for i in range(100):
+                state["produced"] += 1
+                yield f"w{i} "
+        finally:
+            state["closed"] = True
+
+    validation = Validator().incremental([{"type": "pc.check.token_budget", "max_out": 5}])
+    text, timing = consume_stream(chunks(), validation.feed)
+
+    assert timing.aborted
+    assert state == {"produced": 6, "closed": True}
+    assert text.split() == [f"w{i}" for i in range(6)]
+
+
+class ChattyAdapter(AbstractAdapter):
+    """Streams a long answer that leaks a forbidden word early on."""
+
+    def __init__(self):
+        super().__init__("chatty", {})
+        self.chunks_sent = 0
+
+    def generate(self, prompt, schema=None):
+        return "".join(self._chunks()), 1
+
+    def _chunks(self):
+        yield json.dumps({"note": "the api_key is"})[:-2]
+        for _ in range(50):
+            yield " blah"
+        yield '"}'
+
+    def generate_stream(self, prompt, schema=None):
+        for chunk in self._chunks():
+            self.chunks_sent += 1
+            time.sleep(0.001)
+            yield chunk
+
+
+LEAK_CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.regex_absent", "pattern": "api_key"},
+]
+# No repair step, so incremental verdicts on the raw stream are final
+NO_REPAIR = {"enabled": False}
+
+
+def test_runner_aborts_generation_on_decisive_failure(make_artifacts, run_contract):
+    """Test a failing sample stops streaming and reports the aborting check."""
+    adapter = ChattyAdapter()
+    execution = {"early_abort": True, "repair_policy": NO_REPAIR}
+    results = run_contract(
+        make_artifacts(checks=LEAK_CHECKS, fixtures=1, execution=execution), adapter
+    )
+
+    fixture = results["targets"][0]["fixtures"][0]
+    assert adapter.chunks_sent == 1
+    assert fixture["status"] == "FAIL"
+    assert fixture["sampling_metadata"]["samples"][0]["aborted_by"] == "pc.check.regex_absent"
+    regex_result = fixture["checks"][1]
+    assert "generation aborted" in regex_result["message"]
+    assert fixture["checks"][0]["message"].startswith("Not evaluated")
+
+
+def test_runner_without_early_abort_reads_whole_stream(make_artifacts, run_contract):
+    """Test generation runs to completion unless early_abort is enabled."""
+    adapter = ChattyAdapter()
+    execution = {"early_abort": False, "repair_policy": NO_REPAIR}
+    results = run_contract(
+        make_artifacts(checks=LEAK_CHECKS, fixtures=1, execution=execution), adapter
+    )
+
+    assert adapter.chunks_sent == 0  # not streamed at all
+    assert results["targets"][0]["fixtures"][0]["checks"][0]["passed"]
+
+
+def test_invalid_regex_stays_undecided():
+    """Test an invalid pattern never aborts and is left to the final check."""
+    check = RegexAbsentIncremental({"pattern": "("})
+    assert _feed_all(check, ["abc", " def"]) == ["UNDECIDED", "UNDECIDED"]
+    assert check.finish() == "UNDECIDED"
+
+
+class PreambleAdapter(ChattyAdapter):
+    """Streams JSON behind a preamble that json_loose_parse strips."""
+
+    def _chunks(self):
+        yield "Sure! "
+        yield '{"a": 1}'
+
+
+def test_early_abort_keeps_verdicts_when_repair_can_rewrite_output(make_artifacts, run_contract):
+    """Test a streamed run with early abort matches a plain run under repair."""
+    checks = [
+        {"type": "pc.check.json_valid"},
+        {"type": "pc.check.regex_absent", "pattern": "Sure"},
+        {"type": "pc.check.token_budget", "max_out": 2},
+    ]
+    repair = {"enabled": True, "allowed": ["json_loose_parse"]}
+
+    def run(early_abort):
+        execution = {"early_abort": early_abort, "repair_policy": repair}
+        return run_contract(
+            make_artifacts(checks=checks, fixtures=1, execution=execution), PreambleAdapter()
+        )
+
+    streamed = run(early_abort=True)
+    plain = run(early_abort=False)
+
+    streamed_fixture = streamed["targets"][0]["fixtures"][0]
+    plain_fixture = plain["targets"][0]["fixtures"][0]
+    assert plain_fixture["status"] == "PASS"
+    assert streamed_fixture["status"] == plain_fixture["status"]
+    assert streamed_fixture["checks"] == plain_fixture["checks"]
+    assert "aborted_by" not in streamed_fixture["sampling_metadata"]["samples"][0]
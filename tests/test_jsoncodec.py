@@ -0,0 +1,98 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from promptcontracts.core.checks import json_valid_check
+from promptcontracts.utils import jsoncodec
+
+
+@pytest.fixture(params=jsoncodec.available_backends())
+def backend(request):
+    """Run a test once per installed backend, restoring the default afterwards."""
+    previous = jsoncodec.get_backend()
+    jsoncodec.set_backend(request.param)
+    yield request.param
+    jsoncodec.set_backend(previous)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": 1, "b": [true, null, 1.5e-3], "c": "\\u00e9"}',
+        '{"a": 1, "a": 2}',
+        "[NaN, Infinity, -Infinity]",
+        "123456789012345678901234567890",
+        '"\\ud800"',
+        '{"id": -9223372036854775809, "items": [' + "[1], " * 2000 + "[]]}",
+    ],
+)
+def test_loads_matches_stdlib(backend, text):
+    """Test decoded values equal json.loads, including inputs fast decoders reject."""
+    result = jsoncodec.loads(text)
+    expected = json.loads(text)
+    if isinstance(expected, list) and expected and isinstance(expected[0], float):
+        assert [str(v) for v in result] == [str(v) for v in expected]
+    else:
+        assert result == expected
+
+
+def test_loads_deep_nesting_raises_like_stdlib(backend):
+    """Test nesting too deep for json raises RecursionError instead of crashing."""
+    with pytest.raises(RecursionError):
+        jsoncodec.loads("[" * 200_000 + "]" * 200_000)
+
+
+@pytest.mark.parametrize("text", ['{"a": 1,}', "", "not json", '{"a": 1} extra', "[1, 2"])
+def test_decode_errors_match_stdlib(backend, text):
+    """Test decode errors and json_valid messages are those of json.loads."""
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    with pytest.raises(jsoncodec.JSONDecodeError) as actual:
+        jsoncodec.loads(text)
+    assert str(actual.value) == str(expected.value)
+    assert json_valid_check(text, {})[1] == f"Response is not valid JSON: {expected.value}"
+
+
+@dataclass
+class Point:
+    x: int
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"b": [1, 2.5, None], "a": {"nested": "é"}},
+        {"ratio": float("nan"), "limit": float("inf")},
+        {1: "int key", 2: (1, 2)},
+        [],
+    ],
+)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_dumps_round_trips_like_stdlib(backend, obj, indent):
+    """Test encoded text decodes to the same value json.dumps gives."""
+    text = jsoncodec.dumps(obj, indent=indent, sort_keys=True)
+    assert str(json.loads(text)) == str(json.loads(json.dumps(obj, sort_keys=True)))
+    if indent == 2:
+        assert text == json.dumps(obj, indent=2, sort_keys=True) or not text.isascii()
+
+
+def test_dumps_rejects_what_stdlib_rejects(backend):
+    """Test values json cannot encode raise TypeError rather than being encoded."""
+    with pytest.raises(TypeError):
+        jsoncodec.dumps({"point": Point(1)})
+
+
+def test_set_backend_validates_name():
+    """Test unknown backends are rejected and auto picks the first installed one."""
+    previous = jsoncodec.get_backend()
+    try:
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            jsoncodec.set_backend("simdjson")
+        assert jsoncodec.set_backend("auto") == jsoncodec.available_backends()[0]
+        assert jsoncodec.set_backend("json") == "json"
+        assert jsoncodec.loads("[1]") == [1]
+    finally:
+        jsoncodec.set_backend(previous)
@@ -0,0 +1,128 @@
+"""Tests for the output evaluation memo."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter
+from promptcontracts.core.memo import MemoEntry, OutputMemo, OutputMemoConfig
+from promptcontracts.core.runner import ContractRunner
+
+
+class CannedAdapter(AbstractAdapter):
+    """Adapter cycling through fixed outputs."""
+
+    def __init__(self, outputs):
+        super().__init__("test-model", {"temperature": 0})
+        self.outputs = outputs
+        self.calls = 0
+
+    def generate(self, prompt, schema=None):
+        output = self.outputs[self.calls % len(self.outputs)]
+        self.calls += 1
+        return output, 10
+
+
+def _entry(text):
+    return MemoEntry(text, None, {}, ({"type": "t", "passed": True, "message": "", "data": None},))
+
+
+def test_memo_lru_eviction_and_stats():
+    """Test the least recently used output is evicted and lookups are counted."""
+    memo = OutputMemo("fp", max_entries=2)
+    a, b, c = memo.key("a"), memo.key("b"), memo.key("c")
+    memo.put(a, _entry("a"))
+    memo.put(b, _entry("b"))
+    assert memo.get(a).output == "a"  # refresh a, so b is least recently used
+    memo.put(c, _entry("c"))
+
+    assert memo.get(b) is None
+    assert memo.get(c).output == "c"
+    assert memo.stats() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "entries": 2}
+
+
+def test_memo_key_depends_on_evaluation_fingerprint():
+    """Test the same output under different suites gets different keys."""
+    assert OutputMemo("fp1").key("x") == OutputMemo("fp1").key("x")
+    assert OutputMemo("fp1").key("x") != OutputMemo("fp2").key("x")
+    assert OutputMemo("fp1").key("x") != OutputMemo("fp1").key("y")
+
+
+def test_memo_config_validation():
+    """Test defaults and rejection of a negative size."""
+    assert OutputMemoConfig.from_dict(None) == OutputMemoConfig(False, 1024)
+    with pytest.raises(ValueError, match="max_entries"):
+        OutputMemoConfig.from_dict({"max_entries": -1})
+
+
+LABEL_CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["spam", "ham"]},
+]
+
+
+@pytest.fixture
+def memo_artifacts(make_artifacts):
+    """Factory for two fixtures of three samples each, memo on unless disabled."""
+
+    def build(enabled=True, checks=LABEL_CHECKS):
+        return make_artifacts(
+            checks=checks, fixtures=2, n_samples=3, execution={"output_memo": {"enabled": enabled}}
+        )
+
+    return build
+
+
+def test_evaluate_sample_serves_repeated_outputs_from_memo(memo_artifacts):
+    """Test identical outputs are parsed and checked once."""
+    runner = ContractRunner(*memo_artifacts())
+    fenced = '```json\n{"label": "spam"}\n```'
+
+    with patch.object(runner, "_validate_response", wraps=runner._validate_response) as validate:
+        first = runner._evaluate_sample(0, fenced, 10.0)
+        second = runner._evaluate_sample(1, fenced, 12.0)
+        invalid = runner._evaluate_sample(2, '{"label": "eggs"}', 11.0)
+
+    assert validate.call_count == 2
+    assert "memo_hit" not in second.metadata
+    assert second.output == first.output == '{"label": "spam"}'
+    assert second.repair_details == first.repair_details
+    assert second.check_results == first.check_results
+    assert second.check_results[0] is not first.check_results[0]
+    assert second.latency_ms == 12.0
+    assert invalid.checks_passed is False
+    assert runner.output_memo.stats()["hits"] == 1
+
+
+def test_runner_reports_memo_hit_rates_for_the_run_only(memo_artifacts, run_contract):
+    """Test hit rates appear in run extras and fixture results match a memo-less run."""
+    results = run_contract(memo_artifacts(), CannedAdapter(['{"label": "spam"}']))
+    plain = run_contract(memo_artifacts(enabled=False), CannedAdapter(['{"label": "spam"}']))
+
+    stats = results.pop("output_memo")
+    assert stats == {"hits": 5, "misses": 1, "hit_rate": 5 / 6, "entries": 1}
+    assert results == plain
+
+
+def test_runner_memo_disabled(memo_artifacts, use_adapter):
+    """Test output_memo.enabled=false evaluates every output and reports nothing."""
+    runner = ContractRunner(*memo_artifacts(enabled=False))
+    with use_adapter(CannedAdapter(['{"label": "spam"}'])):
+        results = runner.run()
+
+    assert runner.output_memo is None
+    assert "output_memo" not in results
+
+
+def test_memo_reruns_judge_checks(memo_artifacts):
+    """Test per-call judge checks are re-run for memoized outputs."""
+    judge = MagicMock()
+    judge.judge.side_effect = [{"verdict": v, "explanation": "ok"} for v in (True, False, True)]
+    checks = [{"type": "pc.check.json_valid"}, {"type": "pc.check.judge", "criteria": "polite"}]
+    runner = ContractRunner(*memo_artifacts(checks=checks), judge_adapter=judge)
+
+    samples = [runner._evaluate_sample(i, '{"label": "spam"}', 10.0) for i in range(3)]
+
+    assert judge.judge.call_count == 3
+    assert runner.output_memo.stats()["hits"] == 2
+    assert [s.check_results[1]["passed"] for s in samples] == [True, False, True]
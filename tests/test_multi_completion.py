@@ -0,0 +1,165 @@
+"""Tests for multi-completion N-sampling (several choices per request)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from promptcontracts.core.adapters import (
+    AbstractAdapter,
+    CachingAdapter,
+    OpenAIAdapter,
+    capture_call_info,
+)
+from promptcontracts.core.cache import ResponseCache
+from promptcontracts.core.runner import ContractRunner
+
+
+class ChatCompletionsStub(BaseHTTPRequestHandler):
+    """OpenAI-compatible /chat/completions returning ``n`` numbered choices."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        n = payload.get("n", 1)
+        self.server.requests.append(n)
+        body = json.dumps(
+            {
+                "id": "c1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": payload["model"],
+                # Out of order, as servers may return them
+                "choices": [
+                    {
+                        "index": i,
+                        "message": {"role": "assistant", "content": json.dumps({"choice": i})},
+                        "finish_reason": "stop",
+                    }
+                    for i in reversed(range(n))
+                ],
+                "usage": {
+                    "prompt_tokens": 20,
+                    "completion_tokens": 5 * n,
+                    "total_tokens": 20 + 5 * n,
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChatCompletionsStub)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1", server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_artifacts(stub, make_artifacts):
+    """Factory for two-fixture artefacts targeting the stub; n_samples defaults to 4."""
+    base_url, _ = stub
+
+    def build(n_samples=4, **overrides):
+        return make_artifacts(
+            targets=[{"type": "openai", "model": "stub", "base_url": base_url}],
+            fixtures=2,
+            n_samples=n_samples,
+            **overrides,
+        )
+
+    return build
+
+
+def test_runner_requests_all_samples_in_one_call(stub, stub_artifacts):
+    """Test N samples of a fixture come from one request with n choices."""
+    _, server = stub
+    results = ContractRunner(*stub_artifacts()).run()
+
+    assert server.requests == [4, 4]
+    for fixture in results["targets"][0]["fixtures"]:
+        metadata = fixture["sampling_metadata"]
+        assert metadata["n_samples"] == 4
+        assert [s["multi_completion"] for s in metadata["samples"]] == [4, 4, 4, 4]
+        assert len({s["latency_ms"] for s in metadata["samples"]}) == 1
+        assert fixture["status"] == "PASS"
+
+
+def test_generate_many_maps_choices_to_samples_in_index_order(stub, stub_artifacts):
+    """Test choice i goes to the i-th sample and usage is attributed to the first only."""
+    base_url, server = stub
+    runner = ContractRunner(*stub_artifacts())
+
+    results = runner._generate_many(OpenAIAdapter("stub", base_url=base_url), "p", None, [3, 5])
+
+    assert server.requests == [2]
+    assert {i: json.loads(text)["choice"] for i, (text, _, _) in results.items()} == {3: 0, 5: 1}
+    assert results[5][2]["multi_completion"] == {"choices": 2, "index": 1}
+    assert results[3][2]["usage_tokens"] == 30
+    assert "usage_tokens" not in results[5][2]
+
+
+def test_runner_samples_per_call_when_stopping_early(stub, stub_artifacts):
+    """Test early stopping keeps one request per drawn sample."""
+    _, server = stub
+    sampling = {"aggregation": "any", "early_stopping": True}
+    ContractRunner(*stub_artifacts(sampling=sampling)).run()
+
+    assert server.requests == [1, 1]
+
+
+def test_runner_single_sample_uses_plain_requests(stub, stub_artifacts):
+    """Test n=1 is not sent as a multi-completion request."""
+    _, server = stub
+    ContractRunner(*stub_artifacts(n_samples=1)).run()
+
+    assert server.requests == [1, 1]
+
+
+class CountingAdapter(AbstractAdapter):
+    """Adapter without multi-completion counting generate calls."""
+
+    def __init__(self):
+        super().__init__("plain", {})
+        self.calls = 0
+
+    def generate(self, prompt, schema=None):
+        self.calls += 1
+        return f"out{self.calls}", self.calls
+
+
+def test_default_generate_many_falls_back_to_generate():
+    """Test adapters without the capability generate each choice separately."""
+    adapter = CountingAdapter()
+    assert adapter.generate_many("p", 3) == [("out1", 1), ("out2", 2), ("out3", 3)]
+    assert adapter.capabilities().multi_completion is False
+
+
+def test_caching_adapter_generates_only_missing_choices(tmp_path):
+    """Test cached choices are served and only misses reach the wrapped adapter."""
+    inner = CountingAdapter()
+    cache = ResponseCache(str(tmp_path))
+    adapter = CachingAdapter(inner, cache, "plain")
+    adapter.generate("p", sample_index=1)
+
+    with capture_call_info() as info:
+        completions = adapter.generate_many("p", 3, sample_indices=[0, 1, 2])
+
+    assert [text for text, _ in completions] == ["out2", "out1", "out3"]
+    assert info["cache_hits"] == [False, True, False]
+    assert inner.calls == 3
+    cache.close()
@@ -1,15 +1,23 @@
 """Tests for parser module."""
 
+import json
+from unittest.mock import patch
+
 import pytest
 
+from promptcontracts.core.checks import json_valid_check
 from promptcontracts.core.parser import (
+    ParseContext,
     ParseError,
+    close_truncated_json,
     extract_json_field,
+    iter_json_candidates,
     json_loose,
     regex_extract,
     regex_extract_all,
     strip_markdown_fences,
 )
+from promptcontracts.utils import jsoncodec
 
 
 def test_json_loose_direct():
@@ -101,3 +109,144 @@ def test_strip_markdown_fences():
     text_plain = "plain text"
     result = strip_markdown_fences(text_plain)
     assert result == text_plain
+
+
+STEPS = ["strip_markdown_fences", "json_loose_parse"]
+
+
+@pytest.mark.parametrize(
+    "raw, text, parsed, steps",
+    [
+        ('{"a": 1}', '{"a": 1}', {"a": 1}, []),
+        ('```json\n{"a": 1}\n```', '{"a": 1}', {"a": 1}, ["strip_markdown_fences"]),
+        ('Sure: {"a": 1} done', '{"a": 1}', {"a": 1}, ["json_loose_parse"]),
+        ("no json here", "no json here", None, []),
+    ],
+)
+def test_parse_context_repairs(raw, text, parsed, steps):
+    """Test ParseContext applies the repair steps in order."""
+    context = ParseContext.from_output(raw, expects_json=True, repair_steps=STEPS)
+    assert (context.text, context.parsed) == (text, parsed)
+    assert context.repair_details["steps_applied"] == steps
+    assert context.text_is_json == (parsed is not None)
+
+
+def test_parse_context_decodes_each_candidate_once():
+    """Test parse + json_valid decode a fenced output once, not three times."""
+    raw = "```json\n" + json.dumps({"items": list(range(100))}) + "\n```"
+    real_loads = jsoncodec.loads
+
+    with patch.object(jsoncodec, "loads", side_effect=real_loads) as loads:
+        context = ParseContext.from_output(raw, expects_json=True, repair_steps=STEPS)
+        passed, _, data = json_valid_check(context.text, {}, parse_context=context)
+
+    # One failed attempt on the raw text, one successful decode of the stripped text
+    assert loads.call_count == 2
+    assert passed and data is context.parsed
+
+
+def test_json_valid_reuses_context_error_message():
+    """Test a context's decode error gives the same json_valid message."""
+    context = ParseContext.from_output("not json", expects_json=True)
+    assert json_valid_check("not json", {}, parse_context=context) == json_valid_check(
+        "not json", {}
+    )
+    # Text without a decode attempt (plain-text PD) is parsed by the check itself
+    plain = ParseContext.from_output("[1]")
+    assert json_valid_check("[1]", {}, parse_context=plain) == (True, "Response is valid JSON", [1])
+
+
+def test_iter_json_candidates_ignores_brackets_in_strings():
+    """Test brackets inside string literals do not end a candidate."""
+    text = 'Result: {"a": "}", "b": "[x"} ok'
+    assert [text[s:e] for s, e in iter_json_candidates(text)] == ['{"a": "}", "b": "[x"}']
+    assert json_loose(text) == {"a": "}", "b": "[x"}
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # First candidate is not JSON
+        ('see {x} then {"a": 1}', {"a": 1}),
+        # Objects are preferred over earlier arrays
+        ('steps [1] and {"d": 4}', {"d": 4}),
+        # Mismatched bracket: later blocks are still found
+        ('{ broken [ } then {"b": 2}', {"b": 2}),
+        # Unclosed block: complete inner blocks are candidates
+        ('{ unterminated {"c": 3} and [4]', {"c": 3}),
+        ("only [1, 2] here", [1, 2]),
+    ],
+)
+def test_json_loose_multiple_candidates(text, expected):
+    """Test every balanced candidate is tried until one parses."""
+    assert json_loose(text) == expected
+
+
+def test_json_loose_bounded_on_pathological_input():
+    """Test unbalanced and deeply nested megabyte inputs fail fast with ParseError."""
+    for text in ["x {" + "{" * 1_000_000, "x " + "[" * 200_000 + "]" * 200_000]:
+        with pytest.raises(ParseError):
+            json_loose(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # Open string value is closed
+        ('{"items": [1, 2], "note": "cut of', '{"items": [1, 2], "note": "cut of"}'),
+        # Cut-off escape sequences are dropped
+        ('{"k": "x\\u00', '{"k": "x"}'),
+        ('{"k": "v\\', '{"k": "v"}'),
+        # Incomplete trailing members are dropped
+        ('{"a": 1, "b": tr', '{"a": 1}'),
+        ('{"a": 1, "b": 12', '{"a": 1}'),
+        ('{"a": {"b": [1, 2,', '{"a": {"b": [1, 2]}}'),
+        ('{"a": 1, "long key', '{"a": 1}'),
+        # Prose and an unclosed fence before the document
+        ('Sure:\n```json\n[{"x": null}, {"y"', '[{"x": null}]'),
+        ('{"a"', "{}"),
+        # Complete, invalid or absent documents are left alone
+        ('{"a": 1} and more', None),
+        ('{"a": [1}', None),
+        ('{"a": 1 "b"', None),
+        ("no json", None),
+    ],
+)
+def test_close_truncated_json(text, expected):
+    """Test truncated documents are completed and everything else is rejected."""
+    assert close_truncated_json(text) == expected
+    if expected is not None:
+        json.loads(expected)
+
+
+def test_parse_context_closes_truncated_json_before_loose_parse():
+    """Test close_truncated_json is opt-in, recorded, and preferred over inner blocks."""
+    raw = '{"meta": {"id": 7}, "summary": "The report was cut'
+
+    loose = ParseContext.from_output(raw, expects_json=True, repair_steps=STEPS)
+    assert loose.parsed == {"id": 7}
+
+    context = ParseContext.from_output(
+        raw, expects_json=True, repair_steps=["close_truncated_json"] + STEPS
+    )
+    assert context.parsed == {"meta": {"id": 7}, "summary": "The report was cut"}
+    assert context.repair_details == {
+        "steps_applied": ["close_truncated_json"],
+        "truncation": {"dropped_chars": 0, "appended": '"}'},
+    }
+
+
+def test_parse_context_keeps_fence_stripping_when_closing_fails():
+    """Test a failed closing attempt leaves the stripped text and its error in place."""
+    raw = '```json\n{"summary": "cut\n```'
+
+    context = ParseContext.from_output(
+        raw, expects_json=True, repair_steps=["strip_markdown_fences", "close_truncated_json"]
+    )
+
+    assert context.text == '{"summary": "cut'
+    assert context.repair_details == {"steps_applied": ["strip_markdown_fences"]}
+    assert not context.text_is_json
+    with pytest.raises(json.JSONDecodeError) as error:
+        json.loads(context.text)
+    assert context.text_error == str(error.value)
@@ -0,0 +1,170 @@
+"""Tests for prefix-cache-friendly prompt layout, fixture ordering and cached-token capture."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from promptcontracts.core.adapters import AbstractAdapter
+from promptcontracts.core.runner import ContractRunner
+
+
+class UsageStub(BaseHTTPRequestHandler):
+    """OpenAI /chat/completions and Ollama /api/generate reporting prefix reuse."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        # The first request of the run fills the cache; later ones hit it
+        cached = 1024 if self.server.requests else 0
+        self.server.requests.append(payload)
+        if self.path.endswith("/chat/completions"):
+            body = {
+                "id": "c1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": payload["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": '{"ok": true}'},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 1100,
+                    "completion_tokens": 4,
+                    "total_tokens": 1104,
+                    "prompt_tokens_details": {"cached_tokens": cached},
+                },
+            }
+        else:
+            body = {
+                "response": '{"ok": true}',
+                "done": True,
+                "eval_count": 4,
+                "prompt_eval_count": 1100 - cached,
+                "prompt_eval_duration": 2_000_000 if cached else 90_000_000,
+            }
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UsageStub)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", server
+    server.shutdown()
+    server.server_close()
+
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.json_required", "fields": ["ok"]},
+]
+# EP order differs from prompt order
+FIXTURES = [{"id": f, "input": f"claim {f}"} for f in ("b", "a", "c")]
+
+
+@pytest.fixture
+def claim_artifacts(make_artifacts):
+    """Factory for assist-mode artefacts; keyword arguments are execution settings."""
+
+    def build(target=None, **execution):
+        return make_artifacts(
+            prompt="Check the claim.",
+            checks=CHECKS,
+            targets=[target or {"type": "ollama", "model": "m"}],
+            fixtures=FIXTURES,
+            mode="assist",
+            execution=execution,
+        )
+
+    return build
+
+
+class RecordingAdapter(AbstractAdapter):
+    """Adapter recording the prompts it receives."""
+
+    def __init__(self):
+        super().__init__("recorder", {})
+        self.prompts = []
+
+    def generate(self, prompt, schema=None):
+        self.prompts.append(prompt)
+        return '{"ok": true}', 1
+
+
+def test_static_first_layout_shares_prompt_prefix(claim_artifacts):
+    """Test static_first puts the constraints before the fixture input."""
+    default = ContractRunner(*claim_artifacts())
+    static = ContractRunner(*claim_artifacts(prompt_layout="static_first"))
+    fixture = {"input": "claim a"}
+
+    prompt = default._build_prompt(fixture, "assist")
+    assert prompt.index("[USER INPUT]") < prompt.index("[CONSTRAINTS]")
+    prompt = static._build_prompt(fixture, "assist")
+    assert prompt.index("[CONSTRAINTS]") < prompt.index("[USER INPUT]")
+    assert prompt.endswith("[USER INPUT]\nclaim a")
+    assert static._build_prompt(fixture, "observe") == default._build_prompt(fixture, "observe")
+
+
+def test_shared_prefix_order_schedules_sorted_prompts_and_keeps_results_in_ep_order(
+    claim_artifacts, run_contract
+):
+    """Test fixtures are generated in prompt order but reported in EP order."""
+    adapter = RecordingAdapter()
+    artifacts = claim_artifacts(prompt_layout="static_first", fixture_order="shared_prefix")
+    results = run_contract(artifacts, adapter)
+
+    assert [p.rsplit("\n", 1)[1] for p in adapter.prompts] == ["claim a", "claim b", "claim c"]
+    assert [f["fixture_id"] for f in results["targets"][0]["fixtures"]] == ["b", "a", "c"]
+
+
+def test_unknown_layout_rejected(claim_artifacts):
+    """Test invalid layout and order values are rejected."""
+    with pytest.raises(ValueError, match="prompt_layout"):
+        ContractRunner(*claim_artifacts(prompt_layout="x"))
+    with pytest.raises(ValueError, match="fixture_order"):
+        ContractRunner(*claim_artifacts(fixture_order="x"))
+
+
+def test_openai_cached_tokens_summarized_per_target(stub, claim_artifacts):
+    """Test cached prompt tokens from OpenAI usage reach samples and the target summary."""
+    url, server = stub
+    target = {"type": "openai", "model": "stub", "base_url": f"{url}/v1"}
+    results = ContractRunner(*claim_artifacts(target)).run()
+
+    target_result = results["targets"][0]
+    samples = [f["sampling_metadata"]["samples"][0] for f in target_result["fixtures"]]
+    assert sorted(s["prompt_cache"]["cached_tokens"] for s in samples) == [0, 1024, 1024]
+    prompt_cache = target_result["summary"]["prompt_cache"]
+    assert prompt_cache["prompt_tokens"] == 3300
+    assert prompt_cache["cached_tokens"] == 2048
+    assert prompt_cache["requests_with_cache_hit"] == 2
+    assert set(prompt_cache["mean_latency_ms"]) == {"cached", "uncached"}
+
+
+def test_ollama_prompt_eval_timing_summarized_per_target(stub, claim_artifacts):
+    """Test Ollama prompt evaluation counts and timing are captured."""
+    url, server = stub
+    target = {"type": "ollama", "model": "stub", "base_url": url}
+    results = ContractRunner(*claim_artifacts(target)).run()
+
+    prompt_cache = results["targets"][0]["summary"]["prompt_cache"]
+    assert prompt_cache["prompt_eval_tokens"] == 1100 + 76 + 76
+    assert prompt_cache["mean_prompt_eval_ms"] == pytest.approx((90 + 2 + 2) / 3)
+    assert "cached_tokens" not in prompt_cache
@@ -0,0 +1,183 @@
+"""Tests for per-target rate limiting."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter, record_call_info
+from promptcontracts.core.ratelimit import (
+    RateLimitConfig,
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    parse_duration,
+    parse_rate_limit_headers,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class HeaderAdapter(AbstractAdapter):
+    """Adapter reporting rate limit headers and tracking concurrency."""
+
+    def __init__(self, rate_limit=None, delay=0.0):
+        super().__init__("paced-model", {})
+        self.rate_limit = rate_limit or {}
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, schema=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        record_call_info(rate_limit=self.rate_limit, usage_tokens=5)
+        return json.dumps({"ok": True}), 5
+
+
+class TooManyRequests(Exception):
+    status_code = 429
+
+
+@pytest.fixture
+def paced_artifacts(make_artifacts):
+    """Factory for artefacts with one rate-limited target."""
+
+    def build(n_fixtures, rate_limit, concurrency=8):
+        return make_artifacts(
+            targets=[{"type": "ollama", "model": "paced-model", "rate_limit": rate_limit}],
+            fixtures=n_fixtures,
+            execution={"concurrency": {"global": concurrency}},
+        )
+
+    return build
+
+
+def test_token_bucket_refills_and_allows_debt():
+    """Test the bucket holds one second of quota and lets oversized takes borrow."""
+    clock = FakeClock()
+    bucket = TokenBucket(600, clock)  # 10/s
+    assert bucket.capacity == 10
+
+    bucket.take(10)
+    assert bucket.wait_time(1) == pytest.approx(0.1)
+    clock.now = 0.5
+    assert bucket.wait_time(5) == 0
+
+    bucket.take(50)  # larger than capacity once the bucket is full enough
+    assert bucket.level == pytest.approx(-45)
+    assert bucket.wait_time(1) == pytest.approx(4.6)
+
+
+def test_parse_rate_limit_headers():
+    """Test OpenAI-style headers and durations are understood."""
+    state = parse_rate_limit_headers(
+        {
+            "X-RateLimit-Limit-Requests": "500",
+            "x-ratelimit-remaining-tokens": "1200",
+            "x-ratelimit-reset-requests": "6m0s",
+            "x-ratelimit-reset-tokens": "20ms",
+            "Retry-After": "2",
+        }
+    )
+    assert state == {
+        "limit_requests": 500.0,
+        "remaining_tokens": 1200.0,
+        "reset_requests_s": 360.0,
+        "reset_tokens_s": 0.02,
+        "retry_after_s": 2.0,
+    }
+    assert parse_duration("1h2m3.5s") == pytest.approx(3723.5)
+    assert parse_duration("soon") is None
+
+
+def test_config_validation_and_token_estimate():
+    """Test invalid limits are rejected and estimates include max_tokens."""
+    with pytest.raises(ValueError):
+        RateLimitConfig.from_dict({"requests_per_minute": 0})
+    assert estimate_tokens("x" * 400, 100) == 201
+
+
+def test_runner_paces_requests_per_minute(paced_artifacts, run_contract):
+    """Test calls beyond the one-second burst wait for the bucket to refill."""
+    adapter = HeaderAdapter()
+    started = time.perf_counter()
+    results = run_contract(paced_artifacts(30, {"requests_per_minute": 1200}), adapter)
+    elapsed = time.perf_counter() - started
+
+    stats = results["targets"][0]["execution"]["rate_limit"]
+    assert elapsed >= 0.45
+    assert stats["admitted"] == 30
+    assert stats["throttled"] >= 10
+
+
+def test_runner_bounds_in_flight_per_target(paced_artifacts, run_contract):
+    """Test max_in_flight caps concurrency below the global limit."""
+    adapter = HeaderAdapter(delay=0.01)
+    run_contract(paced_artifacts(12, {"max_in_flight": 2}), adapter)
+
+    assert adapter.peak == 2
+
+
+def test_limits_learned_from_headers(paced_artifacts, run_contract):
+    """Test an empty rate_limit block learns limits from response headers."""
+    adapter = HeaderAdapter(rate_limit={"limit_requests": 6000.0, "remaining_requests": 99.0})
+    results = run_contract(paced_artifacts(3, {}, concurrency=1), adapter)
+
+    stats = results["targets"][0]["execution"]["rate_limit"]
+    assert stats["learned"] == {"requests_per_minute": 6000.0}
+
+
+def test_exhausted_remaining_pauses_until_reset():
+    """Test remaining=0 with a reset time holds further admissions."""
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=600), clock)
+
+    async def scenario():
+        async with limiter.admit(10) as admission:
+            admission.report({"rate_limit": {"remaining_requests": 0, "reset_requests_s": 2.0}})
+
+    asyncio.run(scenario())
+    assert limiter._wait_time(1) == pytest.approx(2.0)
+
+
+def test_429_pauses_admissions():
+    """Test a 429 from the provider pauses the target and is counted."""
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(), clock)
+
+    async def scenario():
+        async with limiter.admit(10):
+            raise TooManyRequests()
+
+    with pytest.raises(TooManyRequests):
+        asyncio.run(scenario())
+
+    assert limiter.rate_limited == 1
+    assert limiter._wait_time(1) == pytest.approx(1.0)
+
+
+def test_cache_hits_refund_quota():
+    """Test calls served from the cache do not consume provider quota."""
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=60, tokens_per_minute=6000), clock)
+
+    async def scenario():
+        async with limiter.admit(50) as admission:
+            admission.report({"cache_hit": True})
+
+    asyncio.run(scenario())
+    assert limiter._wait_time(100) == 0
@@ -117,6 +117,28 @@ class TestAnalyzeRepairEvents:
         assert stats["semantic_change_count"] == 2
         assert stats["semantic_change_rate"] == 0.5
 
+    def test_truncation_repairs_counted_separately(self):
+        """Test close_truncated_json events are reported apart from other repairs."""
+        events = [
+            RepairEvent("strip_markdown_fences", "b1", "a1", [], False),
+            RepairEvent("close_truncated_json", '{"a": "x', '{"a": "x"}', [], False),
+        ]
+        stats = analyze_repair_events(events)
+        assert stats["truncation_repairs"] == 1
+        assert stats["truncation_repair_rate"] == 0.5
+
+    def test_truncation_success_excluded_from_deltas(self):
+        """Test truncation-salvaged passes do not raise the full-repair delta."""
+        report = generate_repair_sensitivity_report(
+            {"validation_success": 0.80},
+            {"validation_success": 0.90},
+            {"validation_success": 0.95, "truncation_success": 0.05},
+        )
+        assert report["validation_success"]["full"] == 0.95
+        assert report["truncation_success"] == 0.05
+        assert report["delta_full"] == pytest.approx(0.10)
+        assert report["delta_syn_to_full"] == pytest.approx(0.0)
+
 
 class TestRepairSensitivityReport:
     def test_repair_improves_validation(self):
@@ -7,8 +7,12 @@ Compares results with repair enabled vs disabled to assess:
 - Task accuracy impact (if gold labels present)
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from promptcontracts.core.adapters.base import Capability
+from promptcontracts.core.metrics import compute_metrics
 from promptcontracts.core.runner import ContractRunner
 from promptcontracts.utils.normalization import strip_code_fences
 
@@ -278,3 +282,56 @@ class TestRepairStatisticalComparison:
         task_names = [x[0] for x in ranked]
         assert "classification" in task_names
         assert "summarization" in task_names
+
+
+def test_truncated_output_salvaged_and_counted_separately():
+    """Test close_truncated_json completes cut-off JSON and is reported on its own."""
+    pd = {"pcsl": "0.3.0", "io": {"expects": "structured/json"}, "prompt": "Classify."}
+    es = {
+        "pcsl": "0.3.0",
+        "checks": [
+            {"type": "pc.check.json_required", "fields": ["label"]},
+            {"type": "pc.check.enum", "field": "$.label", "allowed": ["spam", "ham"]},
+        ],
+    }
+    ep = {
+        "pcsl": "0.3.0",
+        "targets": [{"type": "ollama", "model": "stub"}],
+        "fixtures": [{"id": "cut", "input": "a"}, {"id": "too-short", "input": "b"}],
+        "execution": {
+            "mode": "observe",
+            "repair_policy": {
+                "enabled": True,
+                "allowed": ["strip_markdown_fences", "close_truncated_json", "json_loose_parse"],
+            },
+        },
+        "sampling": {"n": 1, "bootstrap_samples": 0},
+    }
+
+    adapter = MagicMock()
+    adapter.capabilities.return_value = Capability()
+    # Cut off after the label (salvageable) and before it (still fails json_required)
+    adapter.generate.side_effect = lambda prompt, schema=None: (
+        ('{"label": "spam", "reason": "Contains a prize cl', 1)
+        if prompt.endswith("a")
+        else ('{"reason": "Contains a pri', 1)
+    )
+
+    with patch.object(ContractRunner, "_create_adapter", return_value=adapter):
+        results = ContractRunner(pd, es, ep).run()
+
+    target = results["targets"][0]
+    cut, short = target["fixtures"]
+    assert (cut["status"], short["status"]) == ("PASS", "FAIL")
+    assert cut["repair_ledger"][0]["steps_applied"] == ["close_truncated_json"]
+    assert cut["repair_ledger"][0]["truncation"] == {"dropped_chars": 0, "appended": '"}'}
+    assert target["summary"]["repairs"] == {
+        "by_step": {"close_truncated_json": 2},
+        "truncation_repaired_passes": 1,
+    }
+
+    metrics = compute_metrics(results)
+    assert metrics.truncation_repaired_fixtures == 2
+    assert metrics.validation_success == 0.5
+    assert metrics.validation_success_excluding_truncation == 0.0
+    assert metrics.repair_rate == 0.0
@@ -128,3 +128,134 @@ def test_sample_n():
     result = sampler.sample_n(generator)
     assert counter[0] == 3
     assert len(result.samples) == 3
+
+
+def _generator(outcomes, calls):
+    """Build a sample generator that records which sample ids were drawn."""
+
+    def generate(sample_id):
+        calls.append(sample_id)
+        return SampleResult(sample_id, f"out{sample_id}", None, 10.0, outcomes[sample_id], [])
+
+    return generate
+
+
+def test_early_stopping_any_stops_at_first_pass():
+    """Test any-policy stops once a sample passes."""
+    calls = []
+    sampler = create_sampler(n=10, aggregation="any", bootstrap_samples=0, early_stopping=True)
+    result = sampler.sample_n(_generator([False, True] + [False] * 8, calls))
+
+    assert calls == [0, 1]
+    assert result.all_passed is True
+    meta = result.aggregation_metadata["early_stopping"]
+    assert meta["stopped_early"] is True
+    assert meta["samples_saved"] == 8
+
+
+def test_early_stopping_all_stops_at_first_failure():
+    """Test all-policy stops once a sample fails."""
+    calls = []
+    sampler = create_sampler(n=10, aggregation="all", bootstrap_samples=0, early_stopping=True)
+    result = sampler.sample_n(_generator([True, True, False] + [True] * 7, calls))
+
+    assert calls == [0, 1, 2]
+    assert result.all_passed is False
+
+
+def test_early_stopping_majority():
+    """Test majority-policy stops once more than n/2 samples agree."""
+    calls = []
+    sampler = create_sampler(n=5, aggregation="majority", bootstrap_samples=0, early_stopping=True)
+    result = sampler.sample_n(_generator([True] * 5, calls))
+    assert calls == [0, 1, 2]
+    assert result.all_passed is True
+
+    calls = []
+    result = sampler.sample_n(_generator([False, True, False, False, True], calls))
+    assert calls == [0, 1, 2, 3]
+    assert result.all_passed is False
+
+
+def test_early_stopping_disabled_draws_all():
+    """Test samplers without stopping rules draw all n samples."""
+    calls = []
+    sampler = create_sampler(n=4, aggregation="any", bootstrap_samples=0)
+    result = sampler.sample_n(_generator([True] * 4, calls))
+
+    assert calls == [0, 1, 2, 3]
+    assert "early_stopping" not in result.aggregation_metadata
+
+
+def test_ci_stopping_wilson():
+    """Test CI-based stopping once the interval clears the threshold."""
+    calls = []
+    sampler = create_sampler(
+        n=50, aggregation="majority", bootstrap_samples=0, ci_stop_threshold=0.5
+    )
+    result = sampler.sample_n(_generator([True] * 50, calls))
+
+    assert len(calls) < 50
+    assert result.aggregation_metadata["early_stopping"]["reason"].startswith("ci:wilson")
+
+
+def test_async_early_stopping_cancels_pending():
+    """Test asample_n cancels samples still pending when the outcome is settled."""
+    import asyncio
+
+    started = []
+
+    async def generate(sample_id):
+        started.append(sample_id)
+        await asyncio.sleep(0.01 if sample_id == 0 else 1.0)
+        return SampleResult(sample_id, "out", None, 10.0, True, [])
+
+    sampler = create_sampler(n=5, aggregation="any", bootstrap_samples=0, early_stopping=True)
+    result = asyncio.run(asyncio.wait_for(sampler.asample_n(generate), timeout=0.5))
+
+    assert [s.sample_id for s in result.samples] == [0]
+    assert result.aggregation_metadata["early_stopping"]["samples_saved"] == 4
+
+
+def test_collapse_synthesizes_samples_after_identical_probe():
+    """Test identical probe outputs stand in for the remaining samples."""
+    calls = []
+    sampler = create_sampler(n=10, bootstrap_samples=0, collapse_probe=2)
+
+    def generate(sample_id):
+        calls.append(sample_id)
+        return SampleResult(sample_id, "same", None, 10.0, True, [{"passed": True}], {}, "same")
+
+    result = sampler.sample_n(generate)
+
+    assert calls == [0, 1]
+    assert [s.sample_id for s in result.samples] == list(range(10))
+    assert result.samples[5].metadata == {"collapsed_from": 0}
+    assert result.samples[5].check_results is not result.samples[0].check_results
+    assert result.aggregation_metadata["collapse"] == {
+        "collapsed": True,
+        "probe_samples": 2,
+        "samples_synthesized": 8,
+    }
+
+
+def test_collapse_falls_back_to_full_sampling_on_divergence():
+    """Test diverging probe outputs draw all samples without repeating the probe."""
+    import asyncio
+
+    calls = []
+
+    async def generate(sample_id):
+        calls.append(sample_id)
+        return SampleResult(sample_id, f"out{sample_id}", None, 10.0, True, [])
+
+    sampler = create_sampler(n=5, bootstrap_samples=0, collapse_probe=2)
+    result = asyncio.run(sampler.asample_n(generate))
+
+    assert sorted(calls) == [0, 1, 2, 3, 4]
+    assert len(result.samples) == 5
+    assert result.aggregation_metadata["collapse"] == {
+        "collapsed": False,
+        "probe_samples": 2,
+        "reason": "probe outputs diverged",
+    }
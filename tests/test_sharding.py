@@ -0,0 +1,157 @@
+"""Tests for fixture sharding and merging shard results."""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from promptcontracts.cli import main
+from promptcontracts.core.adapters.base import AbstractAdapter
+from promptcontracts.core.sharding import ShardSpec, merge_shard_results, shard_of
+
+
+class VaryingAdapter(AbstractAdapter):
+    """Adapter whose latency and answer depend on the fixture input."""
+
+    def __init__(self):
+        super().__init__("varying-model", {})
+
+    def generate(self, prompt, schema=None):
+        number = int(prompt.rsplit(" ", 1)[-1])
+        label = "ok" if number % 4 else "bad"
+        return json.dumps({"label": label}), 10 * (number + 1)
+
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["ok"]},
+    {"type": "pc.check.latency_budget", "p95_ms": 185},
+]
+TARGETS = [
+    {"type": "ollama", "model": "varying-model"},
+    {"type": "openai", "model": "varying-model"},
+]
+
+
+@pytest.fixture
+def run_shard(run_contract):
+    def run(artifacts, **kwargs):
+        # Shard results travel as JSON reports
+        return json.loads(json.dumps(run_contract(artifacts, VaryingAdapter(), **kwargs)))
+
+    return run
+
+
+def test_shard_spec_parse():
+    """Test i/N parsing and validation."""
+    assert ShardSpec.parse("3/16") == ShardSpec(3, 16)
+    for bad in ("0/4", "5/4", "1", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            ShardSpec.parse(bad)
+
+
+def test_shard_assignment_is_stable_partition():
+    """Test every fixture lands in exactly one shard, deterministically."""
+    ids = [f"fixture-{i}" for i in range(200)]
+    shards = [ShardSpec(i, 4) for i in range(1, 5)]
+
+    owners = [[s.index for s in shards if s.owns(fid)] for fid in ids]
+    assert all(len(o) == 1 for o in owners)
+    assert shard_of("fixture-7", 4) == shard_of("fixture-7", 4)
+    assert len({o[0] for o in owners}) == 4
+
+
+def test_merged_shards_equal_single_run(make_artifacts, run_shard):
+    """Test merging all shards reproduces an unsharded run exactly."""
+    artifacts = make_artifacts(checks=CHECKS, targets=TARGETS, fixtures=20)
+    single = run_shard(artifacts)
+
+    shard_results = [run_shard(artifacts, shard=ShardSpec(i, 3)) for i in range(1, 4)]
+    assert sum(len(r["targets"][0]["fixtures"]) for r in shard_results) == 20
+
+    merged = merge_shard_results(list(reversed(shard_results)), artifacts[1])
+
+    assert merged == single
+    # json_valid x20, enum x15, and p95 over the union of latencies exceeds the budget
+    assert merged["targets"][0]["summary"]["passed_checks"] == 20 + 15
+
+
+def test_merged_run_extras_match_single_run(tmp_path, make_artifacts, run_shard):
+    """Test run extras and target execution stats are combined over all shards."""
+    targets = [
+        {**target, "rate_limit": {"requests_per_minute": 60000, "max_in_flight": 4}}
+        for target in TARGETS
+    ]
+
+    def run_all(name, execution):
+        def run(cache_dir, **kwargs):
+            cache = {"enabled": True, "dir": str(tmp_path / name / cache_dir)}
+            artifacts = make_artifacts(
+                checks=CHECKS,
+                targets=targets,
+                fixtures=20,
+                execution={**execution, "cache": cache},
+            )
+            return run_shard(artifacts, **kwargs)
+
+        shard_results = [run(f"shard{i}", shard=ShardSpec(i, 3)) for i in range(1, 4)]
+        return run("single"), merge_shard_results(shard_results, {"checks": CHECKS})
+
+    single, merged = run_all("short_circuit", {"short_circuit": True})
+    for key in ("hits", "misses", "writes", "size_bytes"):
+        assert merged["cache"][key] == single["cache"][key]
+    assert merged["checks"].keys() == single["checks"].keys()
+    # Which check is skipped depends on the costs each process learned
+    for stats in (*single["checks"].values(), *merged["checks"].values()):
+        assert stats["runs"] + stats["skipped"] == 40
+    for merged_target, single_target in zip(merged["targets"], single["targets"], strict=True):
+        merged_limit = merged_target["execution"]["rate_limit"]
+        single_limit = single_target["execution"]["rate_limit"]
+        assert merged_limit["admitted"] == single_limit["admitted"] == 20
+        assert merged_limit["requests_per_minute"] == 60000
+        assert merged_limit["max_in_flight"] == 4
+
+    # Memo hits depend on which outputs share a process, lookups do not
+    single, merged = run_all("memo", {"output_memo": {"enabled": True}})
+    lookups = [
+        extras["output_memo"]["hits"] + extras["output_memo"]["misses"]
+        for extras in (single, merged)
+    ]
+    assert lookups == [40, 40]
+    memo = merged["output_memo"]
+    assert memo["hit_rate"] == memo["hits"] / 40
+
+
+def test_merge_rejects_incomplete_shards(make_artifacts, run_shard):
+    """Test merging requires each shard exactly once."""
+    artifacts = make_artifacts(checks=CHECKS, targets=TARGETS, fixtures=4)
+    shard_results = [run_shard(artifacts, shard=ShardSpec(i, 3)) for i in (1, 3)]
+
+    with pytest.raises(ValueError, match="missing \\[2\\]"):
+        merge_shard_results(shard_results, artifacts[1])
+
+    with pytest.raises(ValueError, match="not from a sharded run"):
+        merge_shard_results([run_shard(artifacts)], artifacts[1])
+
+
+def test_merge_command_writes_junit(tmp_path, make_artifacts, run_shard):
+    """Test the merge CLI command combines JSON shard reports."""
+    artifacts = make_artifacts(checks=CHECKS, targets=TARGETS, fixtures=6)
+    es_path = tmp_path / "es.json"
+    es_path.write_text(json.dumps(artifacts[1]))
+
+    shard_paths = []
+    for i in (1, 2):
+        path = tmp_path / f"shard-{i}.json"
+        path.write_text(json.dumps(run_shard(artifacts, shard=ShardSpec(i, 2))))
+        shard_paths.append(str(path))
+
+    out = tmp_path / "junit.xml"
+    argv = ["prompt-contracts", "merge", "--es", str(es_path), *shard_paths]
+    argv += ["--report", "junit", "--out", str(out)]
+    with patch.object(sys, "argv", argv), pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 1  # "bad" labels fail the enum check
+    assert out.read_text().count("<testcase") == 2 * 6 * 2
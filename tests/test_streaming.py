@@ -0,0 +1,138 @@
+"""Tests for the streaming results API."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter
+from promptcontracts.core.results import ResultCollector, RunEvent, TargetSummary
+from promptcontracts.core.runner import ContractRunner
+
+
+class ReverseDelayAdapter(AbstractAdapter):
+    """Adapter whose later fixtures finish first; fails inputs containing 'bad'."""
+
+    def __init__(self):
+        super().__init__("stream-model", {})
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def generate(self, prompt, schema=None):
+        index = int(prompt.rsplit(" ", 1)[-1])
+        time.sleep(0.01 * (5 - index))
+        with self._lock:
+            self.calls += 1
+        return ("not json" if index == 2 else '{"ok": true}'), 100 + index
+
+
+@pytest.fixture
+def stream_artifacts(make_artifacts):
+    """Factory for five-fixture artefacts run with the given global concurrency."""
+
+    def build(concurrency=5):
+        return make_artifacts(
+            checks=[
+                {"type": "pc.check.json_valid"},
+                {"type": "pc.check.latency_budget", "p95_ms": 500},
+            ],
+            targets=[{"type": "ollama", "model": "stream-model"}],
+            fixtures=5,
+            execution={"concurrency": {"global": concurrency}},
+        )
+
+    return build
+
+
+def test_iter_results_streams_fixtures_then_target(stream_artifacts, use_adapter):
+    """Test fixture events arrive before the target event and run event comes last."""
+    with use_adapter(ReverseDelayAdapter()):
+        events = list(ContractRunner(*stream_artifacts()).iter_results())
+
+    kinds = [e.kind for e in events]
+    assert kinds == ["fixture"] * 5 + ["target", "run"]
+    # Completion order, not EP order
+    assert [e.fixture_index for e in events[:5]] != [0, 1, 2, 3, 4]
+    assert events[5].payload["fixtures"] == []
+    assert events[5].payload["summary"]["fixture_statuses"]["FAIL"] == 1
+
+
+def test_hooks_fire_per_fixture_and_target(stream_artifacts, use_adapter):
+    """Test callback hooks observe every fixture and target."""
+    seen_fixtures = []
+    seen_targets = []
+    runner = ContractRunner(
+        *stream_artifacts(),
+        on_fixture_complete=lambda target_id, f: seen_fixtures.append((target_id, f["fixture_id"])),
+        on_target_complete=lambda t: seen_targets.append(t["summary"]["status"]),
+    )
+
+    with use_adapter(ReverseDelayAdapter()):
+        results = runner.run()
+
+    assert sorted(f for _, f in seen_fixtures) == [f"f{i}" for i in range(5)]
+    assert {t for t, _ in seen_fixtures} == {"ollama:stream-model"}
+    assert seen_targets == ["RED"]
+    assert [f["fixture_id"] for f in results["targets"][0]["fixtures"]] == [
+        f"f{i}" for i in range(5)
+    ]
+
+
+def test_streamed_summary_matches_sequential_run(stream_artifacts, run_contract):
+    """Test incremental summaries equal those of a sequential run."""
+    concurrent = run_contract(stream_artifacts(), ReverseDelayAdapter())
+    sequential = run_contract(stream_artifacts(concurrency=1), ReverseDelayAdapter())
+
+    assert concurrent == sequential
+    summary = concurrent["targets"][0]["summary"]
+    assert summary["total_checks"] == 6
+    assert summary["passed_checks"] == 5
+
+
+def test_aiter_results_early_exit_cancels_work(stream_artifacts, use_adapter):
+    """Test breaking out of the async stream stops remaining work."""
+    adapter = ReverseDelayAdapter()
+    runner = ContractRunner(*stream_artifacts(concurrency=1))
+
+    async def consume_one():
+        events = runner.aiter_results()
+        first = await events.__anext__()
+        await events.aclose()
+        return first
+
+    with use_adapter(adapter):
+        first = asyncio.run(consume_one())
+
+    assert first.kind == "fixture"
+    assert adapter.calls < 5
+
+
+def test_target_summary_counts():
+    """Test TargetSummary folds fixtures and target-level checks."""
+    summary = TargetSummary()
+    summary.add(
+        {"checks": [{"passed": True}, {"passed": False}], "status": "FAIL", "latency_ms": 5}
+    )
+    summary.add({"checks": [{"passed": True}], "status": "PASS", "latency_ms": 7})
+
+    result = summary.finalize(False, [{"passed": True}])
+    assert result["total_checks"] == 4
+    assert result["passed_checks"] == 3
+    assert result["fixture_statuses"]["FAIL"] == 1
+    assert result["status"] == "RED"
+    assert summary.latencies == [5, 7]
+
+
+def test_result_collector_orders_by_index():
+    """Test the collector restores EP order from out-of-order events."""
+    collector = ResultCollector({"pcsl_version": "0.3.0"})
+    collector.add(RunEvent("fixture", {"fixture_id": "b"}, "t", 0, 1))
+    collector.add(RunEvent("fixture", {"fixture_id": "a"}, "t", 0, 0))
+    collector.add(RunEvent("target", {"target_id": "t", "fixtures": []}, "t", 0))
+    collector.add(RunEvent("run", {"cache": {"hits": 1}}))
+
+    results = collector.results()
+    assert [f["fixture_id"] for f in results["targets"][0]["fixtures"]] == ["a", "b"]
+    assert results["cache"] == {"hits": 1}
+    assert results["pcsl_version"] == "0.3.0"
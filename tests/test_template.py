@@ -0,0 +1,67 @@
+"""Tests for compiled prompt templates."""
+
+from unittest.mock import patch
+
+import pytest
+
+from promptcontracts.core.runner import ContractRunner
+from promptcontracts.core.template import PromptTemplate
+from promptcontracts.utils.hashing import compute_prompt_hash
+
+PD = {"pcsl": "0.3.0", "io": {"expects": "structured/json"}, "prompt": "Classify the ticket."}
+ES = {
+    "pcsl": "0.3.0",
+    "checks": [
+        {"type": "pc.check.json_valid"},
+        {"type": "pc.check.enum", "field": "$.label", "allowed": ["bug", "question"]},
+    ],
+}
+
+
+@pytest.mark.parametrize("layout", ["input_first", "static_first"])
+@pytest.mark.parametrize("mode", ["observe", "assist", "enforce"])
+def test_hash_matches_hash_of_rendered_prompt(layout, mode):
+    """Test the incremental hash equals hashing the whole rendered prompt."""
+    template = PromptTemplate.compile(PD, ES, mode, layout=layout)
+
+    for fixture_input in ["it crashes", "", "ünïcode ✓", {"nested": 1}]:
+        prompt = template.render(fixture_input)
+        assert template.hash(fixture_input) == compute_prompt_hash(prompt)
+        assert prompt.startswith(template.prefix) and prompt.endswith(template.suffix)
+
+
+def test_static_first_template_has_empty_suffix():
+    """Test static_first renders all static text before the input."""
+    template = PromptTemplate.compile(PD, ES, "assist", layout="static_first")
+    assert template.suffix == ""
+    assert "[CONSTRAINTS]" in template.prefix
+    assert PromptTemplate.compile(PD, ES, "observe").suffix == ""
+
+
+def test_unknown_layout_is_rejected():
+    """Test compile() validates the layout."""
+    with pytest.raises(ValueError, match="prompt_layout"):
+        PromptTemplate.compile(PD, ES, "observe", layout="sideways")
+
+
+def test_runner_compiles_one_template_per_mode_across_targets():
+    """Test targets negotiating the same mode share one compiled template."""
+    ep = {
+        "pcsl": "0.3.0",
+        "targets": [
+            {"type": "ollama", "model": "m1"},
+            {"type": "ollama", "model": "m2"},
+        ],
+        "fixtures": [{"id": f"f{i}", "input": f"ticket {i}"} for i in range(4)],
+        "execution": {"mode": "assist"},
+    }
+    runner = ContractRunner(PD, ES, ep)
+
+    with patch.object(PromptTemplate, "compile", wraps=PromptTemplate.compile) as compile_:
+        for fixture in ep["fixtures"]:
+            runner._build_prompt(fixture, "assist")
+            runner._build_prompt(fixture, "assist")
+        runner._build_prompt(ep["fixtures"][0], "observe")
+
+    assert compile_.call_count == 2
+    assert set(runner._templates) == {"assist", "observe"}
@@ -0,0 +1,150 @@
+"""Tests for the shared pooled HTTP transport."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from promptcontracts.core.runner import ContractRunner
+from promptcontracts.core.transport import (
+    HTTPTransport,
+    TransportConfig,
+    shared_transport,
+    transport_stats_delta,
+)
+
+
+class OllamaStub(BaseHTTPRequestHandler):
+    """Minimal keep-alive /api/generate endpoint recording client ports."""
+
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are closed instead of blocking a thread forever
+    timeout = 5
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.client_ports.add(self.client_address[1])
+        time.sleep(self.server.reply_delay)
+        body = json.dumps(
+            {"response": json.dumps({"echo": payload["prompt"][-1:]}), "eval_count": 3}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threading server whose server_close() waits for its handler threads."""
+
+    daemon_threads = False
+
+    def __init__(self, address, handler):
+        super().__init__(address, handler)
+        self.client_ports = set()
+        self.reply_delay = 0.0
+
+
+@pytest.fixture
+def ollama_url():
+    server = StubServer(("127.0.0.1", 0), OllamaStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def stub_artifacts(ollama_url, make_artifacts):
+    """Factory for artefacts whose one target is the stub; closes their client pools."""
+    base_url, _ = ollama_url
+    configs = []
+
+    def build(n_fixtures=8, transport=None):
+        # Bounded timeouts: a stuck request fails the test instead of hanging it
+        settings = {"timeout": 10, "connect_timeout": 5, **(transport or {})}
+        configs.append(TransportConfig.from_dict(settings))
+        return make_artifacts(
+            targets=[{"type": "ollama", "model": "stub", "base_url": base_url}],
+            fixtures=n_fixtures,
+            execution={"transport": settings},
+        )
+
+    yield build
+    # Keep-alive connections end client-side, so the stub's handlers exit on their own
+    for config in configs:
+        shared_transport(config).close()
+
+
+def test_transport_config_validation():
+    """Test pool settings are parsed and non-positive values rejected."""
+    config = TransportConfig.from_dict({"max_connections": 4, "timeout": 5, "http2": False})
+    assert config.limits().max_connections == 4
+    assert config.timeouts().connect == 10.0
+    assert config.use_http2 is False
+
+    with pytest.raises(ValueError):
+        TransportConfig.from_dict({"max_keepalive_connections": 0})
+
+
+def test_shared_transport_is_keyed_by_config():
+    """Test runners with equal settings share pools and clients per base URL."""
+    config = TransportConfig(keepalive_expiry=12.5)
+    transport = shared_transport(config)
+    assert shared_transport(TransportConfig(keepalive_expiry=12.5)) is transport
+    assert shared_transport(TransportConfig(keepalive_expiry=13.0)) is not transport
+    assert transport.client("http://example.test/") is transport.client("http://example.test")
+
+
+def test_sequential_run_reuses_one_connection(ollama_url, stub_artifacts):
+    """Test every generate call after the first rides the same keep-alive connection."""
+    base_url, server = ollama_url
+    results = ContractRunner(*stub_artifacts(transport={"max_connections": 4})).run()
+
+    stats = results["transport"][base_url]
+    assert stats["requests"] == 8
+    assert stats["connections_opened"] == 1
+    assert stats["reused"] == 7
+    assert stats["http_versions"] == {"HTTP/1.1": 8}
+    assert len(server.client_ports) == 1
+    assert results["targets"][0]["summary"]["status"] == "GREEN"
+
+
+def test_concurrent_run_is_bounded_by_pool(ollama_url, stub_artifacts):
+    """Test concurrent calls open at most max_connections connections."""
+    base_url, server = ollama_url
+    pd, es, ep = stub_artifacts(n_fixtures=20, transport={"max_connections": 2})
+    ep["execution"]["concurrency"] = {"global": 6}
+    # httpcore polls idle connections for a server close without locking them, so an
+    # instant reply can get a connection closed just after another thread reused it
+    server.reply_delay = 0.01
+
+    results = ContractRunner(pd, es, ep).run()
+
+    assert results["transport"][base_url]["requests"] == 20
+    assert len(server.client_ports) <= 2
+
+
+def test_client_shares_pool_and_stats(ollama_url):
+    """Test one client per base URL serves every request over one connection."""
+    base_url, _ = ollama_url
+    transport = HTTPTransport()
+
+    client = transport.client(base_url)
+    assert transport.client(f"{base_url}/") is client
+    for _ in range(3):
+        client.post("/api/generate", json={"prompt": "x"}).raise_for_status()
+
+    stats = transport.stats()[base_url]
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert transport_stats_delta(transport.stats(), transport.stats()) == {}
+    transport.close()
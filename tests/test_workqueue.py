@@ -0,0 +1,197 @@
+"""Tests for the durable work queue and worker processes."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from promptcontracts.core.adapters.base import AbstractAdapter
+from promptcontracts.core.runner import ContractRunner
+from promptcontracts.core.workqueue import WorkQueue, run_worker
+from promptcontracts.utils.errors import ExecutionError
+
+
+class LabelAdapter(AbstractAdapter):
+    """Thread-safe adapter answering from the fixture input."""
+
+    def __init__(self, fail_first: int = 0):
+        super().__init__("label-model", {})
+        self.fail_first = fail_first
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, schema=None):
+        with self._lock:
+            self.calls += 1
+            if self.calls <= self.fail_first:
+                raise ConnectionError("upstream reset")
+        number = int(prompt.rsplit(" ", 1)[-1])
+        time.sleep(0.002 * (number % 3))
+        return json.dumps({"label": "ok" if number % 2 else "no"}), 10 + number
+
+
+CHECKS = [
+    {"type": "pc.check.json_valid"},
+    {"type": "pc.check.enum", "field": "$.label", "allowed": ["ok"]},
+    {"type": "pc.check.latency_budget", "p95_ms": 100},
+]
+
+
+def _start_workers(queue_path, count):
+    processed = []
+
+    def work(worker_id):
+        processed.append(
+            run_worker(queue_path, worker_id=worker_id, poll_interval=0.01, idle_timeout=10)
+        )
+
+    threads = [threading.Thread(target=work, args=(f"w{i}",)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, processed
+
+
+def _prepare(queue, artifacts):
+    pd, es, ep = artifacts
+    queue.prepare({"pd": "p", "es": "e", "ep": "x"}, {"pd": pd, "es": es, "ep": ep})
+
+
+@pytest.fixture
+def run_queued(use_adapter):
+    """Run artifacts as a coordinator with worker threads using adapter."""
+
+    def run(queue_path, artifacts, adapter, workers=2, **runner_kwargs):
+        with use_adapter(adapter):
+            threads, _ = _start_workers(queue_path, workers)
+            try:
+                return ContractRunner(*artifacts, work_queue=queue_path, **runner_kwargs).run()
+            finally:
+                for thread in threads:
+                    thread.join(timeout=10)
+
+    return run
+
+
+def test_queued_run_matches_local_run(tmp_path, make_artifacts, use_adapter):
+    """Test workers produce the same results as an in-process run."""
+    artifacts = make_artifacts(checks=CHECKS, fixtures=8, n_samples=2)
+    queue_path = str(tmp_path / "queue.sqlite")
+
+    with use_adapter(LabelAdapter()):
+        local = ContractRunner(*artifacts).run()
+
+        threads, processed = _start_workers(queue_path, 3)
+        queued = ContractRunner(*artifacts, work_queue=queue_path).run()
+        for thread in threads:
+            thread.join(timeout=10)
+
+    stats = queued.pop("work_queue")
+    assert queued == local
+    assert stats["done"] == 16
+    assert sum(processed) == 16
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_failed_units_are_retried(tmp_path, make_artifacts, run_queued):
+    """Test a unit that errors is re-queued and completed on a later attempt."""
+    artifacts = make_artifacts(checks=CHECKS, fixtures=2, n_samples=2)
+    queue_path = str(tmp_path / "queue.sqlite")
+    results = run_queued(queue_path, artifacts, LabelAdapter(fail_first=2), workers=1)
+
+    assert results["work_queue"]["done"] == 4
+    assert results["work_queue"]["attempts"] == 6
+
+
+def test_unit_failing_every_attempt_fails_run(tmp_path, make_artifacts, run_queued):
+    """Test exhausted retries surface as an ExecutionError on the coordinator."""
+    queue_path = str(tmp_path / "queue.sqlite")
+
+    with pytest.raises(ExecutionError, match="upstream reset"):
+        run_queued(queue_path, make_artifacts(fixtures=1), LabelAdapter(fail_first=99), workers=1)
+
+
+def test_expired_lease_is_handed_to_another_worker(tmp_path, make_artifacts):
+    """Test units held by a dead worker are reclaimed after the lease expires."""
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"))
+    _prepare(queue, make_artifacts())
+    queue.enqueue("a", {"n": 1})
+    queue.enqueue("b", {"n": 2})
+
+    dead = queue.lease("dead-worker", lease_seconds=0.05)
+    assert dead.key == "a"
+    assert queue.lease("live-worker").key == "b"
+    assert queue.lease("live-worker") is None
+
+    time.sleep(0.1)
+    reclaimed = queue.lease("live-worker")
+    assert reclaimed.key == "a"
+    assert reclaimed.attempts == 2
+
+    queue.complete("a", {"value": 1})
+    queue.complete("a", {"value": "late duplicate"})
+    assert json.loads(queue.finished(["a", "b"])["a"][1]) == {"value": 1}
+    queue.close()
+
+
+def test_cancelled_units_are_not_leased(tmp_path, make_artifacts):
+    """Test withdrawn units (early stopping) are skipped by workers."""
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"))
+    _prepare(queue, make_artifacts())
+    queue.enqueue("a", {})
+    queue.cancel("a")
+
+    assert queue.lease("w") is None
+    assert queue.stats()["cancelled"] == 1
+    queue.close()
+
+
+def test_prepare_keeps_units_for_same_artifacts(tmp_path, make_artifacts):
+    """Test a restarted coordinator keeps completed units only for the same artefacts."""
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"))
+    _prepare(queue, make_artifacts())
+    queue.enqueue("a", {})
+    queue.complete("a", {"value": 1})
+
+    _prepare(queue, make_artifacts())
+    assert "a" in queue.finished(["a"])
+
+    queue.prepare({"pd": "changed"}, {})
+    assert queue.finished(["a"]) == {}
+    queue.close()
+
+
+def test_workers_use_response_cache_and_coordinator_rate_limits(
+    tmp_path, make_artifacts, run_queued
+):
+    """Test workers serve the EP cache and the coordinator admits units per target."""
+    pd, es, ep = make_artifacts(checks=CHECKS, fixtures=3, n_samples=2)
+    ep["execution"]["cache"] = {"enabled": True, "dir": str(tmp_path / "cache")}
+    ep["targets"][0]["rate_limit"] = {"max_in_flight": 1}
+    adapter = LabelAdapter()
+
+    first = run_queued(str(tmp_path / "q1.sqlite"), (pd, es, ep), adapter)
+    second = run_queued(str(tmp_path / "q2.sqlite"), (pd, es, ep), adapter)
+
+    assert adapter.calls == 6
+    samples = second["targets"][0]["fixtures"][0]["sampling_metadata"]["samples"]
+    assert all(sample["cache_hit"] for sample in samples)
+    assert first["targets"][0]["execution"]["rate_limit"]["admitted"] == 6
+
+
+def test_judge_checks_are_rerun_on_coordinator(tmp_path, make_artifacts, run_contract, run_queued):
+    """Test checks needing the coordinator's judge adapter match a local run."""
+    checks = [*CHECKS, {"type": "pc.check.judge", "criteria": "is a label"}]
+    artifacts = make_artifacts(checks=checks, fixtures=2)
+    judge = MagicMock()
+    judge.judge.return_value = {"verdict": True, "explanation": "ok"}
+
+    local = run_contract(artifacts, LabelAdapter(), judge_adapter=judge)
+    queued = run_queued(
+        str(tmp_path / "queue.sqlite"), artifacts, LabelAdapter(), judge_adapter=judge
+    )
+    queued.pop("work_queue")
+
+    assert queued == local
+    assert judge.judge.call_count == 4